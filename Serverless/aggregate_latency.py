@@ -0,0 +1,84 @@
+import argparse
+import json
+import sys
+
+from services.latency_metrics import LatencyMetrics
+from services.models.latency_histogram import LatencyHistogram
+
+
+class LatencyAggregator:
+    """
+    Offline phase latency aggregator. Reads cloud function logs (files or stdin), picks the Embedded Metric Format
+    lines written by LatencyMetrics, merges their histograms per (handler, phase) and prints overall percentiles.
+    Lines exported from CloudWatch with a leading timestamp/request Id are accepted as well.
+    """
+
+    def __init__(self):
+        self.histograms = {}                        # :dict: (handler, phase) to merged histogram.
+        self.lines_merged = 0                       # :int: Amount of histogram lines merged.
+        self.lines_skipped = 0                      # :int: Amount of malformed histogram lines.
+
+    def feed(self, line: str):
+        """
+        Merges a log line's histogram, if it carries one.
+        :param line: string. Log line.
+        :return: void.
+        """
+
+        start = line.find('{')
+        if start < 0 or '"histogram"' not in line: return
+
+        try:
+            document = json.loads(line[start:])
+            key = (document['Handler'], document['Phase'])
+            histogram = LatencyHistogram.from_dict(document['histogram'])
+        except (ValueError, KeyError, TypeError):
+            self.lines_skipped += 1
+            return
+
+        self.histograms.setdefault(key, LatencyHistogram()).merge(histogram)
+        self.lines_merged += 1
+
+    def summary(self) -> list:
+        """
+        Summarizes merged histograms.
+        :return: list. One dictionary per (handler, phase), latencies in milliseconds.
+        """
+
+        rows = []
+        for (handler, phase), histogram in sorted(self.histograms.items()):
+            row = {'handler': handler, 'phase': phase, 'count': histogram.count}
+            for p in LatencyMetrics.PERCENTILES:
+                row[f'p{p}'] = round(histogram.percentile(p) / 1000, 3)
+            row['max'] = round(histogram.max / 1000, 3)
+            rows.append(row)
+        return rows
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Merges phase latency histograms from cloud function logs.')
+    parser.add_argument('files', nargs='*', help='Log files to be read. Reads stdin if none is given.')
+    parser.add_argument('--json', action='store_true', help='Print summary as JSON lines.')
+    args = parser.parse_args(args)
+
+    aggregator = LatencyAggregator()
+    for stream in [open(x) for x in args.files] or [sys.stdin]:
+        with stream:
+            for line in stream:
+                aggregator.feed(line)
+
+    rows = aggregator.summary()
+    if args.json:
+        for row in rows:
+            print(json.dumps(row))
+    else:
+        names = ['handler', 'phase', 'count'] + [f'p{x}' for x in LatencyMetrics.PERCENTILES] + ['max']
+        print(''.join(f'{x:<32}' if i < 2 else f'{x:>12}' for i, x in enumerate(names)))
+        for row in rows:
+            print(''.join(f'{row[x]:<32}' if i < 2 else f'{row[x]:>12}' for i, x in enumerate(names)))
+    print(f'{aggregator.lines_merged} histogram line(s) merged, {aggregator.lines_skipped} skipped.',
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import argparse
+import glob
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from load_test import LOCAL_ENVIRONMENT
+
+MODES = {'full': 'false', 'draft': 'true'}  # :dict: Benchmarked mode to THUMBNAIL_FAST_DECODE value.
+EXTENSIONS = ['jpg', 'jpeg', 'JPG', 'JPEG']  # :list: Corpus file extensions.
+
+
+class ThumbnailBenchmark:
+    """
+    Benchmarks derivative generation (thumbnail function's image processing phase) on a corpus of camera images, with
+    full resolution decoding against reduced resolution (draft) decoding. Each mode runs on its own process, so that
+    peak resident memory is measured per mode.
+    """
+
+    def __init__(self, paths: list, repeats: int):
+        """
+        Constructor of the benchmark.
+        :param paths: list. Corpus image paths.
+        :param repeats: integer. Amount of times each image is processed.
+        """
+
+        # Imported here, once the environment has been prepared.
+        from handlers.s3_generate_thumbnail.image_processing import ImageProcessing
+        self.image_processing = ImageProcessing
+
+        self.paths = paths                          # :list: Corpus image paths.
+        self.repeats = repeats                      # :int: Runs per image.
+        self.timings_ms = []                        # :list: Wall time of each run, in milliseconds.
+        self.failures = 0                           # :int: Failed runs.
+
+    def run(self) -> dict:
+        """
+        Processes every corpus image, images being read beforehand so that only decoding and resampling are timed.
+        :return: dictionary. Mode results.
+        """
+
+        from services.api_metrics import ApiMetrics
+
+        for i, path in enumerate(self.paths):
+            with open(path, 'rb') as f:
+                data = f.read()
+            for j in range(self.repeats):
+                start = time.perf_counter()
+                phase = self.image_processing(io.BytesIO(data), f'benchmark-{i}-{j}')
+                self.timings_ms.append((time.perf_counter() - start) * 1000)
+                if not phase.status: self.failures += 1
+
+        return {
+            'images': len(self.paths),
+            'runs': len(self.timings_ms),
+            'failures': self.failures,
+            'total_ms': round(sum(self.timings_ms), 3),
+            'mean_ms': round(statistics.mean(self.timings_ms), 3),
+            'p50_ms': round(statistics.median(self.timings_ms), 3),
+            'max_ms': round(max(self.timings_ms), 3),
+            'peak_rss_kb': ApiMetrics.get_peak_rss_kb()
+        }
+
+
+def run_mode(mode: str, args) -> dict:
+    """
+    Runs the benchmark of a single mode on a child process.
+    :param mode: string. Benchmarked mode.
+    :param args: Namespace. Parsed command line arguments.
+    :return: dictionary. Mode results.
+    """
+
+    command = [sys.executable, os.path.abspath(__file__), args.corpus, '-r', str(args.repeats), '--mode', mode]
+    env = dict(os.environ, THUMBNAIL_FAST_DECODE=MODES[mode])
+    output = subprocess.run(command, env=env, check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Compares full and draft JPEG decoding for derivative generation.')
+    parser.add_argument('corpus', help='Directory of camera JPEG images.')
+    parser.add_argument('-r', '--repeats', type=int, default=3, help='Times each image is processed.')
+    parser.add_argument('--mode', choices=list(MODES), default=None, help='Run a single mode on this process.')
+    args = parser.parse_args(args)
+
+    # Child process: benchmarks a single mode, printing its results.
+    if args.mode is not None:
+        for key, value in LOCAL_ENVIRONMENT.items():
+            os.environ.setdefault(key, value)
+        os.environ['LOG_LEVEL'] = 'ERROR'
+        paths = sorted({x for ext in EXTENSIONS for x in glob.glob(os.path.join(args.corpus, f'*.{ext}'))})
+        if not paths:
+            print(f'No JPEG images found in {args.corpus}.', file=sys.stderr)
+            return 1
+
+        from services.log_sink import LogSink
+        LogSink.stream = io.StringIO()
+        print(json.dumps(dict(ThumbnailBenchmark(paths, args.repeats).run(), mode=args.mode)))
+        return 0
+
+    # Parent process: benchmarks each mode on its own process and compares them.
+    results = {mode: run_mode(mode, args) for mode in MODES}
+    for result in results.values():
+        print(json.dumps(result))
+
+    full, draft = results['full'], results['draft']
+    print(f"{full['images']} image(s) x {args.repeats}: draft decoding is "
+          f"{full['mean_ms'] / draft['mean_ms']:.2f}x faster (mean {full['mean_ms']:.1f} -> {draft['mean_ms']:.1f} ms)"
+          + (f", peak RSS {full['peak_rss_kb'] / 1024:.1f} -> {draft['peak_rss_kb'] / 1024:.1f} MB."
+             if full['peak_rss_kb'] and draft['peak_rss_kb'] else '.'))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
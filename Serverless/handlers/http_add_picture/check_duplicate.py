@@ -0,0 +1,70 @@
+import hashlib
+
+from interfaces.cloud_function_phase import CloudFunctionPhase
+from services.service_backends import ServiceBackends
+
+
+class CheckDuplicate(CloudFunctionPhase):
+    """
+    Duplicate detection object class, responsible for hashing the pre-processed image and looking the hash up on the
+    user's content hash index. If the user has already uploaded the same picture, the stored picture it duplicates is
+    exposed so that no new storage, thumbnail or recognition work is done. The index being unavailable doesn't fail
+    the upload, the picture is then handled as new.
+    """
+
+    DIGEST_SIZE = 16                                        # :int: BLAKE2b digest size in bytes (128 bits).
+
+    def __init__(self, user_id: str, img_bytes: bytes, invocation_id: str):
+        """
+        Constructor of the duplicate detection object, stores provided data and instantiates index repository.
+        :param user_id: string. Uploading user id.
+        :param img_bytes: pre-processed (post rotation) image in bytes form.
+        :param invocation_id: string containing id of current cloud function invocation to be to be used by API metrics.
+        """
+
+        self.user_id = user_id                              # :str: Uploading user id.
+        self.img_bytes = img_bytes                          # :bytes: Pre-processed image bytes.
+        self.content_hash = None                            # :str: Hex encoded image content hash.
+        self.duplicate = None                               # :dict: Index entry of the duplicated picture, if any.
+        self.repository = ServiceBackends.dynamodb(self.env.PICTURE_HASHES_TABLE_NAME)  # :AWSDynamoDB: Hash index.
+
+        # Initializes APIPhase superclass parameters and procedures
+        super(CheckDuplicate, self).__init__(prefix='DD', phase_name='Duplicate check', invocation_id=invocation_id)
+
+    def run(self) -> bool:
+        """
+        Object's main procedure: hashes image and looks it up on the user's index.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        # Hash image content.
+        with self.trace('Hash', bytes_in=len(self.img_bytes)):
+            self.content_hash = hashlib.blake2b(self.img_bytes, digest_size=self.DIGEST_SIZE).hexdigest()
+
+        # Look hash up, handling picture as new if impossible.
+        self.__find_duplicate()
+
+        # Procedure successful
+        self.set_metrics_attribute('duplicate', self.duplicate is not None)
+        return True
+
+    def __find_duplicate(self):
+        """
+        Looks up a picture with the same content hash on the user's index.
+        :return: void.
+        """
+
+        try:
+            self.repository.evaluate_conditions_and_requirements()
+            response = self.repository.load(self.user_id, range_key_equals=self.content_hash)
+        except Exception as e:
+            self.log(self.rsc.DEDUP_INDEX_UNAVAILABLE, e, level=self.WARNING)
+            return
+
+        items = response.get('Items') or []
+        if not items:
+            self.log(self.rsc.DEDUP_NEW_CONTENT, self.content_hash)
+            return
+
+        self.duplicate = items[0]
+        self.log(self.rsc.DEDUP_DUPLICATE_FOUND, self.content_hash, self.duplicate.get('picture_id'))
@@ -1,50 +1,165 @@
-from PIL.ExifTags import TAGS, GPSTAGS
-from PIL import Image
+import hashlib
+import json
+import math
+
+from handlers.http_add_picture.models.parsed_exif import ParsedExif
+from resources.environment_variables import EnvironmentVariables as env
+from services.lazy_import import LazyModule
+
+Image = LazyModule('PIL.Image')
+ExifTags = LazyModule('PIL.ExifTags')
 
 
 class ExifUtilities:
     """
-    Encapsulates EXIF extraction methods to be used on a Pillow Image object.
+    Encapsulates EXIF extraction methods to be used on a Pillow Image object. Tags are projected to a compact schema
+    (whitelisted, typed, size budgeted) before travelling on queued messages and table items, both size capped.
     """
 
+    ORIENTATION = 0x0112            # :int: Orientation tag.
+    DATE_TIME = 0x0132              # :int: File change date and time tag.
+    DATE_TIME_ORIGINAL = 0x9003     # :int: Capture date and time tag.
+    GPS_INFO = 0x8825               # :int: GPS IFD tag.
+
+    DEFAULT_TAGS = [                # :list: Projected tags by default, by priority.
+        'DateTimeOriginal', 'Make', 'Model', 'LensModel', 'Orientation', 'GPSInfo', 'ExposureTime', 'FNumber',
+        'ISOSpeedRatings', 'FocalLength', 'FocalLengthIn35mmFilm', 'Flash', 'ExposureProgram', 'ExposureBiasValue',
+        'MeteringMode', 'WhiteBalance', 'ExifImageWidth', 'ExifImageHeight', 'Software', 'DateTime'
+    ]
+    DATETIME_TAGS = {'DateTime', 'DateTimeOriginal', 'DateTimeDigitized'}  # :set: Tags parsed as ISO 8601.
+    RATIONAL_TAGS = {               # :set: Tags holding a single rational, typed as float.
+        'ExposureTime', 'FNumber', 'FocalLength', 'ApertureValue', 'MaxApertureValue', 'ShutterSpeedValue',
+        'BrightnessValue', 'ExposureBiasValue', 'XResolution', 'YResolution', 'DigitalZoomRatio'
+    }
+
+    TAGS = [x.strip() for x in (env.EXIF_TAGS or '').split(',') if x.strip()] or DEFAULT_TAGS  # :list: Whitelist.
+    MAX_BYTES = int(env.EXIF_MAX_BYTES or 2048)                       # :int: JSON size budget of projected tags.
+    HASH_BINARY = (env.EXIF_BINARY or 'drop').lower() == 'hash'       # :bool: Hash binary values instead of dropping.
+
     @staticmethod
-    def get_exif_data(image: Image) -> dict:
+    def parse_exif(image: Image) -> ParsedExif:
         """
-        Extracts and decodes EXIF data from a Pillow Image object and exposes in dictionary form.
-        :param image: Pillow Image. Image to be manipulated.
-        :return: dictionary. Decoded EXIF data.
+        Extracts and decodes EXIF data from a Pillow Image object, once: typed orientation, GPS coordinates and capture
+        time, along with the projection of the tags.
+        :param image: Pillow Image. Image to be manipulated, as opened from the original bytes.
+        :return: ParsedExif. Empty if image has no EXIF data.
         """
 
-        # Instantiate return dictionary
-        exif_data = {}
-
         # Attempts to extract original EXIF dictionary from Pillow Image
         info = getattr(image, '_getexif', lambda: None)()
+        if not info: return ParsedExif()
+
+        # Typed fields are read from the raw values.
+        orientation = info.get(ExifUtilities.ORIENTATION)
+        try:
+            lat, lng = ExifUtilities.__get_lat_lon(
+                {ExifTags.GPSTAGS.get(t, t): v for t, v in (info.get(ExifUtilities.GPS_INFO) or {}).items()})
+        except (TypeError, ValueError, IndexError, ZeroDivisionError, AttributeError):
+            lat, lng = None, None
+        captured_at = ExifUtilities.__to_iso_datetime(
+            info.get(ExifUtilities.DATE_TIME_ORIGINAL) or info.get(ExifUtilities.DATE_TIME))
+
+        # Translate encoded keys to readable keys using TAGS. GPS information is replaced by its decoded coordinates.
+        named = {str(ExifTags.TAGS.get(tag, tag)): value for tag, value in info.items()}
+        named['GPSInfo'] = {'lat': lat, 'lng': lng} if lat is not None else None
+        exif_data, omitted = ExifUtilities.project(named)
+
+        return ParsedExif(
+            orientation=orientation if isinstance(orientation, int) else None,
+            lat=lat,
+            lng=lng,
+            captured_at=captured_at,
+            tags=exif_data,
+            omitted=omitted
+        )
+
+    @classmethod
+    def project(cls, named: dict) -> (dict, int):
+        """
+        Projects decoded EXIF tags to the compact schema: whitelisted tags only, in whitelist priority order, typed,
+        binary values dropped (or hashed), as long as the JSON encoded result fits the byte budget.
+        :param named: dictionary. Tag name to raw value.
+        :return: tuple. Projected tags and amount of tags left out.
+        """
+
+        projected, used = {}, 2
+        for name in cls.TAGS:
+            if name not in named: continue
+            value = cls.__to_typed(named[name], name)
+            if value is None: continue
+
+            # Each entry costs its JSON encoding (as emitted, default separators) plus the ', ' separating it from the
+            # previous one. Enclosing braces are accounted for upfront.
+            size = len(json.dumps({name: value})) - 2 + (2 if projected else 0)
+            if used + size > cls.MAX_BYTES: continue
+            projected[name] = value
+            used += size
+
+        return projected, len([x for x in named if named[x] is not None]) - len(projected)
+
+    @classmethod
+    def __to_typed(cls, value, name: str):
+        """
+        Converts a raw EXIF value to its JSON typed form.
+        :param value: Raw value (integer, string, bytes, rational or tuple of those).
+        :param name: string. Tag name.
+        :return: Typed value, None if value is to be left out.
+        """
+
+        if isinstance(value, (bytes, bytearray)):
+            if not cls.HASH_BINARY: return None
+            return 'blake2b:' + hashlib.blake2b(value, digest_size=8).hexdigest()
+
+        if isinstance(value, str):
+            value = value.strip('\x00 ')
+            if name in cls.DATETIME_TAGS:
+                return cls.__to_iso_datetime(value) or value
+            return value or None
+
+        if isinstance(value, bool) or isinstance(value, int):
+            return value
 
-        # If EXIF exists...
-        if info:
+        if isinstance(value, dict):
+            return {k: v for k, v in value.items() if v is not None} or None
 
-            # Iterate on encoded keys and translate to readable keys using TAGS.
-            for tag, value in info.items():
-                decoded = TAGS.get(tag, tag)
+        # Pre 7.0 Pillow represents rationals as (numerator, denominator) pairs.
+        if isinstance(value, tuple) and name in cls.RATIONAL_TAGS and len(value) == 2:
+            value = cls.__rational_to_float(value)
+        if isinstance(value, (tuple, list)):
+            items = [cls.__to_typed(x, '') for x in value]
+            return items if items and None not in items else None
 
-                # If GPS information is found, decode it properly.
-                if decoded == "GPSInfo":
-                    gps_data = {}
-                    for t in value:
-                        sub_decoded = GPSTAGS.get(t, t)
-                        gps_data[sub_decoded] = value[t]
-                    lat, lng = ExifUtilities.__get_lat_lon(gps_data)
-                    exif_data[str(decoded)] = {
-                        'lat': lat,
-                        'lng': lng
-                    }
+        return cls.__rational_to_float(value)
 
-                else:
-                    exif_data[str(decoded)] = value
+    @classmethod
+    def __rational_to_float(cls, value):
+        """
+        Converts a rational to a finite, 6 digits rounded float.
+        :param value: Rational (IFDRational, float or (numerator, denominator) pair).
+        :return: float, None if undefined.
+        """
+
+        try:
+            number = cls.__to_float(value)
+        except (TypeError, ValueError, ZeroDivisionError, IndexError):
+            return None
+        return round(number, 6) if math.isfinite(number) else None
+
+    @staticmethod
+    def __to_iso_datetime(value) -> str:
+        """
+        Converts an EXIF date and time ('YYYY:MM:DD HH:MM:SS') to ISO 8601.
+        :param value: string. EXIF date and time.
+        :return: string, None if value is absent or malformed.
+        """
 
-        ExifUtilities.__convert_structure_content_to_strings(exif_data)
-        return exif_data
+        try:
+            date, time = str(value).strip('\x00 ').split(' ')
+            year, month, day = (int(x) for x in date.split(':'))
+            hour, minute, second = (int(x) for x in time.split(':'))
+            return f'{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}'
+        except (TypeError, ValueError):
+            return None
 
     @staticmethod
     def __get_lat_lon(gps_info: dict) -> tuple:
@@ -77,44 +192,17 @@ class ExifUtilities:
         :return: float. Decoded coordinate in degrees.
         """
 
-        d0 = value[0][0]
-        d1 = value[0][1]
-        d = float(d0) / float(d1)
-
-        m0 = value[1][0]
-        m1 = value[1][1]
-        m = float(m0) / float(m1)
-
-        s0 = value[2][0]
-        s1 = value[2][1]
-        s = float(s0) / float(s1)
-
+        d, m, s = (ExifUtilities.__to_float(x) for x in value[:3])
         return d + (m / 60.0) + (s / 3600.0)
 
     @staticmethod
-    def __convert_structure_content_to_strings(data):
+    def __to_float(value) -> float:
         """
-        Recursively convert EXIF dictionary's tuples to lists and non-integers to strings.
-        :param data: multiple. Data to be processed.
-        :return: multiple.
+        Converts an EXIF rational, either a (numerator, denominator) pair or a Pillow IFDRational, to float.
+        :param value: EXIF rational.
+        :return: float.
         """
 
-        if isinstance(data, dict):
-            for k, v in data.items():
-                data[k] = ExifUtilities.__convert_structure_content_to_strings(v)
-
-        elif isinstance(data, list):
-            for x in range(len(data)):
-                data[x] = ExifUtilities.__convert_structure_content_to_strings(data[x])
-
-        elif isinstance(data, tuple):
-            data = list(data)
-            data = ExifUtilities.__convert_structure_content_to_strings(data)
-
-        elif isinstance(data, int):
-            return data
-
-        else:
-            return str(data)
-
-        return data
+        if isinstance(value, tuple):
+            return float(value[0]) / float(value[1])
+        return float(value)
@@ -1,34 +1,52 @@
 import io
 
-from PIL import Image
-
 from handlers.http_add_picture.models.img_meta_data import ImgMetaData
+from handlers.http_add_picture.models.parsed_exif import ParsedExif
 from interfaces.cloud_function_phase import CloudFunctionPhase
 from handlers.http_add_picture.exif_utilities import ExifUtilities as eu
+from services.buffer_reader import BufferReader
+from services.lazy_import import LazyModule
+
+Image = LazyModule('PIL.Image')
 
 
 class ImagePreProcessing(CloudFunctionPhase):
     """
     Image pre-processing object, responsible for converting image to required Pillow Image format, performing
-    any processing required, extracting and exposing resulting meta data.
+    any processing required, extracting and exposing resulting meta data. Dimensions are read from the image header
+    alone: images beyond the ingest hard limit are rejected before any decoding, images above the display budget are
+    kept untouched and complemented with a bounded display original, decoded at reduced scale.
     """
 
+    LOSSLESS_ORIENTATION_FORMATS = {'JPEG', 'MPO'}  # :set: Formats keeping their EXIF orientation instead of rotating.
+
+    MAX_PIXELS = int(CloudFunctionPhase.env.INGEST_MAX_PIXELS or 100000000)        # :int: Hard limit, rejected above.
+    DISPLAY_MAX_PIXELS = int(CloudFunctionPhase.env.DISPLAY_MAX_PIXELS or 24000000)  # :int: Display budget, pixels.
+    DISPLAY_MAX_BYTES = int(float(CloudFunctionPhase.env.DISPLAY_MAX_MB or 10) * 1024 * 1024)  # :int: Budget, bytes.
+    DISPLAY_MAX_EDGE = int(CloudFunctionPhase.env.DISPLAY_MAX_EDGE or 4096)        # :int: Display original bound.
+
     def __init__(self, img_bytes: bytes, invocation_id: str):
         """
         Constructor of the Image pre-processing object, stores provided and locally generated data, runs main object
         procedure.
-        :param img_bytes: validation provided image in bytes form.
+        :param img_bytes: validation provided image buffer (bytes-like).
         :param invocation_id: string containing id of current cloud function invocation to be to be used by API metrics.
         """
 
-        self.img_bytes = img_bytes           # :bytes: Image in bytes form, product of base64.b64decode().
+        self.img_bytes = img_bytes           # :memoryview: Image buffer, replaced only if re-encoded.
         self.img_pillow = None               # :Image: Pillow Image object (rotation, exif).
+        self.exif = ParsedExif()             # :ParsedExif: EXIF data, parsed once from the original image.
+        self.oversized = False               # :bool: Whether image exceeds the display pixel or byte budget.
+        self.display_bytes = None            # :bytes: Bounded display original, only built for oversized images.
+        self.orientation_kept = False        # :bool: Whether stored bytes keep an EXIF orientation to be applied.
         self.img_meta_data = ImgMetaData(
             type='N.A.',                     # :str: Image type (JPG, PNG).
             size='N.A.',                     # :str: Image size in KB.
             height=0,                        # :int: Image height in pixels.
             width=0,                         # :int: Image width in pixels.
-            exif={}                          # :dict: Dictionary containing exif information if available.
+            exif={},                         # :dict: Dictionary containing exif information if available.
+            parsed_exif={},                  # :dict: Typed EXIF fields (orientation, GPS, capture time).
+            display=None                     # :dict: Display original dimensions, if one was built.
         )
 
         # Initializes APIPhase superclass parameters and procedures
@@ -44,12 +62,25 @@ class ImagePreProcessing(CloudFunctionPhase):
         # Creates Pillow Image Object, abort if impossible.
         if not self.__convert_image_bytes_to_pillow(): return False
 
+        # Applies ingest policy on header provided dimensions, abort if image is beyond the hard limit.
+        if not self.__check_ingest_limits(): return False
+
+        # Parses EXIF data of the original image, once.
+        with self.trace('EXIF parse'):
+            self.exif = eu.parse_exif(self.img_pillow)
+
         # Corrects image orientation based on EXIF data if possible and needed.
         self.__rotate_image_if_needed()
 
         # Updates image metadata instance variables.
         self.__update_meta_data()
 
+        # Builds the display original of oversized images, abort if impossible.
+        if self.oversized and not self.__build_display_original(): return False
+
+        # Releases decoded pixels, if any, no further phase needs them.
+        self.img_pillow.close()
+
         # Procedure successful
         return True
 
@@ -59,57 +90,100 @@ class ImagePreProcessing(CloudFunctionPhase):
         :return: boolean. Value expresses whether procedure has executed successfully or not.
         """
 
-        # Attempts to create a Pillow Image object from given image bytes.
+        # Attempts to create a Pillow Image object from given image bytes. Opening only parses the header, pixels are
+        # decoded on first access. Pillow's own decompression bomb guard (set on the proxied module) is aligned with
+        # the ingest hard limit, the explicit pixel count check remaining the authoritative one.
         try:
-            self.img_pillow = Image.open(io.BytesIO(self.img_bytes))
+            Image.MAX_IMAGE_PIXELS = self.MAX_PIXELS
+            self.img_pillow = Image.open(BufferReader(self.img_bytes))
+
+        # Pillow refuses images far beyond the limit on open, build failed return object and abort execution.
+        except Image.DecompressionBombError as e:
+            error_response = self.err.IMAGE_EXCEEDS_INGEST_LIMIT
+            self.log(error_response.aws_log, e, level=self.ERROR)
+            self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
+            return False
 
         # Unable to decode image bytes, build failed return object and abort execution.
         except Exception as e:
             error_response = self.err.UNDECODABLE_IMAGE_BYTES
-            self.log(error_response.aws_log.format(str(e)))
+            self.log(error_response.aws_log, e, level=self.ERROR)
             self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
             return False
 
-        # Successfully built Pillow Image object, log and return.
+        # Successfully built Pillow Image object, log and return. Format is taken now, rotated images carry none.
+        self.img_meta_data.type = str(self.img_pillow.format)
         self.log(self.rsc.PRE_PROC_CREATED_PILLOW_OBJECT)
         return True
 
+    def __check_ingest_limits(self) -> bool:
+        """
+        Compares header provided dimensions and image size against the ingest hard limit and the display budget.
+        :return: boolean. Value expresses whether image is accepted or not.
+        """
+
+        width, height = self.img_pillow.size
+        self.set_metrics_attribute('pixels', width * height)
+
+        # Image is beyond the hard limit, build failed return object and abort execution.
+        if width * height > self.MAX_PIXELS:
+            error_response = self.err.IMAGE_EXCEEDS_INGEST_LIMIT
+            self.log(error_response.aws_log, f'{width}x{height} > {self.MAX_PIXELS} pixels', level=self.ERROR)
+            self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
+            return False
+
+        # Image is accepted, flag it if it exceeds the display budget.
+        self.oversized = width * height > self.DISPLAY_MAX_PIXELS or len(self.img_bytes) > self.DISPLAY_MAX_BYTES
+        if self.oversized:
+            self.log(self.rsc.PRE_PROC_OVERSIZED_IMAGE, width, height, len(self.img_bytes))
+        return True
+
     def __rotate_image_if_needed(self):
         """
         Checks and compensates for EXIF orientation mismatch if available and needed.
-        :param orientation: int. Expresses the EXIF Orientation type.
         :return: void.
         """
 
-        # Attempts to extract EXIF data fro Pillow Image object
-        orientation = eu.get_exif_data(self.img_pillow).get('Orientation')
+        # Checks parsed EXIF orientation.
+        orientation = self.exif.orientation
         if not orientation:
             self.log(self.rsc.PRE_PROC_NO_EXIF_ORIENTATION)
             return
 
-        # Checks orientation and calculates rotation accordingly.
-        if   orientation == 3 or orientation == 4: rotation = 180
-        elif orientation == 5 or orientation == 6: rotation = 270
-        elif orientation == 7 or orientation == 8: rotation = 90
-        else:
-            self.log(self.rsc.PRE_PROC_NO_ROTATION_NEEDED.format(orientation))
+        # Calculates transposition accordingly, mirrored orientations included.
+        transposition = self.exif.transposition
+        if not transposition:
+            self.log(self.rsc.PRE_PROC_NO_ROTATION_NEEDED, orientation)
             return
 
-        # If EXIF orientation is detected, rotate accordingly.
-        self.log(self.rsc.PRE_PROC_ORIENTATION_MISMATCH_DETECTED.format(orientation, rotation))
-        new_image = self.img_pillow.rotate(rotation, expand=1)
-
-        # Consolidates rotation into memory, abort if unsuccessful.
-        try:
-            self.bytes_io = io.BytesIO()
-            new_image.save(self.bytes_io, format=self.img_pillow.format)
-        except Exception as e:
-            self.log(self.rsc.PRE_PROC_UNABLE_TO_UPDATE_BYTES.format(str(e)))
+        # JPEG pictures are kept as uploaded, orientation tag included, so that clients display them oriented: pixels
+        # are neither decoded nor re-encoded (no quality loss). The tag is the only record of the pending orientation
+        # (exposed on parsed EXIF data for information), so that EXIF aware clients never apply it twice.
+        # Oversized pictures are kept untouched alike, their display original being oriented at reduced scale.
+        if self.img_pillow.format in self.LOSSLESS_ORIENTATION_FORMATS or self.oversized:
+            with self.trace('Orientation lossless', reported=True, transposition=transposition):
+                self.orientation_kept = True
+            self.log(self.rsc.PRE_PROC_ROTATION_RECORDED, orientation, transposition)
             return
 
+        # If EXIF orientation is detected, transpose accordingly. Re-encoded images carry no EXIF data.
+        self.log(self.rsc.PRE_PROC_ORIENTATION_MISMATCH_DETECTED, orientation, transposition)
+        with self.trace('Orientation re-encode', reported=True, transposition=transposition,
+                        bytes_in=len(self.img_bytes)) as span:
+            new_image = self.img_pillow.transpose(getattr(getattr(Image, 'Transpose', Image), transposition))
+
+            # Consolidates rotation into memory, abort if unsuccessful.
+            try:
+                self.bytes_io = io.BytesIO()
+                new_image.save(self.bytes_io, format=self.img_pillow.format)
+            except Exception as e:
+                self.log(self.rsc.PRE_PROC_UNABLE_TO_UPDATE_BYTES, e, level=self.ERROR)
+                return
+            span.set_attribute('bytes_out', self.bytes_io.tell())
+
         # Updates instance variables with new values.
         self.img_pillow = new_image
-        self.img_bytes = self.bytes_io.getvalue()
+        self.img_bytes = self.bytes_io.getbuffer()
 
         # Log successful image rotation.
         self.log(self.rsc.PRE_PROC_SUCCESSFULLY_ROTATED)
@@ -120,14 +194,56 @@ class ImagePreProcessing(CloudFunctionPhase):
         :return: void.
         """
 
-        # Extracts metadata from final image.
-        self.img_meta_data.type = str(self.img_pillow.format)
+        # Extracts metadata from final image. Dimensions are the displayed ones, as if pending orientation were applied.
         self.img_meta_data.width, self.img_meta_data.height = self.img_pillow.size
+        if self.orientation_kept and self.exif.swaps_dimensions:
+            self.img_meta_data.width, self.img_meta_data.height = self.img_meta_data.height, self.img_meta_data.width
 
-        # Updates EXIF data if available.
-        self.img_meta_data.exif = eu.get_exif_data(self.img_pillow)
+        # Exposes EXIF data parsed from the original image, as the rotated one carries none.
+        self.img_meta_data.exif = self.exif.tags
+        self.img_meta_data.parsed_exif = self.exif.to_dict()
+        if self.exif.omitted:
+            self.log(self.rsc.PRE_PROC_EXIF_TAGS_OMITTED, self.exif.omitted, len(self.exif.tags), level=self.DEBUG)
 
         # Logs acquired meta data
-        self.log(self.rsc.RECOGNITION_ACQUIRED_META_DATA.format(str(self.img_meta_data.__dict__)))
+        self.log(self.rsc.RECOGNITION_ACQUIRED_META_DATA, self.img_meta_data.__dict__, level=self.DEBUG)
+
+    def __build_display_original(self) -> bool:
+        """
+        Decodes the image at reduced scale (JPEG draft mode decodes straight at 1/2, 1/4 or 1/8 of its size) into a
+        display original bounded to DISPLAY_MAX_EDGE pixels per side, oriented as displayed.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        bound = (self.DISPLAY_MAX_EDGE, self.DISPLAY_MAX_EDGE)
+        with self.trace('Display original', bytes_in=len(self.img_bytes)) as span:
+            try:
+                img_format = self.img_pillow.format
+                if img_format in self.LOSSLESS_ORIENTATION_FORMATS:
+                    self.img_pillow.draft('RGB', bound)
+                self.img_pillow.thumbnail(bound)
+
+                # Pending orientation is applied, as the display original carries no EXIF data.
+                if self.exif.transposition:
+                    method = getattr(getattr(Image, 'Transpose', Image), self.exif.transposition)
+                    self.img_pillow = self.img_pillow.transpose(method)
+
+                bytes_io = io.BytesIO()
+                self.img_pillow.save(bytes_io, format=img_format)
+                self.display_bytes = bytes_io.getbuffer()
+
+            # Unable to build display original, build failed return object and abort execution.
+            except Exception as e:
+                error_response = self.err.UNDECODABLE_IMAGE_BYTES
+                self.log(error_response.aws_log, e, level=self.ERROR)
+                self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
+                return False
+
+            span.set_attribute('bytes_out', len(self.display_bytes))
+
+        # Exposes display original dimensions.
+        self.img_meta_data.display = {'width': self.img_pillow.size[0], 'height': self.img_pillow.size[1]}
+        self.log(self.rsc.PRE_PROC_DISPLAY_ORIGINAL_BUILT, *self.img_pillow.size, len(self.display_bytes))
+        return True
 
 
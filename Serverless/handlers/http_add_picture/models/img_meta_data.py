@@ -1,8 +1,11 @@
 class ImgMetaData:
 
-    def __init__(self, type: str, size: str, height: int, width: int, exif: dict):
+    def __init__(self, type: str, size: str, height: int, width: int, exif: dict, parsed_exif: dict = None,
+                 display: dict = None):
         self.type = type
         self.size = size
         self.height = height
         self.width = width
-        self.exif = exif
\ No newline at end of file
+        self.exif = exif
+        self.parsed_exif = parsed_exif if parsed_exif is not None else {}
+        self.display = display
@@ -0,0 +1,58 @@
+class ParsedExif:
+    """
+    EXIF data of a picture, parsed once from the original image. Fields used by the pipeline are exposed typed, along
+    with a compact, size budgeted projection of the remaining tags.
+    """
+
+    TRANSPOSITIONS = {                  # :dict: EXIF orientation to Pillow transposition name, mirrored ones included.
+        2: 'FLIP_LEFT_RIGHT', 3: 'ROTATE_180', 4: 'FLIP_TOP_BOTTOM', 5: 'TRANSPOSE',
+        6: 'ROTATE_270', 7: 'TRANSVERSE', 8: 'ROTATE_90'
+    }
+    SWAPPED_DIMENSIONS = {5, 6, 7, 8}   # :set: Orientations whose displayed width and height are swapped.
+
+    def __init__(self, orientation: int = None, lat: float = None, lng: float = None, captured_at: str = None,
+                 tags: dict = None, omitted: int = 0):
+        self.orientation = orientation                  # :int: EXIF Orientation (1-8), None if absent.
+        self.lat = lat                                  # :float: GPS latitude in degrees, None if absent.
+        self.lng = lng                                  # :float: GPS longitude in degrees, None if absent.
+        self.captured_at = captured_at                  # :str: Capture time, ISO 8601 local time, None if absent.
+        self.tags = tags if tags is not None else {}    # :dict: Projected EXIF tags, typed.
+        self.omitted = omitted                          # :int: Amount of tags left out of the projection.
+
+    @property
+    def transposition(self) -> str:
+        """
+        Pillow transposition (Image.Transpose member name) compensating the EXIF orientation.
+        :return: string. None if no transposition is needed.
+        """
+
+        return self.TRANSPOSITIONS.get(self.orientation)
+
+    @property
+    def swaps_dimensions(self) -> bool:
+        return self.orientation in self.SWAPPED_DIMENSIONS
+
+    def to_dict(self) -> dict:
+        """
+        Typed fields in dictionary form, as carried on queued messages. Tags are carried separately.
+        :return: dictionary.
+        """
+
+        return {
+            'orientation': self.orientation,
+            'lat': self.lat,
+            'lng': self.lng,
+            'captured_at': self.captured_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, tags: dict = None):
+        """
+        Rebuilds parsed EXIF from its dictionary form, without parsing the image again.
+        :param data: dictionary. Typed fields, as produced by to_dict().
+        :param tags: dictionary. Decoded EXIF tags.
+        :return: ParsedExif.
+        """
+
+        data = data or {}
+        return cls(data.get('orientation'), data.get('lat'), data.get('lng'), data.get('captured_at'), tags)
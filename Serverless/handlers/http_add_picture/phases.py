@@ -0,0 +1,108 @@
+from handlers.http_add_picture.check_duplicate import CheckDuplicate
+from handlers.http_add_picture.image_pre_processing import ImagePreProcessing
+from handlers.http_add_picture.register_content_hash import RegisterContentHash
+from handlers.http_add_picture.save_image import SaveImage
+from interfaces.cloud_function_phase import CloudFunctionPhase as Cfp
+from interfaces.pipeline import Pipeline
+from interfaces.save_log import SaveLog
+from services.service_backends import ServiceBackends
+
+
+def add_picture_phases(pl: Pipeline) -> Pipeline:
+    """
+    Declares the picture processing phases, from pre-processing to queueing for celebrity recognition, on a pipeline
+    whose 'vl' phase exposes the picture (img_bytes) and its details (user_id, img_name, img_desc), so that every
+    upload flow processes pictures alike.
+    :param pl: Pipeline. Pipeline declaring a 'vl' phase.
+    :return: Pipeline.
+    """
+
+    # Execute image pre-processing phase
+    pl.add('pp', lambda r: ImagePreProcessing(r['vl'].img_bytes, r['vl'].invocation_id), depends_on=['vl'])
+
+    # Check whether user has already uploaded this same picture.
+    pl.add('dd', lambda r: CheckDuplicate(r['vl'].user_id, r['pp'].img_bytes, r['vl'].invocation_id),
+           depends_on=['vl', 'pp'])
+
+    # Save image, unless it duplicates an already stored one.
+    pl.add('si', lambda r: None if r['dd'].duplicate else SaveImage(
+        r['pp'].img_bytes, r['pp'].img_meta_data.type, r['vl'].invocation_id, r['pp'].display_bytes
+    ), depends_on=['pp', 'dd'])
+
+    # Index newly stored image content, concurrently with queueing.
+    pl.add('rh', lambda r: None if r['dd'].duplicate else RegisterContentHash(
+        r['vl'].user_id, r['dd'].content_hash, _get_stored_picture(r['vl'], r['si'], r['dd']), r['vl'].invocation_id
+    ), depends_on=['dd', 'si'])
+
+    # Assemble log object and save to queue.
+    pl.add('sq', lambda r: SaveLog(
+        repository=ServiceBackends.sqs(Cfp.env.QUEUE_BASE_URL, Cfp.env.ADD_PICTURE_QUEUE_NAME),
+        data=_build_data_to_queue(r['vl'], r['pp'], r['si'], r['dd']),
+        prefix='SQ',
+        phase_name='Save to queue',
+        invocation_id=r['vl'].invocation_id
+    ), depends_on=['si', 'dd'])
+
+    return pl
+
+
+def _get_stored_picture(vl: Cfp, si: SaveImage, dd: CheckDuplicate) -> dict:
+    """
+    References to the stored picture: the one just saved, or the one this upload duplicates.
+    :param vl: Validation phase, exposing the picture details.
+    :param si: SaveImage phase, None if picture is a duplicate.
+    :param dd: CheckDuplicate phase.
+    :return: dictionary.
+    """
+
+    if dd.duplicate:
+        return {k: dd.duplicate.get(k) for k in ['picture_id', 'file_name', 'img_url', 'img_thumbnail_url',
+                                                 'img_display_url', 'img_size']}
+
+    return {
+        'picture_id': vl.invocation_id,
+        'file_name': si.file_name,
+        'img_url': si.img_url,
+        'img_thumbnail_url': si.img_thumbnail_url,
+        'img_display_url': si.img_display_url,
+        'img_size': si.img_size
+    }
+
+
+def _build_data_to_queue(vl: Cfp, pp: ImagePreProcessing, si: SaveImage, dd: CheckDuplicate) -> dict:
+    """
+    Assembles the picture log to be queued for celebrity recognition. Duplicate uploads point at the stored picture
+    they duplicate, whose recognition result is to be reused.
+    :param vl: Validation phase, exposing the picture details.
+    :param pp: ImagePreProcessing phase.
+    :param si: SaveImage phase, None if picture is a duplicate.
+    :param dd: CheckDuplicate phase.
+    :return: dictionary.
+    """
+
+    stored = _get_stored_picture(vl, si, dd)
+    pp.img_meta_data.size = stored['img_size']
+    data = {
+        'user_id': vl.user_id,
+        'picture_id': vl.invocation_id,
+        'file_name': stored['file_name'],
+        'content_hash': dd.content_hash,
+        'api_metrics': {'add_picture': vl.get_metrics_snapshot()},
+        'img_name': vl.img_name,
+        'img_desc': vl.img_desc,
+        'img_url': stored['img_url'],
+        'img_thumbnail_url': stored['img_thumbnail_url'],
+        'img_display_url': stored['img_display_url'],
+        'img_meta_data': {
+            'type': pp.img_meta_data.type,
+            'size': stored['img_size'],
+            'height': pp.img_meta_data.height,
+            'width': pp.img_meta_data.width,
+            'exif': pp.img_meta_data.exif,
+            'parsed_exif': pp.img_meta_data.parsed_exif,
+            'display': pp.img_meta_data.display
+        }
+    }
+    if dd.duplicate:
+        data['duplicate_of'] = stored['picture_id']
+    return data
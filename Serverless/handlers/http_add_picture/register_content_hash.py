@@ -0,0 +1,41 @@
+from interfaces.cloud_function_phase import CloudFunctionPhase
+from services.service_backends import ServiceBackends
+
+
+class RegisterContentHash(CloudFunctionPhase):
+    """
+    Content hash registration object class, responsible for adding a newly stored picture to the user's content hash
+    index, so that later uploads of the same picture are detected as duplicates. The picture is already stored at this
+    point, so failing to index it is logged but doesn't fail the upload.
+    """
+
+    def __init__(self, user_id: str, content_hash: str, picture: dict, invocation_id: str):
+        """
+        Constructor of the content hash registration object, stores provided data and instantiates index repository.
+        :param user_id: string. Uploading user id.
+        :param content_hash: string. Hex encoded image content hash.
+        :param picture: dictionary. Stored picture references (picture_id, file_name, urls and size).
+        :param invocation_id: string containing id of current cloud function invocation to be to be used by API metrics.
+        """
+
+        self.entry = dict(picture, user_id=user_id, content_hash=content_hash)            # :dict: Index entry.
+        self.repository = ServiceBackends.dynamodb(self.env.PICTURE_HASHES_TABLE_NAME)    # :AWSDynamoDB: Hash index.
+
+        # Initializes APIPhase superclass parameters and procedures
+        super(RegisterContentHash, self).__init__(prefix='RH', phase_name='Register content hash',
+                                                  invocation_id=invocation_id)
+
+    def run(self) -> bool:
+        """
+        Object's main procedure: saves index entry.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        try:
+            self.repository.save(self.entry)
+        except Exception as e:
+            self.log(self.rsc.DEDUP_UNABLE_TO_REGISTER, e, level=self.WARNING)
+            return True
+
+        self.log(self.rsc.DEDUP_REGISTERED, self.entry['content_hash'], self.entry.get('picture_id'))
+        return True
@@ -48,12 +48,12 @@ class SaveData(CloudFunctionPhase):
         # Abort if impossible
         except Exception as e:
             error_response = self.err.UNABLE_TO_CONTACT_DATABASE
-            self.log(error_response.aws_log.format(str(e)))
+            self.log(error_response.aws_log, e, level=self.ERROR)
             self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
             return False
 
         # Procedure successful, log and return.
-        self.log(self.rsc.LOG_SAVE_DATABASE_DESCRIPTION.format(description))
+        self.log(self.rsc.LOG_SAVE_DATABASE_DESCRIPTION, description)
         return True
 
     def __save_data(self) -> bool:
@@ -69,10 +69,10 @@ class SaveData(CloudFunctionPhase):
         # Abort and return if impossible.
         except Exception as e:
             error_response = self.err.UNABLE_TO_SAVE_DATABASE
-            self.log(error_response.aws_log.format(str(e)))
+            self.log(error_response.aws_log, e, level=self.ERROR)
             self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
             return False
 
         # Procedure successful, log and return.
-        self.log(self.rsc.LOG_SAVE_SUCCESSFUL.format(self.data))
+        self.log(self.rsc.LOG_SAVE_SUCCESSFUL, self.data, level=self.DEBUG)
         return True
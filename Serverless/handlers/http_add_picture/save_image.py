@@ -1,5 +1,5 @@
 from interfaces.cloud_function_phase import CloudFunctionPhase
-from services.aws_s3_dao import AWSS3
+from services.service_backends import ServiceBackends
 
 
 class SaveImage(CloudFunctionPhase):
@@ -8,23 +8,27 @@ class SaveImage(CloudFunctionPhase):
     and evaluating the response.
     """
 
-    def __init__(self, img_bytes: bytes,  img_ext: str, invocation_id: str):
+    def __init__(self, img_bytes: bytes,  img_ext: str, invocation_id: str, display_bytes: bytes = None):
         """
         Constructor of the save image object, stores provided and locally generated data, runs main object
         procedure.
-        :param img_bytes: pre-processed image in bytes form.
+        :param img_bytes: pre-processed image buffer (bytes-like), uploaded as is.
         :param img_ext: string containing image extension (type).
         :param invocation_id: string containing id of current cloud function invocation to be to be used by API metrics.
+        :param display_bytes: bounded display original buffer (bytes-like) of oversized images, stored alongside.
         """
 
-        self.img_bytes = img_bytes                      # :str: Client provided image in bytes form.
+        self.img_bytes = img_bytes                      # :memoryview: Pre-processed image buffer.
+        self.display_bytes = display_bytes              # :memoryview: Display original buffer, if any.
         self.img_ext = img_ext                          # :str: Image type/extension.
         self.file_name = None                           # :str: Stored image final name.
         self.thmb_file_name = None                      # :str: Stored image thumbnail name.
         self.img_size = None                            # :str: Stored image size.
         self.img_url = None                             # :str: Public image url.
         self.img_thumbnail_url = None                   # :str: Public thumbnail url.
-        self.repository = AWSS3(self.env.BUCKET_NAME)   # :AWSS3: File repository.
+        self.display_file_name = None                   # :str: Stored display original name, if any.
+        self.img_display_url = None                     # :str: Public display original url, if any.
+        self.repository = ServiceBackends.s3(self.env.BUCKET_NAME)  # :AWSS3: File repository.
 
         # Initializes APIPhase superclass parameters and procedures
         super(SaveImage, self).__init__(prefix='SI', phase_name='Save image', invocation_id=invocation_id)
@@ -42,10 +46,13 @@ class SaveImage(CloudFunctionPhase):
         # Execute request on image saving infrastructure, abort if impossible.
         if not self.__save_image(): return False
 
+        # Store display original next to the untouched image, abort if impossible.
+        if self.display_bytes is not None and not self.__save_display_original(): return False
+
         # Build public image url
         self.img_url = f'{self.env.PUBLIC_IMG_BASE_ADDRESS}{self.file_name}'
         self.img_thumbnail_url = f'{self.env.PUBLIC_THUMBNAIL_BASE_ADDRESS}{self.thmb_file_name}'
-        self.log(self.rsc.IMAGE_SAVE_PUBLIC_URL.format(self.img_url))
+        self.log(self.rsc.IMAGE_SAVE_PUBLIC_URL, self.img_url)
 
         # Procedure successful
         return True
@@ -62,12 +69,33 @@ class SaveImage(CloudFunctionPhase):
         # If unable to save image, fill up return object and abort.
         if not status:
             error_response = self.err.UNABLE_TO_CONTACT_BLOB_STORAGE_API
-            self.log(error_response.aws_log.format(response))
+            self.log(error_response.aws_log, response, level=self.ERROR)
             self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
             return False
 
         # Procedure successful
-        self.log(self.rsc.IMAGE_SAVE_API_CONTACTED.format(self.img_size, response))
+        self.set_metrics_attribute('bytes_out', len(self.img_bytes))
+        self.log(self.rsc.IMAGE_SAVE_API_CONTACTED, self.img_size, response)
         return True
 
+    def __save_display_original(self) -> bool:
+        """
+        Attempts to save the display original on repository.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
 
+        # Attempts to save file to repository
+        self.display_file_name = f'{self.invocation_id}-{self.env.DISPLAY_SUFFIX}.{self.img_ext}'
+        status, response, _ = self.repository.save_file(self.display_bytes, self.display_file_name)
+
+        # If unable to save display original, fill up return object and abort.
+        if not status:
+            error_response = self.err.UNABLE_TO_CONTACT_BLOB_STORAGE_API
+            self.log(error_response.aws_log, response, level=self.ERROR)
+            self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
+            return False
+
+        # Procedure successful
+        self.img_display_url = f'{self.env.PUBLIC_IMG_BASE_ADDRESS}{self.display_file_name}'
+        self.log(self.rsc.IMAGE_SAVE_PUBLIC_URL, self.img_display_url)
+        return True
@@ -1,4 +1,4 @@
-import base64
+import binascii
 
 from interfaces.cloud_function_phase import CloudFunctionPhase
 
@@ -19,8 +19,8 @@ class Validation(CloudFunctionPhase):
         self.user_id = None                 # :str: User Id as declared on request payload..
         self.img_name = None                # :str: Client provided name.
         self.img_desc = None                # :str: Client provided image description.
-        self.img_b64_str = None             # :str: BASE64 encoded string, containing image in original payload form.
-        self.img_bytes = None               # :bytes: Image in bytes form, product of base64.b64decode().
+        self.img_b64_str = None             # :str: BASE64 encoded string, released once decoded.
+        self.img_bytes = None               # :memoryview: Decoded image buffer, shared by the following phases.
 
         # Initializes APIPhase superclass parameters and procedures
         invocation_id = event.get('invocation_id')
@@ -56,7 +56,7 @@ class Validation(CloudFunctionPhase):
         img_b64 = self.event.get('image')
         if not img_b64:
             error_response = self.err.INEXISTENT_BASE64_STRING
-            self.log(error_response.aws_log)
+            self.log(error_response.aws_log, level=self.ERROR)
             self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
             return False
         self.img_b64_str = img_b64
@@ -71,18 +71,24 @@ class Validation(CloudFunctionPhase):
         :return: boolean. Value expresses whether procedure has executed successfully or not.
         """
 
-        # Attempts to decode BASE64 string into bytes.
+        # Attempts to decode BASE64 string into a single buffer. Unlike base64.b64decode, a2b_base64 reads the string
+        # in place instead of encoding an ASCII copy of it first.
         try:
-            self.img_bytes = base64.b64decode(self.img_b64_str)
+            self.img_bytes = memoryview(binascii.a2b_base64(self.img_b64_str))
 
         # If unable to decode BASE64 image string, build failed return object and abort execution.
         except Exception as e:
             error_response = self.err.UNDECODABLE_BASE64_STRING
-            self.log(error_response.aws_log.format(str(e)))
+            self.log(error_response.aws_log, e, level=self.ERROR)
             self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
             return False
 
-        # Process completed successfully, log and return true.
+        # Process completed successfully, releases BASE64 string (a third larger than the image) from the event as
+        # well, log and return true.
+        self.set_metrics_attribute('bytes_in', len(self.img_b64_str))
+        self.set_metrics_attribute('bytes_out', self.img_bytes.nbytes)
+        self.img_b64_str = None
+        self.event.pop('image', None)
         self.log(self.rsc.VALIDATION_DECODED_BASE64)
         return True
 
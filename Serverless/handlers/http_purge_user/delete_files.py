@@ -0,0 +1,45 @@
+from interfaces.cloud_function_phase import CloudFunctionPhase
+from services.service_backends import ServiceBackends
+
+
+class DeleteFiles(CloudFunctionPhase):
+    """
+    File deletion object class, responsible for deleting a list of stored files from a blob storage bucket, in
+    concurrently executed batches.
+    """
+
+    def __init__(self, bucket: str, file_names: list, prefix: str, phase_name: str, invocation_id: str):
+        """
+        Constructor of the file deletion object, stores provided data and instantiates file repository.
+        :param bucket: string. Name of the bucket files are stored on.
+        :param file_names: list. Stored file names.
+        :param invocation_id: string containing id of current cloud function invocation to be to be used by API metrics.
+        """
+
+        self.file_names = file_names                        # :list: Stored file names.
+        self.deleted = 0                                    # :int: Amount of deleted files.
+        self.repository = ServiceBackends.s3(bucket)        # :AWSS3: File repository.
+
+        # Initializes APIPhase superclass parameters and procedures
+        super(DeleteFiles, self).__init__(prefix=prefix, phase_name=phase_name, invocation_id=invocation_id)
+
+    def run(self) -> bool:
+        """
+        Object's main procedure: deletes files and evaluates response.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        # Attempts to delete files from repository.
+        status, response, self.deleted = self.repository.delete_files(self.file_names)
+
+        # If unable to delete every file, fill up return object and abort.
+        if not status:
+            error_response = self.err.UNABLE_TO_DELETE_FROM_BLOB_STORAGE
+            self.log(error_response.aws_log, response, level=self.ERROR)
+            self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
+            return False
+
+        # Procedure successful
+        self.set_metrics_attribute('items', self.deleted)
+        self.log(self.rsc.PURGE_DELETED_FILES, self.deleted, response)
+        return True
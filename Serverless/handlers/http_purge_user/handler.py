@@ -0,0 +1,60 @@
+# Imported first, so that it times the initialization imports that follow.
+import services.cold_start
+
+from handlers.http_purge_user.delete_files import DeleteFiles
+from handlers.http_purge_user.load_picture_files import LoadPictureFiles
+from handlers.http_purge_user.purge_table import PurgeTable
+from handlers.http_purge_user.validation import Validation
+from interfaces.cloud_function_phase import CloudFunctionPhase as Cfp
+from interfaces.pipeline import Pipeline
+
+
+@Cfp.handler('PURGE USER')
+def purge_user(event, context):
+
+    pl = Pipeline()
+
+    # Execute validation phase
+    pl.add('vl', lambda r: Validation(event))
+
+    # List stored files of every picture.
+    pl.add('lf', lambda r: LoadPictureFiles(r['vl'].user_id, r['vl'].invocation_id), depends_on=['vl'])
+
+    # Delete originals and thumbnails concurrently.
+    pl.add('df', lambda r: DeleteFiles(
+        Cfp.env.BUCKET_NAME, r['lf'].file_names, 'DF', 'Delete pictures', r['vl'].invocation_id
+    ), depends_on=['lf'])
+    pl.add('dt', lambda r: DeleteFiles(
+        Cfp.env.THUMBNAIL_BUCKET_NAME, r['lf'].thumbnail_file_names, 'DT', 'Delete thumbnails', r['vl'].invocation_id
+    ), depends_on=['lf'])
+
+    # Delete picture logs only once their files are gone, so that a failed purge can be retried.
+    pl.add('pp', lambda r: PurgeTable(
+        Cfp.env.PICTURES_TABLE_NAME, r['vl'].user_id, 'PP', 'Purge pictures', r['vl'].invocation_id
+    ), depends_on=['df', 'dt'])
+
+    # Delete celebrities and content hash index concurrently with the above.
+    pl.add('pc', lambda r: PurgeTable(
+        Cfp.env.CELEBRITIES_TABLE_NAME, r['vl'].user_id, 'PC', 'Purge celebrities', r['vl'].invocation_id
+    ), depends_on=['vl'])
+    pl.add('ph', lambda r: PurgeTable(
+        Cfp.env.PICTURE_HASHES_TABLE_NAME, r['vl'].user_id, 'PH', 'Purge content hashes', r['vl'].invocation_id
+    ), depends_on=['vl'])
+
+    if not pl.run():
+        return pl.failed_return_object
+
+    # Metrics are taken before terminating, as terminating releases the invocation trace.
+    vl, pp, df, dt, pc, ph = (pl.phases[x] for x in ['vl', 'pp', 'df', 'dt', 'pc', 'ph'])
+    api_metrics = vl.get_metrics()
+    Cfp.terminate_function(vl.invocation_id)
+
+    # Return success object
+    return Cfp.get_return_object(
+        status_code=200,
+        response_code=0,
+        msg_dev=f'Purged {pp.deleted} picture(s), {df.deleted + dt.deleted} file(s), {pc.deleted} celebrity(ies) '
+                f'and {ph.deleted} content hash(es).',
+        msg_user='Success',
+        api_metrics=api_metrics
+    )
@@ -0,0 +1,66 @@
+from handlers.s3_generate_thumbnail.image_processing import ImageProcessing
+from interfaces.cloud_function_phase import CloudFunctionPhase
+from services.service_backends import ServiceBackends
+
+
+class LoadPictureFiles(CloudFunctionPhase):
+    """
+    Picture files listing object class, responsible for paging through the user's picture logs and exposing the stored
+    file names of every original and derivative, so that they can be deleted before the logs pointing at them are.
+    """
+
+    def __init__(self, user_id: str, invocation_id: str):
+        """
+        Constructor of the picture files listing object, stores provided data and instantiates pictures repository.
+        :param user_id: string. Id of the user whose pictures are to be listed.
+        :param invocation_id: string containing id of current cloud function invocation to be to be used by API metrics.
+        """
+
+        self.user_id = user_id                              # :str: Pictures owner id.
+        self.pictures = 0                                   # :int: Amount of picture logs found.
+        self.file_names = []                                # :list: Stored original file names.
+        self.thumbnail_file_names = []                      # :list: Stored thumbnail file names.
+        self.repository = ServiceBackends.dynamodb(self.env.PICTURES_TABLE_NAME)  # :AWSDynamoDB: Pictures repo.
+
+        # Initializes APIPhase superclass parameters and procedures
+        super(LoadPictureFiles, self).__init__(prefix='LF', phase_name='Load picture files',
+                                               invocation_id=invocation_id)
+
+    def run(self) -> bool:
+        """
+        Object's main procedure: pages through picture logs, collecting stored file names.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        # Only file referencing attributes are read. Duplicate uploads share files, so names are collected once.
+        file_names, thumbnail_file_names = {}, {}
+        try:
+            attributes = ['file_name', 'img_thumbnail_url', 'img_display_url']
+            for item in self.repository.query_all(self.user_id, attributes=attributes):
+                self.pictures += 1
+                if item.get('file_name'):
+                    file_names[item['file_name']] = None
+
+                    # Derivatives are named after the original, one per configured size.
+                    picture_id, _, img_ext = item['file_name'].rpartition('.')
+                    for size in ImageProcessing.SIZES:
+                        thumbnail_file_names[ImageProcessing.get_file_name(picture_id, size, img_ext)] = None
+                if item.get('img_display_url'):
+                    file_names[item['img_display_url'].rsplit('/', 1)[-1]] = None
+                if item.get('img_thumbnail_url'):
+                    thumbnail_file_names[item['img_thumbnail_url'].rsplit('/', 1)[-1]] = None
+
+        # Abort if impossible.
+        except Exception as e:
+            error_response = self.err.UNABLE_TO_CONTACT_DATABASE
+            self.log(error_response.aws_log, e, level=self.ERROR)
+            self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
+            return False
+
+        # Procedure successful
+        self.file_names = list(file_names)
+        self.thumbnail_file_names = list(thumbnail_file_names)
+        self.set_metrics_attribute('items', self.pictures)
+        self.log(self.rsc.PURGE_FILES_FOUND, self.pictures, len(self.file_names), len(self.thumbnail_file_names),
+                 self.user_id)
+        return True
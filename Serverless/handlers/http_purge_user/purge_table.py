@@ -0,0 +1,60 @@
+from interfaces.cloud_function_phase import CloudFunctionPhase
+from services.service_backends import ServiceBackends
+
+
+class PurgeTable(CloudFunctionPhase):
+    """
+    Table purging object class, responsible for deleting every item a user owns on a given table.
+    """
+
+    def __init__(self, table_name: str, user_id: str, prefix: str, phase_name: str, invocation_id: str):
+        """
+        Constructor of the table purging object, stores provided data and instantiates log repository.
+        :param table_name: string. Name of the table, partitioned by user Id, to be purged.
+        :param user_id: string. Id of the user whose items are to be deleted.
+        :param invocation_id: string containing id of current cloud function invocation to be to be used by API metrics.
+        """
+
+        self.table_name = table_name                                    # :str: Purged table name.
+        self.user_id = user_id                                          # :str: Items owner id.
+        self.deleted = 0                                                # :int: Amount of deleted items.
+        self.repository = ServiceBackends.dynamodb(table_name)          # :AWSDynamoDB: Log repository.
+
+        # Initializes APIPhase superclass parameters and procedures
+        super(PurgeTable, self).__init__(prefix=prefix, phase_name=phase_name, invocation_id=invocation_id)
+
+    def run(self) -> bool:
+        """
+        Object's main procedure: verifies table requirements and conditions, deletes user's items.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        # Checks database/table status and key schema, aborts if impossible.
+        try:
+            description = self.repository.evaluate_conditions_and_requirements()
+        except Exception as e:
+            return self.__fail(self.err.UNABLE_TO_CONTACT_DATABASE, e)
+        self.log(self.rsc.LOG_SAVE_DATABASE_DESCRIPTION, description)
+
+        # Attempts to delete every item under user's partition, aborts if impossible.
+        try:
+            self.deleted = self.repository.delete_by_hash(self.user_id)
+        except Exception as e:
+            return self.__fail(self.err.UNABLE_TO_DELETE_FROM_DATABASE, e)
+
+        # Procedure successful
+        self.set_metrics_attribute('items', self.deleted)
+        self.log(self.rsc.PURGE_DELETED_ITEMS, self.deleted, self.user_id, self.table_name)
+        return True
+
+    def __fail(self, error_response, e) -> bool:
+        """
+        Logs error and fills up return object.
+        :param error_response: Error. Error to be reported.
+        :param e: Exception. Cause.
+        :return: boolean. Always False.
+        """
+
+        self.log(error_response.aws_log, e, level=self.ERROR)
+        self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
+        return False
@@ -0,0 +1,52 @@
+from interfaces.cloud_function_phase import CloudFunctionPhase
+
+
+class Validation(CloudFunctionPhase):
+    """
+    Validation object class, responsible for validating and exposing data retrieved from the client's sent request
+    object (event dictionary).
+    """
+
+    def __init__(self, event: dict):
+        """
+        Constructor of the Validation object, stores client provided data.
+        :param event: AWS event dictionary.
+        """
+
+        self.event = event                  # :dict: AWS Event object.
+        self.user_id = None                 # :str: Id of the user whose data is to be purged.
+
+        # Initializes APIPhase superclass parameters and procedures
+        invocation_id = event.get('invocation_id')
+        super(Validation, self).__init__(prefix='VL', phase_name='Validation', invocation_id=invocation_id)
+
+    def run(self) -> bool:
+        """
+        Object's main procedure: extract information from event object.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        # Extract information from request object and abort if unable.
+        if not self.__extract_info_from_body(): return False
+
+        # Procedure successful
+        return True
+
+    def __extract_info_from_body(self) -> bool:
+        """
+        Double checks request object's fields and content existence and copies values to instance variables.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        # Checks for existence of user Id, as an empty one would match nothing. If unsuccessful, abort.
+        user_id = (self.event.get('user_id') or '').strip()
+        if not user_id:
+            error_response = self.err.INEXISTENT_USER_ID
+            self.log(error_response.aws_log, level=self.ERROR)
+            self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
+            return False
+        self.user_id = user_id
+
+        # Process completed successfully, log and return true.
+        self.log(self.rsc.VALIDATION_EXTRACTED_BODY_PAYLOAD)
+        return True
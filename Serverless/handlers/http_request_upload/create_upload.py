@@ -0,0 +1,63 @@
+from urllib.parse import quote
+
+from interfaces.cloud_function_phase import CloudFunctionPhase
+from services.service_backends import ServiceBackends
+
+
+class CreateUpload(CloudFunctionPhase):
+    """
+    Upload creation object class, responsible for issuing a presigned POST through which the client uploads the picture
+    straight to the uploads bucket. Picture details travel as object metadata, so that the upload ingestion function
+    triggered by the new object can process it as add_picture would.
+    """
+
+    def __init__(self, user_id: str, img_name: str, img_desc: str, content_type: str, invocation_id: str):
+        """
+        Constructor of the upload creation object, stores provided data and instantiates uploads repository.
+        :param user_id: string. Uploading user id.
+        :param img_name: string. Client provided name.
+        :param img_desc: string. Client provided image description.
+        :param content_type: string. MIME type of the picture to be uploaded.
+        :param invocation_id: string containing id of current cloud function invocation to be to be used by API metrics.
+        """
+
+        self.user_id = user_id                              # :str: Uploading user id.
+        self.img_name = img_name                            # :str: Client provided name.
+        self.img_desc = img_desc                            # :str: Client provided image description.
+        self.content_type = content_type                    # :str: Picture MIME type.
+        self.file_name = None                               # :str: Name picture will be uploaded as.
+        self.upload = {}                                    # :dict: Presigned POST url and form fields.
+        self.repository = ServiceBackends.s3(self.env.UPLOADS_BUCKET_NAME)  # :AWSS3: Uploads repository.
+
+        # Initializes APIPhase superclass parameters and procedures
+        super(CreateUpload, self).__init__(prefix='CU', phase_name='Create upload', invocation_id=invocation_id)
+
+    def run(self) -> bool:
+        """
+        Object's main procedure: signs upload POST and evaluates response.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        # Uploads are named after the invocation Id, which becomes the picture Id once ingested.
+        self.file_name = self.invocation_id
+
+        # Metadata is sent as HTTP headers, hence percent-encoded to ASCII.
+        metadata = {'user-id': quote(self.user_id), 'img-name': quote(self.img_name), 'img-desc': quote(self.img_desc)}
+
+        # Attempts to sign upload, fill up return object and abort if unable.
+        status, response, self.upload = self.repository.create_presigned_post(
+            self.file_name,
+            self.content_type,
+            int(float(self.env.UPLOAD_MAX_SIZE_MB or 10) * 1024 * 1024),
+            metadata,
+            int(self.env.UPLOAD_URL_EXPIRATION_SECONDS or 300)
+        )
+        if not status:
+            error_response = self.err.UNABLE_TO_CONTACT_BLOB_STORAGE_API
+            self.log(error_response.aws_log, response, level=self.ERROR)
+            self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
+            return False
+
+        # Procedure successful
+        self.log(self.rsc.UPLOAD_CREATED, response)
+        return True
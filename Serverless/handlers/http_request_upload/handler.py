@@ -0,0 +1,38 @@
+# Imported first, so that it times the initialization imports that follow.
+import services.cold_start
+
+from handlers.http_request_upload.create_upload import CreateUpload
+from handlers.http_request_upload.validation import Validation
+from interfaces.cloud_function_phase import CloudFunctionPhase as Cfp
+from interfaces.pipeline import Pipeline
+
+
+@Cfp.handler('REQUEST UPLOAD')
+def request_upload(event, context):
+
+    pl = Pipeline()
+
+    # Execute validation phase
+    pl.add('vl', lambda r: Validation(event))
+
+    # Sign direct upload
+    pl.add('cu', lambda r: CreateUpload(r['vl'].user_id, r['vl'].img_name, r['vl'].img_desc, r['vl'].content_type,
+                                        r['vl'].invocation_id), depends_on=['vl'])
+
+    if not pl.run():
+        return pl.failed_return_object
+
+    # Metrics are taken before terminating, as terminating releases the invocation trace.
+    vl, cu = pl.phases['vl'], pl.phases['cu']
+    api_metrics = vl.get_metrics()
+    Cfp.terminate_function(vl.invocation_id)
+
+    # Return success object, picture will be processed once uploaded.
+    return Cfp.get_return_object(
+        status_code=200,
+        response_code=0,
+        msg_dev=f"Upload '{cu.file_name}' with a multipart/form-data POST of given fields and a 'file' field.",
+        msg_user='Success',
+        api_metrics=api_metrics,
+        upload=dict(cu.upload, picture_id=cu.file_name)
+    )
@@ -0,0 +1,62 @@
+from interfaces.cloud_function_phase import CloudFunctionPhase
+
+
+class Validation(CloudFunctionPhase):
+    """
+    Validation object class, responsible for validating and exposing data retrieved from the client's sent request
+    object (event dictionary).
+    """
+
+    CONTENT_TYPES = {'image/jpeg', 'image/png'}  # :set: MIME types pictures can be uploaded as.
+
+    def __init__(self, event: dict):
+        """
+        Constructor of the Validation object, stores client provided data.
+        :param event: AWS event dictionary.
+        """
+
+        self.event = event                  # :dict: AWS Event object.
+        self.user_id = None                 # :str: User Id as declared on request payload.
+        self.img_name = None                # :str: Client provided name.
+        self.img_desc = None                # :str: Client provided image description.
+        self.content_type = None            # :str: MIME type of the picture to be uploaded.
+
+        # Initializes APIPhase superclass parameters and procedures
+        invocation_id = event.get('invocation_id')
+        super(Validation, self).__init__(prefix='VL', phase_name='Validation', invocation_id=invocation_id)
+
+    def run(self) -> bool:
+        """
+        Object's main procedure: extract information from event object.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        # Extract information from request object and abort if unable.
+        if not self.__extract_info_from_body(): return False
+
+        # Procedure successful
+        return True
+
+    def __extract_info_from_body(self) -> bool:
+        """
+        Double checks request object's fields and content existence and copies values to instance variables.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        # Extracts information from newly acquired request object.
+        self.img_name = self.event.get('img_name', 'N.A.').strip()
+        self.img_desc = self.event.get('img_desc', 'N.A.').strip()
+        self.user_id = self.event.get('user_id', 'N.A.').strip()
+
+        # Checks picture is to be uploaded in a supported format. If not, abort.
+        content_type = (self.event.get('content_type') or '').strip().lower()
+        if content_type not in self.CONTENT_TYPES:
+            error_response = self.err.UNSUPPORTED_CONTENT_TYPE
+            self.log(error_response.aws_log, content_type, level=self.ERROR)
+            self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
+            return False
+        self.content_type = content_type
+
+        # Process completed successfully, log and return true.
+        self.log(self.rsc.VALIDATION_EXTRACTED_BODY_PAYLOAD)
+        return True
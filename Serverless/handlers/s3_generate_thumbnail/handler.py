@@ -1,34 +1,51 @@
+# Imported first, so that it times the initialization imports that follow.
+import services.cold_start
+
 from handlers.s3_generate_thumbnail.image_processing import ImageProcessing
 from handlers.s3_generate_thumbnail.load_image import LoadImage
 from handlers.s3_generate_thumbnail.save_image import SaveImage
 from handlers.s3_generate_thumbnail.validation import Validation
 from interfaces.cloud_function_phase import CloudFunctionPhase as Cfp
-from services.aws_s3_dao import AWSS3
+from interfaces.pipeline import Pipeline
+from interfaces.record_batch import RecordBatch
+from services.service_backends import ServiceBackends
 
 
+@Cfp.handler('GENERATE THUMBNAIL')
 def generate_thumbnail(event, context):
 
-    print('.')
-    print('+------------------------------------------+')
-    print('| . . . . . .GENERATE THUMBNAIL . . . . . .|')
-    print('+------------------------------------------+')
+    # Every record of the event is processed on its own pipeline, sharing the originals repository.
+    repository = ServiceBackends.s3(Cfp.env.BUCKET_NAME)
+    RecordBatch(event).run(lambda record: _generate_derivatives(record, repository))
+
+
+def _generate_derivatives(record: dict, repository) -> bool:
+    """
+    Generates and stores the derivatives of the original referenced by a single event record.
+    :param record: dictionary. AWS S3 event record.
+    :param repository: AWSS3. Originals repository.
+    :return: boolean. Value expresses whether record has been processed successfully or not.
+    """
+
+    pl = Pipeline()
 
     # Execute validation phase
-    vl = Validation(event)
-    if not vl.status: return
+    pl.add('vl', lambda r: Validation(record))
 
-    # Execute image loading phase
-    li = LoadImage(AWSS3(Cfp.env.BUCKET_NAME), vl.file_name, vl.invocation_id)
-    if not li.status: return
+    # Execute image loading phase, unless stored file is a derivative (display original) of another picture.
+    pl.add('li', lambda r: None if r['vl'].derivative else LoadImage(
+        repository, r['vl'].file_name, r['vl'].invocation_id), depends_on=['vl'])
 
     # Execute image processing phase
-    ip = ImageProcessing(li.img_bytes_io, vl.invocation_id)
-    if not ip.status: return
-
-    # Save image
-    si = SaveImage(ip.img_bytes, ip.img_ext, vl.invocation_id)
-    if not si.status: return
+    pl.add('ip', lambda r: None if r['vl'].derivative else ImageProcessing(
+        r['li'].img_bytes_io, r['vl'].invocation_id), depends_on=['vl', 'li'])
 
-    Cfp.terminate_function(vl.invocation_id)
+    # Save each derivative, concurrently.
+    for size in ImageProcessing.SIZES:
+        pl.add(f'si-{size}', lambda r, size=size: None if r['vl'].derivative else SaveImage(
+            r['ip'].derivatives[size], r['ip'].img_ext, r['vl'].invocation_id, size), depends_on=['vl', 'ip'])
 
+    if not pl.run(): return False
 
+    Cfp.terminate_function(pl.phases['vl'].invocation_id)
+    return True
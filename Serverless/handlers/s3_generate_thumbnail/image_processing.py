@@ -1,15 +1,43 @@
 from io import BytesIO
-from PIL import Image
 
 from interfaces.cloud_function_phase import CloudFunctionPhase
+from services.lazy_import import LazyModule
+
+Image = LazyModule('PIL.Image')
 
 
 class ImageProcessing(CloudFunctionPhase):
     """
-    Image processing object, responsible for converting image to required Pillow Image format and performing
-    any processing required.
+    Image processing object, responsible for converting image to required Pillow Image format and generating its
+    derivatives: one per configured long edge size, all produced from a single decode by cascading downscales from the
+    largest size to the smallest. In fast decode mode, JPEG images are decoded straight at the smallest DCT scale (1/2,
+    1/4 or 1/8) still covering the largest derivative, the final resample being performed as usual.
     """
 
+    ORIENTATION = 0x0112                    # :int: EXIF Orientation tag.
+    TRANSPOSITIONS = {                      # :dict: EXIF orientation to Pillow transposition name.
+        2: 'FLIP_LEFT_RIGHT', 3: 'ROTATE_180', 4: 'FLIP_TOP_BOTTOM', 5: 'TRANSPOSE',
+        6: 'ROTATE_270', 7: 'TRANSVERSE', 8: 'ROTATE_90'
+    }
+    SMALL_SIZE = 128                        # :int: Long edge of the derivative keeping the small thumbnail suffix.
+    SIZES = sorted({int(x) for x in (CloudFunctionPhase.env.THUMBNAIL_SIZES or '128').split(',') if x.strip()},
+                   reverse=True)            # :list: Derivative long edge sizes in pixels, largest first.
+    DRAFT_FORMATS = {'JPEG', 'MPO'}         # :set: Formats supporting reduced resolution decoding.
+    FAST_DECODE = (CloudFunctionPhase.env.THUMBNAIL_FAST_DECODE or 'true').lower() == 'true'  # :bool: Draft decode.
+
+    @classmethod
+    def get_file_name(cls, invocation_id: str, size: int, img_ext: str) -> str:
+        """
+        Builds the predictable stored file name of a derivative, the 128 pixels one keeping the small thumbnail name.
+        :param invocation_id: string. Original picture Id.
+        :param size: integer. Derivative long edge size in pixels.
+        :param img_ext: string. Image extension (type).
+        :return: string.
+        """
+
+        suffix = cls.env.SMALL_THUMBNAIL_SUFFIX if size == cls.SMALL_SIZE else str(size)
+        return f'{invocation_id}-{suffix}.{img_ext}'
+
     def __init__(self, img_bytes_io: BytesIO, invocation_id: str):
         """
         Constructor of the image processing object, stores provided and locally generated data, runs main object
@@ -20,25 +48,23 @@ class ImageProcessing(CloudFunctionPhase):
 
         self.img_bytes_io = img_bytes_io           # :bytes: Image in bytes form, product of base64.b64decode().
         self.img_pillow = None                     # :Image: Pillow Image object.
-        self.img_bytes = None
-        self.img_ext = None
-        self.thmb_size = (128, 128)
+        self.derivatives = {}                      # :dict: Long edge size to encoded derivative bytes.
+        self.img_ext = None                        # :str: Image type/extension.
 
         # Initializes APIPhase superclass parameters and procedures
         super(ImageProcessing, self).__init__(prefix='PI', phase_name='Pre-processing', invocation_id=invocation_id)
 
     def run(self) -> bool:
         """
-        Object's main procedure: creates Pillow Image object, rotates image based on EXIF orientation (if available)
-        and extracts image meta data.
+        Object's main procedure: creates Pillow Image object and generates its oriented derivatives.
         :return: boolean. Value expresses whether procedure has executed successfully or not.
         """
 
         # Creates Pillow Image Object, aborts if impossible.
         if not self.__convert_image_bytes_io_to_pillow(): return False
 
-        # Generates thumbnail from given image, aborts if impossible.
-        if not self.__generate_thumbnail(): return False
+        # Generates derivatives from given image, aborts if impossible.
+        if not self.__generate_derivatives(): return False
 
         # Procedure successful
         return True
@@ -56,25 +82,102 @@ class ImageProcessing(CloudFunctionPhase):
         # Unable to decode image bytes, build failed return object and abort execution.
         except Exception as e:
             error_response = self.err.UNDECODABLE_IMAGE_BYTES
-            self.log(error_response.aws_log.format(str(e)))
+            self.log(error_response.aws_log, e, level=self.ERROR)
             return False
 
         # Successfully built Pillow Image object, log and return.
         self.log(self.rsc.PRE_PROC_CREATED_PILLOW_OBJECT)
         return True
 
-    def __generate_thumbnail(self) -> bool:
+    def __generate_derivatives(self) -> bool:
+        """
+        Downscales the decoded image to each configured size, each derivative being resampled from the previous (larger)
+        one rather than from the original, and encodes them.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
         try:
             width, height = self.img_pillow.size
             self.img_ext = self.img_pillow.format
-            self.img_pillow.thumbnail(self.thmb_size)
-            bytes_io = BytesIO()
-            self.img_pillow.save(bytes_io, format=self.img_ext)
-            self.img_bytes = bytes_io.getvalue()
+            orientation = self.__get_orientation()
+            pending_orientation = orientation
+            self.__draft(self.__downscale_size(width, height, self.SIZES[0]))
+            current = self.img_pillow
+
+            for size in self.SIZES:
+                with self.trace('Derivative', size=size) as span:
+                    current = self.__downscale(current, size)
+
+                    # Originals stored with a pending EXIF orientation are oriented once downsized, as derivatives
+                    # carry no EXIF data. Smaller derivatives cascade from the already oriented largest one.
+                    if pending_orientation in self.TRANSPOSITIONS:
+                        method = getattr(getattr(Image, 'Transpose', Image), self.TRANSPOSITIONS[pending_orientation])
+                        current = current.transpose(method)
+                        pending_orientation = None
+
+                    bytes_io = BytesIO()
+                    current.save(bytes_io, format=self.img_ext)
+                    self.derivatives[size] = bytes_io.getvalue()
+                    span.set_attribute('bytes_out', len(self.derivatives[size]))
+                    span.set_attribute('width', current.size[0])
+                    span.set_attribute('height', current.size[1])
+                self.log(self.rsc.PROC_SUCCESSFULLY_GENERATED_TUMBNAIL, *current.size, width, height)
+
         except Exception as e:
-            self.log(self.rsc.PROC_UNABLE_TO_GENERATE_TUMBNAIL.format(str(e)))
+            self.log(self.rsc.PROC_UNABLE_TO_GENERATE_TUMBNAIL, e, level=self.ERROR)
             return False
 
-        self.log(self.rsc.PROC_SUCCESSFULLY_GENERATED_TUMBNAIL.format(self.thmb_size[0], self.thmb_size[1],
-                                                                      width, height))
+        self.set_metrics_attribute('bytes_out', sum(len(x) for x in self.derivatives.values()))
+        self.set_metrics_attribute('orientation', orientation)
         return True
+
+    def __draft(self, size: tuple):
+        """
+        Configures the JPEG decoder to decode at the smallest DCT scale whose result still covers given size, if fast
+        decode mode is on. Pixels are decoded on first access, so this must precede any resampling.
+        :param size: tuple. Width and height to be covered.
+        :return: void.
+        """
+
+        if not self.FAST_DECODE or self.img_pillow.format not in self.DRAFT_FORMATS: return
+        with self.trace('Draft', requested=f'{size[0]}x{size[1]}') as span:
+            self.img_pillow.draft(self.img_pillow.mode, size)
+            span.set_attribute('decoded', '{}x{}'.format(*self.img_pillow.size))
+
+    @staticmethod
+    def __downscale_size(width: int, height: int, size: int) -> tuple:
+        """
+        Computes the dimensions of an image bounded to a long edge size, preserving its aspect ratio. Images are never
+        upscaled.
+        :param width: integer. Image width in pixels.
+        :param height: integer. Image height in pixels.
+        :param size: integer. Long edge size in pixels.
+        :return: tuple. Bounded width and height.
+        """
+
+        scale = min(1.0, size / max(width, height))
+        return max(1, round(width * scale)), max(1, round(height * scale))
+
+    @classmethod
+    def __downscale(cls, image, size: int):
+        """
+        Resamples an image to a long edge size, preserving its aspect ratio.
+        :param image: Image. Pillow Image object, left untouched.
+        :param size: integer. Long edge size in pixels.
+        :return: Image. Downscaled Pillow Image object, or given one if already within bounds.
+        """
+
+        target = cls.__downscale_size(*image.size, size)
+        if target == image.size: return image
+        return image.resize(target, getattr(getattr(Image, 'Resampling', Image), 'LANCZOS'))
+
+    def __get_orientation(self):
+        """
+        Reads the EXIF Orientation tag alone, without decoding the rest of the EXIF tree.
+        :return: integer, None if absent.
+        """
+
+        try:
+            return self.img_pillow.getexif().get(self.ORIENTATION)
+        except Exception:
+            return None
@@ -1,3 +1,5 @@
+import io
+
 from interfaces.cloud_function_phase import CloudFunctionPhase
 
 
@@ -18,7 +20,7 @@ class LoadImage(CloudFunctionPhase):
 
         self.repository = repository          # :*: File repository.
         self.key = key                        # :str: File name.
-        self.img_bytes_io = None              # :BytesIO: Retrieved image in BytesIO form.
+        self.img_bytes_io = None              # :SpooledTemporaryFile: Retrieved image, spilled to disk if large.
 
         # Initializes APIPhase superclass parameters and procedures
         super(LoadImage, self).__init__(prefix='LI', phase_name='Load image', invocation_id=invocation_id)
@@ -41,17 +43,19 @@ class LoadImage(CloudFunctionPhase):
         :return: boolean. Value expresses whether procedure has executed successfully or not.
         """
 
-        # Acquire image from repository to BytesIO format.
-        status, response, img_bytes_io = self.repository.load_file_as_bytes_io(self.key)
+        # Stream image from repository into a seekable file, kept in memory unless large.
+        status, response, img_bytes_io = self.repository.load_file_as_spooled(self.key)
 
         # If unable to load image, log and abort.
         if not status:
-            self.log(self.rsc.IMAGE_LOAD_API_FAIL.format(response))
+            self.log(self.rsc.IMAGE_LOAD_API_FAIL, response, level=self.ERROR)
             return False
 
         # Procedure successful
         self.img_bytes_io = img_bytes_io
-        self.log(self.rsc.IMAGE_LOAD_API_CONTACTED.format(response))
+        self.set_metrics_attribute('bytes_in', img_bytes_io.seek(0, io.SEEK_END))
+        img_bytes_io.seek(0)
+        self.log(self.rsc.IMAGE_LOAD_API_CONTACTED, response)
         return True
 
 
@@ -1,7 +1,8 @@
 from io import BytesIO
 
+from handlers.s3_generate_thumbnail.image_processing import ImageProcessing
 from interfaces.cloud_function_phase import CloudFunctionPhase
-from services.aws_s3_dao import AWSS3
+from services.service_backends import ServiceBackends
 
 
 class SaveImage(CloudFunctionPhase):
@@ -10,23 +11,25 @@ class SaveImage(CloudFunctionPhase):
     and evaluating the response.
     """
 
-    def __init__(self, img_bytes: bytes,  img_ext: str, invocation_id: str):
+    def __init__(self, img_bytes: bytes,  img_ext: str, invocation_id: str, size: int = ImageProcessing.SMALL_SIZE):
         """
         Constructor of the save image object, stores provided and locally generated data, runs main object
         procedure.
         :param img_bytes: pre-processed image in bytes form.
         :param img_ext: string containing image extension (type).
         :param invocation_id: string containing id of current cloud function invocation to be to be used by API metrics.
+        :param size: integer. Derivative long edge size in pixels, naming the stored file.
         """
 
         self.img_bytes = img_bytes                      # :str: Client provided image in bytes form.
         self.img_ext = img_ext                          # :str: Image type/extension.
+        self.size = size                                # :int: Derivative long edge size.
         self.file_name = None                           # :str: Stored image final name.
         self.img_size = None                            # :str: Stored image size.
-        self.repository = AWSS3(self.env.THUMBNAIL_BUCKET_NAME)   # :AWSS3: File repository.
+        self.repository = ServiceBackends.s3(self.env.THUMBNAIL_BUCKET_NAME)   # :AWSS3: File repository.
 
         # Initializes APIPhase superclass parameters and procedures
-        super(SaveImage, self).__init__(prefix='SI', phase_name='Save image', invocation_id=invocation_id)
+        super(SaveImage, self).__init__(prefix='SI', phase_name=f'Save image {size}', invocation_id=invocation_id)
 
     def run(self) -> bool:
         """
@@ -35,7 +38,7 @@ class SaveImage(CloudFunctionPhase):
         """
 
         # Build stored image name.
-        self.file_name = f'{self.invocation_id}-{self.env.SMALL_THUMBNAIL_SUFFIX}.{self.img_ext}'
+        self.file_name = ImageProcessing.get_file_name(self.invocation_id, self.size, self.img_ext)
 
         # Execute request on image saving infrastructure, abort if impossible.
         if not self.__save_image(): return False
@@ -55,11 +58,12 @@ class SaveImage(CloudFunctionPhase):
         # If unable to save image, fill up return object and abort.
         if not status:
             error_response = self.err.UNABLE_TO_CONTACT_BLOB_STORAGE_API
-            self.log(error_response.aws_log.format(response))
+            self.log(error_response.aws_log, response, level=self.ERROR)
             return False
 
         # Procedure successful
-        self.log(self.rsc.IMAGE_SAVE_API_CONTACTED.format(self.img_size, response))
+        self.set_metrics_attribute('bytes_out', len(self.img_bytes))
+        self.log(self.rsc.IMAGE_SAVE_API_CONTACTED, self.img_size, response)
         return True
 
 
@@ -5,25 +5,26 @@ from interfaces.cloud_function_phase import CloudFunctionPhase
 
 class Validation(CloudFunctionPhase):
     """
-    Validation object class, responsible for validating and exposing data retrieved from a cloud queue
-    service (event dictionary).
+    Validation object class, responsible for validating and exposing data retrieved from a single record of a blob
+    storage event. Each record is validated on its own, under the invocation Id derived from its key.
     """
 
-    def __init__(self, event: dict):
+    def __init__(self, record: dict):
         """
         Constructor of the Validation object, stores client provided and decoded data.
-        :param event: AWS event dictionary.
+        :param record: AWS S3 event record dictionary.
         """
 
-        self.event = event                          # :dict: AWS Event object.
+        self.record = record                        # :dict: AWS S3 event record.
         self.origin_bucket = None                   # :str: Image storage bucket name.
         self.destin_bucket = None                   # :str: Image storage bucket name.
         self.file_name = None                       # :str: Image stored file name.
+        self.derivative = False                     # :bool: Whether stored file is a derivative, not an original.
         self.new_entry = {}                         # :dict: Acquired log data.
 
-        # Attempts to extract invocation id from event object.
+        # Attempts to extract invocation id from event record.
         invocation_id = \
-            self.event.get('Records', [{}])[0].get('s3', {}).get('object', {}).get('key').split('.')[0].split('/')[-1]
+            str(self.record.get('s3', {}).get('object', {}).get('key', '')).split('.')[0].split('/')[-1] or None
 
         # Initializes APIPhase superclass parameters and procedures
         super(Validation, self).__init__(prefix='VL', phase_name='Validation', invocation_id=invocation_id)
@@ -48,14 +49,18 @@ class Validation(CloudFunctionPhase):
 
         # Extracts information from newly acquired request object.
         try:
-            record = self.event['Records'][0]
-            self.origin_bucket = record['s3']['bucket']['name']
+            self.origin_bucket = self.record['s3']['bucket']['name']
             self.destin_bucket = self.env.THUMBNAIL_BUCKET_NAME
-            self.file_name = record['s3']['object']['key']
+            self.file_name = self.record['s3']['object']['key']
         except Exception as e:
-            self.log(self.rsc.INEXISTENT_NEW_ENTRY.format(str(e)))
+            self.log(self.rsc.INEXISTENT_NEW_ENTRY, e, level=self.ERROR)
             return False
 
+        # Display originals are stored next to their oversized original, whose thumbnail is generated on its own.
+        if self.invocation_id.endswith(f'-{self.env.DISPLAY_SUFFIX}'):
+            self.derivative = True
+            self.log(self.rsc.THUMBNAIL_DERIVATIVE_SKIPPED, self.file_name)
+
         # Process completed successfully, log and return true.
         self.log(self.rsc.VALIDATION_EXTRACTED_BODY_PAYLOAD)
         return True
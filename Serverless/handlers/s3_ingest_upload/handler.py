@@ -0,0 +1,39 @@
+# Imported first, so that it times the initialization imports that follow.
+import services.cold_start
+
+from handlers.http_add_picture.phases import add_picture_phases
+from handlers.s3_ingest_upload.validation import Validation
+from interfaces.cloud_function_phase import CloudFunctionPhase as Cfp
+from interfaces.pipeline import Pipeline
+from interfaces.record_batch import RecordBatch
+
+
+@Cfp.handler('INGEST UPLOAD')
+def ingest_upload(event, context):
+
+    # Every uploaded picture of the event is processed on its own pipeline. Failures raise, so that the event is
+    # retried by the asynchronous invocation instead of leaving uploads unprocessed.
+    batch = RecordBatch(event)
+    batch.run(_ingest_record)
+    batch.raise_for_failures()
+
+
+def _ingest_record(record: dict) -> bool:
+    """
+    Processes, stores and queues a single uploaded picture as add_picture does.
+    :param record: dictionary. AWS S3 event record.
+    :return: boolean. Value expresses whether record has been processed successfully or not.
+    """
+
+    pl = Pipeline()
+
+    # Execute validation phase, loading the uploaded picture.
+    pl.add('vl', lambda r: Validation(record))
+
+    # Process, store and queue picture as add_picture does.
+    add_picture_phases(pl)
+
+    if not pl.run(): return False
+
+    Cfp.terminate_function(pl.phases['vl'].invocation_id)
+    return True
@@ -0,0 +1,92 @@
+from urllib.parse import unquote, unquote_plus
+
+from interfaces.cloud_function_phase import CloudFunctionPhase
+from services.service_backends import ServiceBackends
+
+
+class Validation(CloudFunctionPhase):
+    """
+    Validation object class, responsible for loading a directly uploaded picture, referenced by a single blob storage
+    event record, together with the details it was uploaded with, exposing them as the add_picture validation does.
+    """
+
+    def __init__(self, record: dict):
+        """
+        Constructor of the Validation object, stores event record provided data.
+        :param record: AWS S3 event record dictionary.
+        """
+
+        self.record = record                # :dict: AWS S3 event record.
+        self.bucket_name = None             # :str: Uploads bucket name.
+        self.file_name = None               # :str: Uploaded file name.
+        self.user_id = None                 # :str: Uploading user id.
+        self.img_name = None                # :str: Client provided name.
+        self.img_desc = None                # :str: Client provided image description.
+        self.img_bytes = None               # :bytes: Uploaded image.
+
+        # Uploads are named after the invocation Id that issued them.
+        invocation_id = unquote_plus(
+            self.record.get('s3', {}).get('object', {}).get('key', '')).split('/')[-1] or None
+
+        # Initializes APIPhase superclass parameters and procedures
+        super(Validation, self).__init__(prefix='VL', phase_name='Validation', invocation_id=invocation_id)
+
+    def run(self) -> bool:
+        """
+        Object's main procedure: extract information from event record and load uploaded picture.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        # Extract information from event record and abort if unable.
+        if not self.__extract_info_from_body(): return False
+
+        # Load uploaded picture and its details, abort if unable.
+        if not self.__load_upload(): return False
+
+        # Procedure successful
+        return True
+
+    def __extract_info_from_body(self) -> bool:
+        """
+        Double checks event record's fields and content existence and copies values to instance variables.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        # Extracts information from event record. Object keys are URL encoded on S3 events.
+        try:
+            self.bucket_name = self.record['s3']['bucket']['name']
+            self.file_name = unquote_plus(self.record['s3']['object']['key'])
+        except Exception as e:
+            self.log(self.rsc.INEXISTENT_NEW_ENTRY, e, level=self.ERROR)
+            return False
+
+        # Process completed successfully, log and return true.
+        self.log(self.rsc.VALIDATION_EXTRACTED_BODY_PAYLOAD)
+        return True
+
+    def __load_upload(self) -> bool:
+        """
+        Loads uploaded picture and the metadata it was signed with.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        # Attempts to load picture and metadata.
+        with self.trace('Load upload') as span:
+            status, response, self.img_bytes, metadata = \
+                ServiceBackends.s3(self.bucket_name).load_file_with_metadata(self.file_name)
+            span.set_attribute('bytes_in', len(self.img_bytes or b''))
+
+        # If unable to load picture, abort.
+        if not status:
+            self.log(self.rsc.IMAGE_LOAD_API_FAIL, response, level=self.ERROR)
+            return False
+
+        # Details were percent-encoded when signing the upload.
+        self.user_id = unquote(metadata.get('user-id', 'N.A.'))
+        self.img_name = unquote(metadata.get('img-name', 'N.A.'))
+        self.img_desc = unquote(metadata.get('img-desc', 'N.A.'))
+
+        # Process completed successfully, log and return true.
+        self.set_metrics_attribute('bytes_in', len(self.img_bytes))
+        self.log(self.rsc.IMAGE_LOAD_API_CONTACTED, response)
+        return True
@@ -1,5 +1,5 @@
 from interfaces.cloud_function_phase import CloudFunctionPhase
-from services.aws_rekognition import AWSRekognition
+from services.service_backends import ServiceBackends
 from handlers.sqs_celebrity_recognition.models.celebrity import Celebrity
 
 
@@ -23,7 +23,7 @@ class RecognizeCelebrity(CloudFunctionPhase):
         self.celebrities = []                             # :list: List of objects built from API response.
         self.orientation_correction = None                # :str: Recognition API orientation recommendation.
         self.recognition_response = None                  # :dict: Celebrity recognition API response.
-        self.recognition_service = AWSRekognition()       # :AWSRekognition: Celebrity recognition API.
+        self.recognition_service = ServiceBackends.rekognition()  # :AWSRekognition: Recognition API.
 
         # Initializes APIPhase superclass parameters and procedures
         super(RecognizeCelebrity, self).__init__(prefix='RE', phase_name='Recognition', invocation_id=invocation_id)
@@ -58,7 +58,7 @@ class RecognizeCelebrity(CloudFunctionPhase):
         # If unable, fill failed return object and abort.
         else:
             error_response = self.err.FAILED_REKOGNITION_REQUEST
-            self.log(error_response.aws_log.format(str(self.recognition_service.error)))
+            self.log(error_response.aws_log, self.recognition_service.error, level=self.ERROR)
             self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
             return False
 
@@ -72,7 +72,7 @@ class RecognizeCelebrity(CloudFunctionPhase):
         # If main property 'CelebrityFaces' not found in the response, fill up return object and abort execution.
         if not response.get('CelebrityFaces'):
             error_response = self.err.UNEXPECTED_REKOGNITION_RESPONSE_STRUCTURE
-            self.log(error_response.aws_log + str(response))
+            self.log(error_response.aws_log, response, level=self.ERROR)
             self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics())
             return False
 
@@ -99,6 +99,7 @@ class RecognizeCelebrity(CloudFunctionPhase):
         self.orientation_correction = response.get('OrientationCorrection', 'N.A.')
 
         # Log and return successful execution.
-        self.log(self.rsc.RECOGNITION_DIGESTED_RESPONSE.format(str(self.celebrities)))
-        self.log(self.rsc.RECOGNITION_ORIENTATION_RECOMMENDATION.format(str(self.orientation_correction)))
+        self.set_metrics_attribute('items', len(response['CelebrityFaces']))
+        self.log(self.rsc.RECOGNITION_DIGESTED_RESPONSE, self.celebrities, level=self.DEBUG)
+        self.log(self.rsc.RECOGNITION_ORIENTATION_RECOMMENDATION, self.orientation_correction)
         return True
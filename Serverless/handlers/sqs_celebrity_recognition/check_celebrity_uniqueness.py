@@ -1,8 +1,11 @@
-from interfaces.cloud_function_phase import CloudFunctionPhase
-from services.aws_dynamodb import AWSDynamoDB
+import asyncio
 
+from interfaces.async_cloud_function_phase import AsyncCloudFunctionPhase
+from services.async_adapter import AsyncAdapter
+from services.service_backends import ServiceBackends
 
-class CheckCelebrityUniqueness(CloudFunctionPhase):
+
+class CheckCelebrityUniqueness(AsyncCloudFunctionPhase):
     """
     Log saving object class, responsible for saving a given log in dictionary form to a persistent repository.
     """
@@ -14,7 +17,7 @@ class CheckCelebrityUniqueness(CloudFunctionPhase):
         :param invocation_id: string containing id of current cloud function invocation to be to be used by API metrics.
         """
 
-        self.repository = AWSDynamoDB(self.env.CELEBRITIES_TABLE_NAME)      # :AWSDynamoDB: Celebrities repository.
+        self.repository = AsyncAdapter(ServiceBackends.dynamodb(self.env.CELEBRITIES_TABLE_NAME))  # :AsyncAdapter: Repo.
         self.celebrities = celebrities                                      # :dict: data to be stored.
         self.user_id = user_id                                              # :str: User id.
         self.unique_celebs = []                                             # :list: Stores new celebs.
@@ -23,23 +26,26 @@ class CheckCelebrityUniqueness(CloudFunctionPhase):
         super(CheckCelebrityUniqueness, self).__init__(prefix='CD', phase_name='Check local celebrity data',
                                                        invocation_id=invocation_id)
 
-    def run(self):
+    async def run(self):
         """
         Object's main procedure: verifies service requirements and conditions, loads data.
         :return: boolean. Value expresses whether procedure has executed successfully or not.
         """
 
         # Checks database/table status and requirements.
-        if not self.__evaluate_conditions_and_requirements(): return False
+        if not await self.__evaluate_conditions_and_requirements(): return False
 
-        # Attempts to to detect is picture celebrity is new on local database, aborts if unable.
-        for celeb in self.celebrities:
-            if not self.__get_unique_celebrities(celeb): return False
+        # Attempts to to detect if picture celebrities are new on local database, all at once, aborts if unable.
+        uniqueness = await asyncio.gather(*[self.__is_unique_celebrity(x) for x in self.celebrities])
+        if None in uniqueness: return False
+        self.unique_celebs = [x for x, unique in zip(self.celebrities, uniqueness) if unique]
 
         # Procedure successful
+        self.set_metrics_attribute('items_in', len(self.celebrities))
+        self.set_metrics_attribute('items_out', len(self.unique_celebs))
         return True
 
-    def __evaluate_conditions_and_requirements(self) -> bool:
+    async def __evaluate_conditions_and_requirements(self) -> bool:
         """
         Evaluates repository status and requirements.
         :return: boolean. Value expresses whether procedure has executed successfully or not.
@@ -47,46 +53,46 @@ class CheckCelebrityUniqueness(CloudFunctionPhase):
 
         # Attempts to acquire repository description and details.
         try:
-            description = self.repository.evaluate_conditions_and_requirements()
+            description = await self.repository.evaluate_conditions_and_requirements()
 
         # Abort if impossible
         except Exception as e:
             error_response = self.err.UNABLE_TO_CONTACT_DATABASE
-            self.log(error_response.aws_log.format(str(e)))
+            self.log(error_response.aws_log, e, level=self.ERROR)
             return False
 
         # Procedure successful, log and return.
-        self.log(self.rsc.LOG_SAVE_DATABASE_DESCRIPTION.format(description))
+        self.log(self.rsc.LOG_SAVE_DATABASE_DESCRIPTION, description)
         return True
 
-    def __get_unique_celebrities(self, celeb) -> int:
+    async def __is_unique_celebrity(self, celeb: dict):
         """
         Retrieves entry count of a particular key combination.
-        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        :param celeb: dictionary. Recognized celebrity data.
+        :return: boolean or None. Whether celebrity is new on local database, None if unable to verify.
         """
 
         # Attempts to load data from repository.
         key_range = celeb['name'].lower().replace(' ', '-')
         try:
-            response = self.repository.load(self.user_id, range_key_equals=key_range)
+            response = await self.repository.load(self.user_id, range_key_equals=key_range)
 
         # Abort and return if impossible.
         except Exception as e:
-            self.log(self.rsc.LOG_LOAD_FAILED.format(str(e)))
-            return False
+            self.log(self.rsc.LOG_LOAD_FAILED, e, level=self.ERROR)
+            return None
 
         # Extract log count, abort if impossible.
         log_count = response.get('Count')
         if log_count is None:
-            self.log(self.rsc.UNABLE_TO_EXTRACT_LOG_COUNT)
-            return False
+            self.log(self.rsc.UNABLE_TO_EXTRACT_LOG_COUNT, level=self.ERROR)
+            return None
 
         # Check celebrity uniqueness.
         if log_count == 0:
-            self.log(self.rsc.UNIQUE_CELEBRITY.format(celeb['name'], log_count, self.user_id, key_range))
-            self.unique_celebs.append(celeb)
-        else:
-            self.log(self.rsc.DUPLICATED_CELEBRITY.format(celeb['name'], log_count, self.user_id, key_range))
+            self.log(self.rsc.UNIQUE_CELEBRITY, celeb['name'], log_count, self.user_id, key_range)
+            return True
 
-        return True
+        self.log(self.rsc.DUPLICATED_CELEBRITY, celeb['name'], log_count, self.user_id, key_range)
+        return False
 
@@ -1,80 +1,125 @@
+# Imported first, so that it times the initialization imports that follow.
+import services.cold_start
+
+import copy
+
 from handlers.sqs_celebrity_recognition.celebrity_recognition import RecognizeCelebrity
 from handlers.sqs_celebrity_recognition.check_celebrity_uniqueness import CheckCelebrityUniqueness
+from handlers.sqs_celebrity_recognition.load_recognition import LoadRecognition
 from handlers.sqs_celebrity_recognition.validation import Validation
 from interfaces.save_log import SaveLog
 from interfaces.cloud_function_phase import CloudFunctionPhase as Cfp
-from services.aws_dynamodb import AWSDynamoDB
-from services.aws_sqs import AWSSQS
+from interfaces.pipeline import Pipeline
+from interfaces.record_batch import RecordBatch
+from services.service_backends import ServiceBackends
 
 
+@Cfp.handler('CELEBRITY RECOGNITION')
 def celeb_recognition(event, context):
 
-    print('.')
-    print('+------------------------------------------+')
-    print('| . . . . . CELEBRITY RECOGNITION . . . . .|')
-    print('+------------------------------------------+')
+    # Every queued picture is processed on its own pipeline, only failed messages being redelivered.
+    batch = RecordBatch(event)
+    batch.run(_recognize_record)
+    return batch.get_batch_item_failures()
+
+
+def _recognize_record(record: dict) -> bool:
+    """
+    Recognizes the celebrities of a single queued picture, saving its log and any newly found celebrity.
+    :param record: dictionary. AWS SQS event record.
+    :return: boolean. Value expresses whether record has been processed successfully or not.
+    """
+
+    pl = Pipeline()
 
     # Execute validation phase
-    vl = Validation(event)
-    if not vl.status: return
+    pl.add('vl', lambda r: Validation(record))
 
-    # Execute celebrity recognition phase
-    rc = RecognizeCelebrity(vl.bucket_name, vl.file_name, vl.invocation_id)
-    if not rc.status: return
+    # Execute celebrity recognition phase, reusing the original's results for duplicate uploads.
+    pl.add('rc', lambda r: _recognize(r['vl']), depends_on=['vl'])
 
     # Build and save picture log.
-    pic_log = vl.new_entry
-    pic_log['celebrities'] = rc.celebrities
-    # pic_log['celebrities'] = [{'name': 'TEST', 'table_id': 'test', 'recognition_id': 'TEST', 'bounding_box': {},
-    #                            'urls': []}]
-    pic_log['orientation_correction'] = rc.orientation_correction
-    # pic_log['orientation_correction'] = 'TEST_ROTATION'
-    if 'api_metrics' not in pic_log: pic_log['api_metrics'] = {}
-    pic_log['api_metrics']['celebrity_recognition'] = vl.get_metrics(vl.invocation_id)
-
-    spl = SaveLog(
-        repository=AWSDynamoDB(Cfp.env.PICTURES_TABLE_NAME),
-        data=pic_log,
+    pl.add('spl', lambda r: SaveLog(
+        repository=ServiceBackends.dynamodb(Cfp.env.PICTURES_TABLE_NAME),
+        data=_build_picture_log(r['vl'], r['rc']),
         prefix='SP',
         phase_name='Save picture log',
-        invocation_id=vl.invocation_id
-    )
-    if not spl.status: return
+        invocation_id=r['vl'].invocation_id
+    ), depends_on=['vl', 'rc'])
 
-    # Check if local celebrity data exists
-    ccu = CheckCelebrityUniqueness(vl.new_entry['user_id'], pic_log['celebrities'], vl.invocation_id)
-    if not ccu.status: return
+    # Check if local celebrity data exists, concurrently with picture log saving. Reused results were already checked.
+    pl.add('ccu', lambda r: None if getattr(r['rc'], 'reused', False) else CheckCelebrityUniqueness(
+        r['vl'].new_entry['user_id'], r['rc'].celebrities, r['vl'].invocation_id), depends_on=['vl', 'rc'])
 
-    # Save new celebrities if applicable.
-    for celeb in ccu.unique_celebs:
+    # Malformed messages are consumed, failing again on redelivery otherwise.
+    if not pl.run(): return RecordBatch.get_outcome(pl, permanent=(Validation,))
+    vl, ccu = pl.phases['vl'], pl.phases['ccu']
+
+    # Save new celebrities if applicable, concurrently, then queue them all at once for scraping.
+    pl = Pipeline()
+    data_to_be_queued = []
+    for i, celeb in enumerate(ccu.unique_celebs if ccu else []):
         new_celeb_entry = {
             'user_id': vl.new_entry['user_id'],
             'celebrity_id': celeb['name'].lower().replace(' ', '-'),
             'recognition_data': celeb
         }
-        scl = SaveLog(
-            repository=AWSDynamoDB(Cfp.env.CELEBRITIES_TABLE_NAME),
-            data=new_celeb_entry,
+        pl.add(f'scl-{i}', lambda r, data=new_celeb_entry: SaveLog(
+            repository=ServiceBackends.dynamodb(Cfp.env.CELEBRITIES_TABLE_NAME),
+            data=data,
             prefix='SC',
             phase_name='Save celebrity log',
             invocation_id=vl.invocation_id
-        )
-        if not scl.status: return
+        ))
 
-        # Save to queue
-        data_to_be_queued = {
-            'user_id': pic_log['user_id'],
+        data_to_be_queued.append({
+            'user_id': vl.new_entry['user_id'],
             'celebrity': celeb,
             'invocation_id': vl.invocation_id
-        }
-        sq = SaveLog(
-            repository=AWSSQS(Cfp.env.QUEUE_BASE_URL, Cfp.env.WEB_SCRAP_QUEUE_NAME),
+        })
+
+    # Save to queue, in batches.
+    if data_to_be_queued:
+        pl.add('sq', lambda r: SaveLog(
+            repository=ServiceBackends.sqs(Cfp.env.QUEUE_BASE_URL, Cfp.env.WEB_SCRAP_QUEUE_NAME),
             data=data_to_be_queued,
             prefix='SQ',
             phase_name='Save to queue',
             invocation_id=vl.invocation_id
-        )
-        if not sq.status: return
+        ), depends_on=[f'scl-{i}' for i in range(len(data_to_be_queued))])
+
+    if not pl.run(): return False
 
     Cfp.terminate_function(vl.invocation_id)
+    return True
+
+
+def _recognize(vl: Validation):
+    """
+    Loads the recognition results of the original picture if queued entry is a duplicate upload, recognizing the
+    picture if it isn't or if the original hasn't been recognized.
+    :param vl: Validation phase.
+    :return: LoadRecognition or RecognizeCelebrity phase.
+    """
 
+    if vl.new_entry.get('duplicate_of'):
+        lr = LoadRecognition(vl.new_entry['user_id'], vl.new_entry['duplicate_of'], vl.invocation_id)
+        if lr.found: return lr
+    return RecognizeCelebrity(vl.bucket_name, vl.file_name, vl.invocation_id)
+
+
+def _build_picture_log(vl: Validation, rc: RecognizeCelebrity) -> dict:
+    """
+    Assembles the picture log from the queued entry and the recognition results.
+    :param vl: Validation phase.
+    :param rc: RecognizeCelebrity phase.
+    :return: dictionary.
+    """
+
+    # Celebrities are copied, as the repository converts the saved structure in place while other phases read it.
+    pic_log = dict(vl.new_entry)
+    pic_log['celebrities'] = copy.deepcopy(rc.celebrities)
+    pic_log['orientation_correction'] = rc.orientation_correction
+    pic_log['api_metrics'] = dict(pic_log.get('api_metrics', {}))
+    pic_log['api_metrics']['celebrity_recognition'] = vl.get_metrics_snapshot()
+    return pic_log
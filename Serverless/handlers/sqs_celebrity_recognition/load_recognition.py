@@ -0,0 +1,55 @@
+from interfaces.cloud_function_phase import CloudFunctionPhase
+from services.service_backends import ServiceBackends
+
+
+class LoadRecognition(CloudFunctionPhase):
+    """
+    Recognition reuse object class, responsible for loading the recognition result of the picture a duplicate upload
+    points at, instead of contacting the recognition API again. Exposes the same results as RecognizeCelebrity;
+    'found' is False if the original picture hasn't been recognized (yet), in which case recognition is required.
+    """
+
+    reused = True                                             # :bool: Flags recognition results as reused.
+
+    def __init__(self, user_id: str, picture_id: str, invocation_id: str):
+        """
+        Constructor of the recognition reuse object, stores provided data and instantiates pictures repository.
+        :param user_id: string. Picture owner id.
+        :param picture_id: string. Id of the original picture.
+        :param invocation_id: string containing id of current cloud function invocation to be to be used by API metrics.
+        """
+
+        self.user_id = user_id                                  # :str: Picture owner id.
+        self.picture_id = picture_id                            # :str: Original picture id.
+        self.found = False                                      # :bool: Whether original recognition was found.
+        self.celebrities = []                                   # :list: Original picture's celebrities.
+        self.orientation_correction = None                      # :str: Original orientation recommendation.
+        self.repository = ServiceBackends.dynamodb(self.env.PICTURES_TABLE_NAME)  # :AWSDynamoDB: Pictures repo.
+
+        # Initializes APIPhase superclass parameters and procedures
+        super(LoadRecognition, self).__init__(prefix='LR', phase_name='Load recognition', invocation_id=invocation_id)
+
+    def run(self) -> bool:
+        """
+        Object's main procedure: loads original picture log.
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+
+        try:
+            self.repository.evaluate_conditions_and_requirements()
+            response = self.repository.load(self.user_id, range_key_equals=self.picture_id)
+        except Exception as e:
+            self.log(self.rsc.LOG_LOAD_FAILED, e, level=self.WARNING)
+            return True
+
+        original = next(iter(response.get('Items') or []), {})
+        if 'celebrities' not in original:
+            self.log(self.rsc.DEDUP_RECOGNITION_NOT_FOUND, self.picture_id)
+            return True
+
+        self.found = True
+        self.celebrities = original['celebrities']
+        self.orientation_correction = original.get('orientation_correction', 'N.A.')
+        self.set_metrics_attribute('items', len(self.celebrities))
+        self.log(self.rsc.DEDUP_RECOGNITION_REUSED, self.picture_id, len(self.celebrities))
+        return True
@@ -1,9 +1,11 @@
-import threading, time, random, requests
-from requests.exceptions import *
+import threading, time, random
 
 from handlers.sqs_web_scraper.user_agent_randomizer import UserAgentRandomizer
 from interfaces.cloud_function_phase import CloudFunctionPhase
-from bs4 import BeautifulSoup
+from services.lazy_import import LazyModule
+
+requests = LazyModule('requests')
+bs4 = LazyModule('bs4')
 
 
 class GetProxy(CloudFunctionPhase):
@@ -98,8 +100,7 @@ class GetProxy(CloudFunctionPhase):
         except Exception as e:
             te_request = str(round(time.time() - ts_request, 3)) + 's'
             self.lock.acquire()
-            self.log(self.rsc.UNABLE_TO_CONNECT_TO_PROXIES_PROVIDER.format(url, te_request,
-                                                                           str(e)))
+            self.log(self.rsc.UNABLE_TO_CONNECT_TO_PROXIES_PROVIDER, url, te_request, e, level=self.ERROR)
             self.no_of_checked_proxy_lists += 1
             self.lock.release()
             return
@@ -109,7 +110,7 @@ class GetProxy(CloudFunctionPhase):
         te_request = str(round(time.time() - ts_request, 3)) + 's'
         ts_parsing = time.time()
         page_html = response.text
-        page_soup = BeautifulSoup(page_html, "html.parser")
+        page_soup = bs4.BeautifulSoup(page_html, "html.parser")
         proxy_count = 0
 
         # Iterates on associated scraping function (yield) to acquire proxy addresses.
@@ -127,19 +128,19 @@ class GetProxy(CloudFunctionPhase):
                 self.lock.release()
         except Exception as e:
             self.lock.acquire()
-            self.log(self.rsc.UNABLE_TO_SCRAP.format(url, str(e)))
+            self.log(self.rsc.UNABLE_TO_SCRAP, url, e, level=self.ERROR)
             self.lock.release()
 
         # Finishes procedure and informs developer of acquired results.
         te_parsing = str(round(time.time() - ts_parsing, 3)) + 's'
         self.lock.acquire()
         if len(self.selected_proxies) < self.NO_PROXIES_TO_GET:
-            self.log(self.rsc.PROXIES_FOUND.format(str(proxy_count), url, te_request, te_parsing))
+            self.log(self.rsc.PROXIES_FOUND, proxy_count, url, te_request, te_parsing)
             self.no_of_checked_proxy_lists += 1
         self.lock.release()
 
     @staticmethod
-    def __scrap_proxy_gather(page_soup: BeautifulSoup):
+    def __scrap_proxy_gather(page_soup: 'bs4.BeautifulSoup'):
         """
         Scraping function associated with URL 'https://proxygather.com' and possible subdomains.
         :param page_soup: Parsed BeautifulSoup object.
@@ -158,7 +159,7 @@ class GetProxy(CloudFunctionPhase):
             yield address
 
     @staticmethod
-    def __scrap_nn_time(page_soup: BeautifulSoup):
+    def __scrap_nn_time(page_soup: 'bs4.BeautifulSoup'):
         """
         Scraping function associated with URL 'http://nntime.com/' and possible subdomains.
         :param page_soup: Parsed BeautifulSoup object.
@@ -179,7 +180,7 @@ class GetProxy(CloudFunctionPhase):
             yield proxy
 
     @staticmethod
-    def __scrap_free_proxy_list(page_soup: BeautifulSoup):
+    def __scrap_free_proxy_list(page_soup: 'bs4.BeautifulSoup'):
         """
         Scraping function associated with URL 'https://free-proxy-list.net/' and possible subdomains.
         :param page_soup: Parsed BeautifulSoup object.
@@ -227,13 +228,12 @@ class GetProxy(CloudFunctionPhase):
             te_proxy_check = 'N.A.'
 
         if len(self.selected_proxies) >= self.NO_PROXIES_TO_GET:
-            self.log(self.rsc.PROXY_SELECTED.format(len(self.selected_proxies),
-                                                    str(len(self.proxies) - len(self.proxies_to_evaluate)),
-                                                    te_proxy_check))
+            self.log(self.rsc.PROXY_SELECTED, len(self.selected_proxies),
+                     len(self.proxies) - len(self.proxies_to_evaluate), te_proxy_check)
         elif te_procedure > self.PROCEDURE_TIMEOUT:
-            self.log(self.rsc.PROXY_ATTEMPTS_TIMED_OUT.format(len(self.selected_proxies), te_proxy_check))
+            self.log(self.rsc.PROXY_ATTEMPTS_TIMED_OUT, len(self.selected_proxies), te_proxy_check)
         elif all_proxy_lists_checked and no_proxies_left_to_evaluate:
-            self.log(self.rsc.NOTHING_MORE_TO_EVALUATE.format(te_proxy_check))
+            self.log(self.rsc.NOTHING_MORE_TO_EVALUATE, te_proxy_check)
 
     def __checker_worker(self):
         """
@@ -262,23 +262,23 @@ class GetProxy(CloudFunctionPhase):
                 if len(self.selected_proxies) >= self.NO_PROXIES_TO_GET or self.abort_workers_flag:
                     self.lock.release()
                     return
-                self.log(f"Acquired '{proxy}'.")
+                self.log(self.rsc.PROXY_ACQUIRED, proxy)
                 self.selected_proxies.append(proxy)
                 self.lock.release()
-            except ConnectTimeout as e:
+            except requests.exceptions.ConnectTimeout as e:
                 self.lock.acquire()
                 if len(self.selected_proxies) < self.NO_PROXIES_TO_GET:
-                    self.log(f"'{proxy}' timed out.")
+                    self.log(self.rsc.PROXY_TIMED_OUT, proxy, level=self.DEBUG)
                 self.lock.release()
-            except ProxyError as e:
+            except requests.exceptions.ProxyError as e:
                 self.lock.acquire()
                 if len(self.selected_proxies) < self.NO_PROXIES_TO_GET:
-                    self.log(f"'{proxy}' not contactable.")
+                    self.log(self.rsc.PROXY_NOT_CONTACTABLE, proxy, level=self.DEBUG)
                 self.lock.release()
             except Exception as e:
                 self.lock.acquire()
                 if len(self.selected_proxies) < self.NO_PROXIES_TO_GET:
-                    self.log(f"'{proxy}' exception: {str(e)}")
+                    self.log(self.rsc.PROXY_EXCEPTION, proxy, e, level=self.DEBUG)
                 self.lock.release()
             self.no_of_checked_proxies += 1
 
@@ -1,21 +1,39 @@
+# Imported first, so that it times the initialization imports that follow.
+import services.cold_start
+
 from handlers.sqs_web_scraper.get_proxy import GetProxy
 from handlers.sqs_web_scraper.validation import Validation
 from interfaces.cloud_function_phase import CloudFunctionPhase as Cfp
+from interfaces.pipeline import Pipeline
+from interfaces.record_batch import RecordBatch
 
 
+@Cfp.handler('WEB SCRAPER')
 def web_scraper(event, context):
 
-    print('.')
-    print('+------------------------------------------+')
-    print('| . . . . . . . . WEB SCRAPER . . . . . . .|')
-    print('+------------------------------------------+')
+    # Every queued celebrity is processed on its own pipeline, only failed messages being redelivered.
+    batch = RecordBatch(event)
+    batch.run(_scrap_record)
+    return batch.get_batch_item_failures()
+
+
+def _scrap_record(record: dict) -> bool:
+    """
+    Scraps the data of a single queued celebrity.
+    :param record: dictionary. AWS SQS event record.
+    :return: boolean. Value expresses whether record has been processed successfully or not.
+    """
+
+    pl = Pipeline()
 
     # Execute validation phase
-    vl = Validation(event)
-    if not vl.status: return
+    pl.add('vl', lambda r: Validation(record))
 
-    gp = GetProxy(vl.invocation_id)
-    if not gp.status: return
+    # Acquire working proxies
+    pl.add('gp', lambda r: GetProxy(r['vl'].invocation_id), depends_on=['vl'])
 
-    Cfp.terminate_function(vl.invocation_id)
+    # Malformed messages are consumed, failing again on redelivery otherwise.
+    if not pl.run(): return RecordBatch.get_outcome(pl, permanent=(Validation,))
 
+    Cfp.terminate_function(pl.phases['vl'].invocation_id)
+    return True
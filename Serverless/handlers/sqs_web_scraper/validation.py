@@ -4,24 +4,28 @@ from interfaces.cloud_function_phase import CloudFunctionPhase
 
 class Validation(CloudFunctionPhase):
     """
-    Validation object class, responsible for validating and exposing data retrieved from a cloud queue
-    service (event dictionary).
+    Validation object class, responsible for validating and exposing data retrieved from a single cloud queue
+    message (event record). Each message is validated on its own, under the invocation Id it carries.
     """
 
-    def __init__(self, event: dict):
+    def __init__(self, record: dict):
         """
         Constructor of the Validation object, stores client provided and decoded data.
-        :param event: AWS event dictionary.
+        :param record: AWS SQS event record dictionary.
         """
 
-        self.event = event                          # :dict: AWS Event object.
+        self.record = record                        # :dict: AWS SQS event record.
         self.user_id = None                         # :str: Request user id.
         self.table_id = None
         self.urls = []
         self.celebrity = None                       # :str: Celebrity to scrap.
 
         # Attempts to extract invocation Id from event object
-        invocation_id = json.loads(self.event.get('Records', [{}])[0].get('body', {})).get('invocation_id')
+        # Malformed messages are validated under a generated Id, failing validation.
+        try:
+            invocation_id = json.loads(self.record.get('body') or '{}').get('invocation_id')
+        except Exception:
+            invocation_id = None
 
         # Initializes APIPhase superclass parameters and procedures
         super(Validation, self).__init__(prefix='VL', phase_name='Validation', invocation_id=invocation_id)
@@ -46,13 +50,13 @@ class Validation(CloudFunctionPhase):
 
         # Extracts information from newly acquired request object.
         try:
-            new_entry = json.loads(self.event.get('Records', [{}])[0].get('body', {}))
+            new_entry = json.loads(self.record['body'])
             self.user_id = new_entry['user_id']
             self.celebrity = new_entry['celebrity']
             self.table_id = self.celebrity['table_id']
             self.urls = self.celebrity['urls']
         except Exception as e:
-            self.log(self.rsc.INEXISTENT_NEW_ENTRY.format(str(e)))
+            self.log(self.rsc.INEXISTENT_NEW_ENTRY, e, level=self.ERROR)
             return False
 
         # Process completed successfully, log and return true.
@@ -0,0 +1,65 @@
+from abc import abstractmethod
+
+from interfaces.cloud_function_phase import CloudFunctionPhase
+
+
+class AsyncCloudFunctionPhase(CloudFunctionPhase):
+    """
+    Asynchronous sibling of CloudFunctionPhase, for phases whose business logic is a coroutine. The phase is not run on
+    construction: awaiting the phase object runs it and evaluates to the phase itself, exposing the same status,
+    failure return object and metrics as synchronous phases, e.g.:
+
+        phase = await SomeAsyncPhase(data, invocation_id)
+        if not phase.status: return phase.failed_return_object
+    """
+
+    run_on_construction = False                          # :bool: Phase is run once awaited instead.
+
+    def __init__(self, prefix: str, phase_name: str, invocation_id: str = None):
+        """
+        Constructor of the AsyncCloudFunctionPhase superclass, stores client/subclass data and generates unique
+        invocation id if none has been provided, without running the phase.
+        :param prefix: string. Prefix for logging.
+        :param invocation_id: string. Unique execution identifier for metrics.
+        """
+
+        super(AsyncCloudFunctionPhase, self).__init__(prefix=prefix, phase_name=phase_name, invocation_id=invocation_id)
+
+    def __await__(self):
+        return self.__main().__await__()
+
+    async def __main(self):
+        """
+        Main API Phase procedure: measures phase time duration, awaits phase business logic, logs phase start and
+        end.
+        :return: AsyncCloudFunctionPhase. The phase itself.
+        """
+
+        # Start phase time counter.
+        self.span = self.start_metrics(self.phase_name)
+
+        # Log phase start
+        self.log(self.rsc.PHASE_START, self.phase_name)
+
+        # Run phase business logic. Phase time counter is stopped whatever the outcome, failed (or raising) phases
+        # being flagged on their span, abort if fails.
+        succeeded = False
+        try:
+            succeeded = await self.run()
+        finally:
+            if not succeeded: self.span.set_attribute('error', True)
+            elapsed = self.metrics.stop_span(self.span)
+        if not succeeded: return self
+
+        # Flag and log phase status as successful (true).
+        self.status = True
+        self.log(self.rsc.PHASE_SUCCESSFUL, self.phase_name, elapsed)
+        return self
+
+    @abstractmethod
+    async def run(self) -> bool:
+        """
+        Phase business logic coroutine (to be overridden by child phase classes).
+        :return: boolean. Value expresses whether procedure has executed successfully or not.
+        """
+        pass
@@ -1,8 +1,14 @@
+import asyncio
+import functools
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
 
 from interfaces.models.response_object import ResponseObject
 from services.api_metrics import ApiMetrics
+from services.aws_clients import AWSClients
+from services.cold_start import ColdStart
+from services.id_generator import IdGenerator
+from services.log_sink import LogSink
 from resources.environment_variables import EnvironmentVariables
 from resources.errors import Errors
 from resources.models.error import Error
@@ -16,10 +22,16 @@ class CloudFunctionPhase(ABC):
     interfaces for accessing the metrics API and logging. Serves as a factory for response objects.
     """
 
+    DEBUG = LogSink.DEBUG                                # :str: Log level for verbose diagnostic messages.
+    INFO = LogSink.INFO                                  # :str: Log level for general messages.
+    WARNING = LogSink.WARNING                            # :str: Log level for recoverable issues.
+    ERROR = LogSink.ERROR                                # :str: Log level for failures.
+
     err = Errors                                         # :Error: Contains error message objects.
     rsc = Strings                                        # :Strings: Contains general strings.
     env = EnvironmentVariables                           # :EnvironmentVariables: Contains environment variables.
     latest_invocation_id = None                          # :str: Latest acquired or generated invocation ID.
+    run_on_construction = True                           # :bool: Whether constructing the phase runs it.
 
     def __init__(self, prefix: str, phase_name: str, invocation_id: str = None):
         """
@@ -35,9 +47,11 @@ class CloudFunctionPhase(ABC):
         self.phase_name = phase_name                     # :str: Current API phase name.
         self.invocation_id = self.get_id(invocation_id)  # :str: Handles execution invocation Id for metrics.
         self.metrics = ApiMetrics                        # :ApiMetrics: Contains metrics measurement module.
+        self.span = None                                 # :Span: Tracer span measuring this phase.
 
         super().__init__()                               # Runs ABC abstract class initialization.
-        self.__main()                                    # Runs API Phase main procedure.
+        if self.run_on_construction:
+            self.__main()                                # Runs API Phase main procedure.
 
     def __main(self):
         """
@@ -47,21 +61,24 @@ class CloudFunctionPhase(ABC):
         """
 
         # Start phase time counter.
-        self.start_metrics(self.phase_name)
+        self.span = self.start_metrics(self.phase_name)
 
         # Log phase start
-        self.log(self.rsc.PHASE_START.format(self.phase_name))
-
-        # Run phase business logic, abort if fails.
-        if not self.run(): return
-
-        # Stop phase time counter.
-        elapsed = self.stop_metrics(self.phase_name)
+        self.log(self.rsc.PHASE_START, self.phase_name)
+
+        # Run phase business logic. Phase time counter is stopped whatever the outcome, failed (or raising) phases
+        # being flagged on their span, abort if fails.
+        succeeded = False
+        try:
+            succeeded = self.run()
+        finally:
+            if not succeeded: self.span.set_attribute('error', True)
+            elapsed = self.metrics.stop_span(self.span)
+        if not succeeded: return
 
         # Flag and log phase status as successful (true).
         self.status = True
-        self.log(self.rsc.PHASE_SUCCESSFUL.format(self.phase_name, elapsed))
-        print('.')
+        self.log(self.rsc.PHASE_SUCCESSFUL, self.phase_name, elapsed)
 
     @abstractmethod
     def run(self) -> bool:
@@ -77,7 +94,8 @@ class CloudFunctionPhase(ABC):
                           msg_dev: str = 'N.A.',
                           msg_user: str = 'N.A.',
                           img_meta_data: dict = {},
-                          api_metrics: dict = {}) -> dict:
+                          api_metrics: dict = {},
+                          upload: dict = None) -> dict:
         """
         Builds default Response object according to provided parameters end returns it in dictionary form.
         :param status_code: integer. API response HTTP status code.
@@ -86,6 +104,7 @@ class CloudFunctionPhase(ABC):
         :param msg_user: string. Generic user oriented message describing status of response.
         :param img_meta_data: dictionary. Meta data extracted from sent image if available.
         :param api_metrics: dictionary. Time measurements of each API execution phase.
+        :param upload: dictionary. Direct upload url and form fields, if issued.
         :return:
         """
 
@@ -95,7 +114,8 @@ class CloudFunctionPhase(ABC):
             msg_dev=msg_dev,
             msg_user=msg_user,
             img_meta_data=img_meta_data,
-            api_metrics=api_metrics
+            api_metrics=api_metrics,
+            upload=upload
 
         ).__dict__
 
@@ -132,10 +152,10 @@ class CloudFunctionPhase(ABC):
         if invocation_id:
             return invocation_id
 
-        # If none has been provided, return a new one.
+        # If none has been provided, return a new, time sortable one.
         else:
-            invocation_id = datetime.now().strftime("%Y-%m-%d-%H-%M-%S-%f")
-            self.log(f"Generating new invocation ID: {invocation_id}")
+            invocation_id = IdGenerator.generate()
+            self.log(self.rsc.GENERATING_INVOCATION_ID, invocation_id)
             return invocation_id
 
     @classmethod
@@ -147,16 +167,62 @@ class CloudFunctionPhase(ABC):
         """
 
         _ = ApiMetrics.get(invocation_id)
-        print(cls.rsc.SUCCESSFUL_CLOUD_FUNCTION_EXECUTION.format(invocation_id))
+        LogSink.emit(cls.rsc.METRICS_STORE_STATUS.format(ApiMetrics.get_store_stats()), invocation_id=invocation_id)
+        LogSink.emit(cls.rsc.AWS_CLIENTS_STATUS.format(AWSClients.get_stats()), invocation_id=invocation_id)
+        LogSink.emit(cls.rsc.SUCCESSFUL_CLOUD_FUNCTION_EXECUTION.format(invocation_id), invocation_id=invocation_id)
 
-    def log(self, msg):
+    @staticmethod
+    def handler(title: str):
         """
-        Logs general messages on cloud logging system by concatenating phase prefix with provided message.
-        :param msg: string. Message to be logged.
+        Cloud function handler decorator: logs the handler banner and flushes buffered logs once the invocation
+        finishes, whichever path it returns through. The invocation is measured by a handler span parenting its phases
+        (batch records open their own). Phase latencies are attributed to the handler and the latency histograms are
+        emitted once due. Coroutine handlers are run to completion on an event loop, so they
+        can await asynchronous phases. The container's cold start report is emitted after its first invocation.
+        :param title: string. Handler title to be logged.
+        :return: decorator.
+        """
+
+        def decorator(func):
+            ColdStart.mark_ready(func.__name__)
+
+            @functools.wraps(func)
+            def wrapper(event, context):
+                LogSink.emit(title, event='handler_start')
+                token = ApiMetrics.latency.set_handler(func.__name__)
+                try:
+                    with ApiMetrics.tracer.span(None, title):
+                        if asyncio.iscoroutinefunction(func):
+                            return asyncio.run(func(event, context))
+                        return func(event, context)
+                finally:
+                    ApiMetrics.latency.reset_handler(token)
+                    ApiMetrics.latency.emit_if_due()
+                    ColdStart.report()
+                    LogSink.flush()
+            return wrapper
+        return decorator
+
+    def log(self, msg, *args, level: str = LogSink.INFO):
+        """
+        Logs general messages on cloud logging system, tagged with invocation Id, phase and elapsed invocation time.
+        Arguments are only stringified and formatted into the message if its level is enabled, and are truncated to
+        the sink's payload budget. Amount of bytes logged is accumulated on the phase span.
+        :param msg: string. Message to be logged, or message template if arguments are provided.
+        :param args: Arguments to be lazily formatted into the message template.
+        :param level: string. Message severity.
         :return: void.
         """
 
-        print(f'{self.prefix} - {msg}')
+        if not LogSink.is_enabled_for(level): return
+
+        invocation_id = getattr(self, 'invocation_id', None)
+        start_ns = self.metrics.tracer.get_start_ns(invocation_id) if invocation_id else None
+        elapsed_ms = round((time.perf_counter_ns() - start_ns) / 1e6, 3) if start_ns else None
+        size = LogSink.emit(msg, level, invocation_id=invocation_id, phase=self.phase_name, prefix=self.prefix,
+                            elapsed_ms=elapsed_ms, args=args)
+        if getattr(self, 'span', None) is not None:
+            self.span.add_to_attribute('log_bytes', size)
 
     def log_invocation_id(self):
         """
@@ -165,16 +231,38 @@ class CloudFunctionPhase(ABC):
         :return: void.
         """
 
-        self.log(f'Current invocation ID is: {self.invocation_id}')
+        self.log(self.rsc.CURRENT_INVOCATION_ID, self.invocation_id)
 
-    def start_metrics(self, metric):
+    def start_metrics(self, metric, **attributes):
         """
         Initiates time measurement of a particular phase of the API execution.
         :param metric: string. API procedure to be measured.
+        :param attributes: Initial span attributes.
+        :return: Span. Span measuring the procedure.
+        """
+
+        return self.metrics.start(self.invocation_id, metric, **attributes)
+
+    def trace(self, name: str, **attributes):
+        """
+        Opens a nested span under the current phase, to be used as a context manager around sub-procedures.
+        :param name: string. Sub-procedure name.
+        :param attributes: Initial span attributes (bytes in/out, item counts...).
+        :return: context manager yielding the opened Span.
+        """
+
+        return self.metrics.tracer.span(self.invocation_id, name, **attributes)
+
+    def set_metrics_attribute(self, key: str, value):
+        """
+        Attaches an attribute to the span measuring this phase.
+        :param key: string. Attribute name.
+        :param value: Attribute value.
         :return: void.
         """
 
-        self.metrics.start(self.invocation_id, metric)
+        if self.span is not None:
+            self.span.set_attribute(key, value)
 
     def stop_metrics(self, metric) -> float:
         """
@@ -207,4 +295,12 @@ class CloudFunctionPhase(ABC):
         else:
             return self.metrics.get_snapshot(invocation_id)
 
+    def get_metrics_trace(self, invocation_id: str = None) -> list:
+        """
+        Extracts current API metrics span tree.
+        :return: list. Root spans of this particular cloud function invocation, each containing nested spans.
+        """
+
+        return self.metrics.get_trace(invocation_id or self.invocation_id)
+
 
@@ -1,5 +1,6 @@
 import json
 
+from services.log_sink import LogSink
 
 class ResponseObject:
 
@@ -9,7 +10,8 @@ class ResponseObject:
                  msg_dev: str = 'N.A.',
                  msg_user: str = 'N.A.',
                  img_meta_data: dict = {},
-                 api_metrics: dict = {}
+                 api_metrics: dict = {},
+                 upload: dict = None
     ):
         self.statusCode = status_code
 
@@ -18,13 +20,15 @@ class ResponseObject:
             'Access-Control-Allow-Credentials': True,
         }
 
-        self.body = json.dumps({
+        body = {
             'response_code': response_code,
             'msg_dev': msg_dev,
             'msg_user': msg_user,
             'img_meta_data': img_meta_data,
             'api_metrics': api_metrics
-        })
+        }
+        if upload is not None: body['upload'] = upload
+        self.body = json.dumps(body)
 
-        print('RETURN - Return object: ' + str(self.__dict__))
+        LogSink.emit('RETURN - Return object: {}', args=(self.__dict__,))
 
@@ -0,0 +1,152 @@
+import asyncio
+import contextvars
+import inspect
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from resources.environment_variables import EnvironmentVariables
+from resources.errors import Errors
+from services.log_sink import LogSink
+
+
+class Pipeline:
+    """
+    Declarative cloud function phase pipeline. Handlers declare phases together with the phases whose data they depend
+    on; phases whose dependencies are met run concurrently, up to a per pipeline bound, on a thread pool shared by every
+    pipeline of the container (including those of concurrently processed batch records). Asynchronous phases are
+    awaited on their worker's own event loop. Pipelines are run from handler or record threads, never from within a
+    phase, as phases waiting on the shared pool could exhaust it. As soon as any phase fails, no
+    further phases are started and the failed phase's return object is exposed, mirroring the sequential
+    'if not phase.status: return' short-circuit. Phases failing without a return object of their own expose a generic
+    server error one instead, so that HTTP handlers always respond with a status code.
+    """
+
+    MAX_WORKERS = int(EnvironmentVariables.PIPELINE_MAX_WORKERS or 4)    # :int: Default phases running at once.
+    EXECUTOR_MAX_WORKERS = int(EnvironmentVariables.PIPELINE_EXECUTOR_MAX_WORKERS or 16)  # :int: Shared pool size.
+
+    __executor = None                                                   # :ThreadPoolExecutor: Lazily created pool.
+    __lock = threading.Lock()                                           # :Lock: Guards thread pool creation.
+
+    def __init__(self, max_workers: int = None):
+        """
+        Constructor of the pipeline object.
+        :param max_workers: integer. Maximum amount of phases running at once.
+        """
+
+        self.max_workers = max_workers or self.MAX_WORKERS  # :int: Maximum amount of phases running at once.
+        self.nodes = OrderedDict()                          # :OrderedDict: Phase name to (factory, dependencies).
+        self.phases = {}                                    # :dict: Phase name to finished phase object.
+        self.status = False                                 # :bool: Whether every declared phase succeeded.
+        self.failed_phase = None                            # :CloudFunctionPhase: First phase found to have failed.
+        self.failed_return_object = {}                      # :dict: Failed phase's return object.
+
+    def add(self, name: str, factory, depends_on: list = ()):
+        """
+        Declares a phase.
+        :param name: string. Unique phase name within the pipeline.
+        :param factory: callable. Receives the dictionary of finished phases and returns the executed phase object, or
+        an asynchronous phase object to be awaited.
+        :param depends_on: list. Names of the phases whose results this phase requires.
+        :return: Pipeline. Self, allowing chained declarations.
+        """
+
+        if name in self.nodes:
+            raise ValueError(f"Phase '{name}' already declared.")
+        for dependency in depends_on:
+            if dependency not in self.nodes:
+                raise ValueError(f"Phase '{name}' depends on undeclared phase '{dependency}'.")
+        self.nodes[name] = (factory, tuple(depends_on))
+        return self
+
+    def run(self) -> bool:
+        """
+        Executes declared phases respecting their dependencies.
+        :return: boolean. Value expresses whether all phases have executed successfully or not.
+        """
+
+        pending = OrderedDict(self.nodes)
+        running = {}
+        error = None
+        pool = type(self).get_executor()
+
+        while True:
+
+            # Starts every phase whose dependencies have succeeded, up to the pipeline's bound, unless the pipeline is
+            # short-circuiting.
+            if self.failed_phase is None and error is None:
+                for name in [k for k, (_, deps) in pending.items() if all(x in self.phases for x in deps)]:
+                    if len(running) >= self.max_workers: break
+                    factory, _ = pending.pop(name)
+                    context = contextvars.copy_context()
+                    running[pool.submit(context.run, self.__execute, factory, dict(self.phases))] = name
+
+            # Nothing left running: pipeline has finished or can't progress any further.
+            if not running: break
+
+            # Collects finished phases, flagging the first failure.
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    phase = future.result()
+                except Exception as e:
+                    error = error or e
+                    continue
+                if phase is not None and not phase.status:
+                    if self.failed_phase is None:
+                        self.failed_phase = phase
+                        self.failed_return_object = phase.failed_return_object or self.__get_default_return_object(
+                            phase)
+                    continue
+                self.phases[name] = phase
+
+        # Phase constructors raising is a programming error, let it surface as before.
+        if error is not None: raise error
+
+        self.status = self.failed_phase is None and not pending
+        return self.status
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        """
+        Provides the thread pool shared by all pipelines, created on first use and kept for the container's lifetime.
+        :return: ThreadPoolExecutor.
+        """
+
+        if cls.__executor is None:
+            with cls.__lock:
+                if cls.__executor is None:
+                    cls.__executor = ThreadPoolExecutor(max_workers=cls.EXECUTOR_MAX_WORKERS,
+                                                        thread_name_prefix='pipeline')
+        return cls.__executor
+
+    @staticmethod
+    def __get_default_return_object(phase) -> dict:
+        """
+        Builds the return object of a phase failed without providing one.
+        :param phase: CloudFunctionPhase. Failed phase.
+        :return: dictionary.
+        """
+
+        error_response = Errors.PHASE_FAILED
+        LogSink.emit(error_response.aws_log.format(phase.phase_name), level=LogSink.WARNING,
+                     invocation_id=phase.invocation_id)
+        return phase.get_failed_return_object(error_response, {}, phase.get_metrics_snapshot())
+
+    @staticmethod
+    def __execute(factory, phases: dict):
+        """
+        Builds a phase through its factory, running it to completion if it is asynchronous.
+        :param factory: callable. Phase factory.
+        :param phases: dictionary. Finished phases.
+        :return: CloudFunctionPhase. Executed phase object.
+        """
+
+        async def wait(awaitable):
+            return await awaitable
+
+        phase = factory(phases)
+        if inspect.isawaitable(phase):
+            phase = asyncio.run(wait(phase))
+        return phase
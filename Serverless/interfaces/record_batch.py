@@ -0,0 +1,118 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from resources.environment_variables import EnvironmentVariables
+from resources.strings_en import Strings
+from services.log_sink import LogSink
+from services.tracer import Tracer
+
+
+class RecordBatch:
+    """
+    Batched event processing. Each record of a queue or blob storage event is processed on its own, by a per record
+    procedure (usually running a phase pipeline under the record's own invocation Id), concurrently on a bounded
+    thread pool. Records succeed or fail independently: a failed or raising record doesn't affect its siblings, and
+    only failed queue messages are reported back for redelivery. Records failing permanently (e.g. malformed messages)
+    are consumed instead, as redelivering them would only fail again until they reach the dead letter queue.
+    """
+
+    MAX_WORKERS = int(EnvironmentVariables.RECORD_MAX_WORKERS or 4)    # :int: Default thread pool size.
+
+    def __init__(self, event: dict, max_workers: int = None):
+        """
+        Constructor of the record batch object.
+        :param event: dictionary. AWS event carrying a 'Records' list.
+        :param max_workers: integer. Maximum amount of records processed at once.
+        """
+
+        self.records = list(event.get('Records') or [])     # :list: Event records.
+        self.max_workers = max_workers or self.MAX_WORKERS  # :int: Maximum amount of records processed at once.
+        self.results = []                                   # :list: Whether each record succeeded, in record order.
+
+    def run(self, procedure) -> bool:
+        """
+        Processes every record.
+        :param procedure: callable. Receives a record and returns whether it has been processed successfully.
+        :return: boolean. Value expresses whether all records have been processed successfully or not.
+        """
+
+        # Each record runs on a copy of the handler's context, so that handler scoped context (e.g. latency
+        # attribution) reaches its phases.
+        workers = max(1, min(self.max_workers, len(self.records)))
+        contexts = [contextvars.copy_context() for _ in self.records]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            self.results = list(pool.map(lambda x, context: context.run(self.__process, procedure, x),
+                                         self.records, contexts))
+
+        # Failures are reported together.
+        failed = [self.get_identifier(x) for x in self.get_failed_records()]
+        LogSink.emit(Strings.BATCH_RECORDS_PROCESSED.format(len(self.records) - len(failed), len(self.records), failed),
+                     level=LogSink.ERROR if failed else LogSink.INFO)
+        return not failed
+
+    @staticmethod
+    def get_outcome(pl, permanent: tuple) -> bool:
+        """
+        Settles a record from the outcome of its phase pipeline.
+        :param pl: Pipeline. Record's already run pipeline.
+        :param permanent: tuple. Phase classes whose failure is permanent, the record being consumed rather than
+        redelivered.
+        :return: boolean. Value expresses whether record is to be considered processed or not.
+        """
+
+        if pl.status: return True
+        if isinstance(pl.failed_phase, permanent):
+            LogSink.emit(Strings.BATCH_RECORD_DISCARDED.format(pl.failed_phase.phase_name),
+                         invocation_id=pl.failed_phase.invocation_id, level=LogSink.WARNING)
+            return True
+        return False
+
+    def get_failed_records(self) -> list:
+        return [x for x, ok in zip(self.records, self.results) if not ok]
+
+    @staticmethod
+    def get_identifier(record: dict):
+        """
+        Identifies a record: queue message Id, or stored object key for blob storage records.
+        :param record: dictionary. Event record.
+        :return: string, None if unidentifiable.
+        """
+
+        return record.get('messageId') or record.get('s3', {}).get('object', {}).get('key')
+
+    def raise_for_failures(self):
+        """
+        Raises if any record failed, so that asynchronously invoked functions (blob storage events) are retried and,
+        once retries are exhausted, handed to their failure destination.
+        :return: void.
+        """
+
+        failed = [self.get_identifier(x) for x in self.get_failed_records()]
+        if failed:
+            raise RuntimeError(Strings.BATCH_RECORDS_FAILED.format(len(failed), len(self.records), failed))
+
+    def get_batch_item_failures(self) -> dict:
+        """
+        Builds the partial batch response of queue triggered functions, so that only failed messages are redelivered.
+        :return: dictionary.
+        """
+
+        return {'batchItemFailures': [{'itemIdentifier': x.get('messageId')} for x in self.get_failed_records()]}
+
+    @staticmethod
+    def __process(procedure, record: dict) -> bool:
+        """
+        Runs the per record procedure under a record span parenting its phases, a raising record being counted as
+        failed.
+        :param procedure: callable. Per record procedure.
+        :param record: dictionary. Event record.
+        :return: boolean. Value expresses whether record has been processed successfully or not.
+        """
+
+        identifier = RecordBatch.get_identifier(record)
+        with Tracer.span(None, 'Record', record=identifier):
+            try:
+                return bool(procedure(record))
+            except Exception as e:
+                LogSink.emit(Strings.BATCH_RECORD_RAISED.format(identifier, e), level=LogSink.ERROR)
+                return False
@@ -3,18 +3,20 @@ from interfaces.cloud_function_phase import CloudFunctionPhase
 
 class SaveLog(CloudFunctionPhase):
     """
-    Log saving object class, responsible for saving a given log in dictionary form to a persistent repository.
+    Log saving object class, responsible for saving a given log in dictionary form to a persistent repository. A list
+    of logs is saved at once, through the repository's batched save. Failure return objects carry a metrics snapshot,
+    as sibling phases may still be running on the invocation's trace.
     """
 
     def __init__(self, repository, data: dict, prefix: str, phase_name: str, invocation_id: str):
         """
         Constructor of the log saving object, stores provided data and instantiates log repository.
-        :param data: dictionary containing the data to be stored.
+        :param data: dictionary containing the data to be stored, or list of them.
         :param invocation_id: string containing id of current cloud function invocation to be to be used by API metrics.
         """
 
         self.repository = repository                                     # :*: log repository.
-        self.data = data                                                 # :dict: data to be stored.
+        self.data = data                                                 # :dict|list: data to be stored.
 
         # Initializes APIPhase superclass parameters and procedures
         super(SaveLog, self).__init__(prefix=prefix, phase_name=phase_name, invocation_id=invocation_id)
@@ -47,11 +49,12 @@ class SaveLog(CloudFunctionPhase):
         # Abort if impossible
         except Exception as e:
             error_response = self.err.UNABLE_TO_CONTACT_DATABASE
-            self.log(error_response.aws_log.format(str(e)))
+            self.log(error_response.aws_log, e, level=self.ERROR)
+            self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics_snapshot())
             return False
 
         # Procedure successful, log and return.
-        self.log(self.rsc.LOG_SAVE_DATABASE_DESCRIPTION.format(description))
+        self.log(self.rsc.LOG_SAVE_DATABASE_DESCRIPTION, description)
         return True
 
     def __save_log(self) -> bool:
@@ -62,14 +65,18 @@ class SaveLog(CloudFunctionPhase):
 
         # Attempts to save data on repository.
         try:
-            self.repository.save(self.data)
+            if isinstance(self.data, list):
+                self.repository.save_batch(self.data)
+            else:
+                self.repository.save(self.data)
 
         # Abort and return if impossible.
         except Exception as e:
             error_response = self.err.UNABLE_TO_SAVE_DATABASE
-            self.log(error_response.aws_log.format(str(e)))
+            self.log(error_response.aws_log, e, level=self.ERROR)
+            self.failed_return_object = self.get_failed_return_object(error_response, {}, self.get_metrics_snapshot())
             return False
 
         # Procedure successful, log and return.
-        self.log(self.rsc.LOG_SAVE_SUCCESSFUL.format(self.data))
+        self.log(self.rsc.LOG_SAVE_SUCCESSFUL, self.data, level=self.DEBUG)
         return True
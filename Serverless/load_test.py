@@ -0,0 +1,158 @@
+import argparse
+import io
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Local backends and their settings are read on import, so the environment is prepared before importing handlers.
+LOCAL_ENVIRONMENT = {
+    'SERVICE_BACKEND': 'local',
+    'BUCKET_NAME': 'local-pictures',
+    'THUMBNAIL_BUCKET_NAME': 'local-thumbnails',
+    'UPLOADS_BUCKET_NAME': 'local-uploads',
+    'PICTURES_TABLE_NAME': 'local-pictures',
+    'CELEBRITIES_TABLE_NAME': 'local-celebrities',
+    'PICTURE_HASHES_TABLE_NAME': 'local-picture-hashes',
+    'PUBLIC_IMG_BASE_ADDRESS': 'local://local-pictures/',
+    'PUBLIC_THUMBNAIL_BASE_ADDRESS': 'local://local-thumbnails/',
+    'SMALL_THUMBNAIL_SUFFIX': 'sml',
+    'THUMBNAIL_SIZES': '128,512,1280',
+    'DISPLAY_SUFFIX': 'display',
+    'QUEUE_BASE_URL': 'local://',
+    'ADD_PICTURE_QUEUE_NAME': 'local-add-pic',
+    'WEB_SCRAP_QUEUE_NAME': 'local-web_scrap',
+    'CREATE_CELEBRITY_QUEUE_NAME': 'local-create-celebrity',
+    'LOG_LEVEL': 'ERROR',
+    'LATENCY_EMIT_INTERVAL_SECONDS': '1e9'
+}
+
+
+class LoadTest:
+    """
+    Runs the picture pipeline (add picture, then optionally thumbnail generation and celebrity recognition) against
+    the in-process service backends, with configurable concurrency and simulated service conditions, and reports
+    end to end and per phase latency percentiles. Uploads are deduplicated per user by content hash, so the unique
+    workload adds every picture on behalf of a distinct user (full pipeline), while the duplicate workload adds the
+    same picture for the same user (duplicate short-circuit after the first invocation).
+    """
+
+    WORKLOADS = ['unique', 'duplicate']     # :list: Supported workloads.
+
+    def __init__(self, event: dict, invocations: int, concurrency: int, chain: bool, workload: str = 'unique'):
+        """
+        Constructor of the load test.
+        :param event: dictionary. Add picture event.
+        :param invocations: integer. Amount of pictures to be added.
+        :param concurrency: integer. Amount of pipelines running at once.
+        :param chain: boolean. Whether the queue/storage triggered handlers are to be run after each picture is added.
+        :param workload: string. 'unique' or 'duplicate' uploads.
+        """
+
+        # Imported here, once the environment has been prepared.
+        from handlers.http_add_picture.handler import add_picture
+        self.add_picture = add_picture
+        if chain:
+            from handlers.s3_generate_thumbnail.handler import generate_thumbnail
+            from handlers.sqs_celebrity_recognition.handler import celeb_recognition
+            self.generate_thumbnail = generate_thumbnail
+            self.celeb_recognition = celeb_recognition
+
+        self.event = {k: v for k, v in event.items() if k != 'invocation_id'}   # :dict: Fresh id per invocation.
+        self.invocations = invocations                                          # :int: Pictures to be added.
+        self.concurrency = concurrency                                          # :int: Pipelines at once.
+        self.chain = chain                                                      # :bool: Run downstream handlers.
+        self.workload = workload                                                # :str: Unique or duplicate uploads.
+        self.failures = 0                                                       # :int: Failed add picture calls.
+        self.lock = threading.Lock()                                            # :Lock: Guards failure counter.
+
+    def run(self) -> float:
+        """
+        Runs every invocation.
+        :return: float. Total elapsed time in seconds.
+        """
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            list(pool.map(self.run_pipeline, range(self.invocations)))
+        return time.perf_counter() - start
+
+    def run_pipeline(self, i: int):
+        from resources.environment_variables import EnvironmentVariables as env
+        from services.service_backends import ServiceBackends
+
+        # Unique uploads are added by a distinct user each, so that none of them takes the duplicate path.
+        event = dict(self.event)
+        if self.workload == 'unique':
+            event['user_id'] = f"{event.get('user_id', 'load-test')}+{i}"
+
+        response = self.add_picture(event, None)
+        if not response or response.get('statusCode') != 200:
+            with self.lock:
+                self.failures += 1
+            return
+        if not self.chain: return
+
+        # Feeds the picture stored and queued by this pipeline to the storage and queue triggered handlers.
+        queue = ServiceBackends.sqs(env.QUEUE_BASE_URL, env.ADD_PICTURE_QUEUE_NAME)
+        queue_event = queue.receive_event()
+        if queue_event is not None:
+            key = json.loads(queue_event['Records'][0]['body']).get('file_name')
+            record = {'s3': {'bucket': {'name': env.BUCKET_NAME}, 'object': {'key': key}}}
+            self.generate_thumbnail({'Records': [record]}, None)
+            self.celeb_recognition(queue_event, None)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Load tests the picture pipeline on local service backends.')
+    parser.add_argument('--event', default='tests/mock_add_picture_a.json', help='Add picture event JSON file.')
+    parser.add_argument('-n', '--invocations', type=int, default=50, help='Amount of pictures to be added.')
+    parser.add_argument('-c', '--concurrency', type=int, default=4, help='Pipelines running at once.')
+    parser.add_argument('--chain', action='store_true', help='Also run thumbnail and recognition handlers.')
+    parser.add_argument('--workload', choices=LoadTest.WORKLOADS, default='unique',
+                        help='Unique pictures (full pipeline) or duplicates of a single one (dedup short-circuit).')
+    parser.add_argument('--latency', default=None, help="Latency of every service, e.g. 'lognormal:3:0.5' (ms).")
+    parser.add_argument('--bandwidth', default=None, help='Bandwidth cap of every service, in Mbps.')
+    parser.add_argument('--error-rate', default=None, help='Failure probability of every service call.')
+    parser.add_argument('--seed', default=None, help='Random seed of the simulated conditions.')
+    args = parser.parse_args(args)
+
+    # Per service settings (LOCAL_S3_LATENCY...) already set on the environment take precedence.
+    for key, value in LOCAL_ENVIRONMENT.items():
+        os.environ.setdefault(key, value)
+    for service in ['S3', 'DYNAMODB', 'SQS', 'REKOGNITION']:
+        for suffix, value in [('LATENCY', args.latency), ('BANDWIDTH_MBPS', args.bandwidth),
+                              ('ERROR_RATE', args.error_rate)]:
+            if value is not None: os.environ.setdefault(f'LOCAL_{service}_{suffix}', value)
+    if args.seed is not None: os.environ.setdefault('LOCAL_SEED', args.seed)
+
+    with open(args.event, 'r') as f:
+        event = json.load(f)
+
+    test = LoadTest(event, args.invocations, args.concurrency, args.chain, args.workload)
+    elapsed = test.run()
+
+    # Phase latency histograms are collected through the regular EMF output, then summarized.
+    from aggregate_latency import LatencyAggregator
+    from services.latency_metrics import LatencyMetrics
+    from services.log_sink import LogSink
+    LogSink.flush()
+    LogSink.stream = io.StringIO()
+    LatencyMetrics.emit()
+    LogSink.flush()
+
+    aggregator = LatencyAggregator()
+    for line in LogSink.stream.getvalue().splitlines():
+        aggregator.feed(line)
+    LogSink.stream = None
+
+    print(f'{args.invocations} {args.workload} invocation(s), concurrency {args.concurrency}: {elapsed:.3f}s, '
+          f'{args.invocations / elapsed:.1f} pictures/s, {test.failures} failure(s).')
+    for row in aggregator.summary():
+        print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
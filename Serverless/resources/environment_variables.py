@@ -8,15 +8,50 @@ class EnvironmentVariables:
     BASE_NAME = __env_var.get('BASE_NAME')
     BUCKET_NAME = __env_var.get('BUCKET_NAME')
     THUMBNAIL_BUCKET_NAME = __env_var.get('THUMBNAIL_BUCKET_NAME')
+    UPLOADS_BUCKET_NAME = __env_var.get('UPLOADS_BUCKET_NAME')
     PICTURES_TABLE_NAME = __env_var.get('PICTURES_TABLE_NAME')
     CELEBRITIES_TABLE_NAME = __env_var.get('CELEBRITIES_TABLE_NAME')
+    PICTURE_HASHES_TABLE_NAME = __env_var.get('PICTURE_HASHES_TABLE_NAME')
     PUBLIC_IMG_BASE_ADDRESS = __env_var.get('PUBLIC_IMG_BASE_ADDRESS')
     PUBLIC_THUMBNAIL_BASE_ADDRESS = __env_var.get('PUBLIC_THUMBNAIL_BASE_ADDRESS')
     SMALL_THUMBNAIL_SUFFIX = __env_var.get('SMALL_THUMBNAIL_SUFFIX')
+    THUMBNAIL_SIZES = __env_var.get('THUMBNAIL_SIZES')
+    THUMBNAIL_FAST_DECODE = __env_var.get('THUMBNAIL_FAST_DECODE')
+    DISPLAY_SUFFIX = __env_var.get('DISPLAY_SUFFIX')
+    INGEST_MAX_PIXELS = __env_var.get('INGEST_MAX_PIXELS')
+    DISPLAY_MAX_PIXELS = __env_var.get('DISPLAY_MAX_PIXELS')
+    DISPLAY_MAX_MB = __env_var.get('DISPLAY_MAX_MB')
+    DISPLAY_MAX_EDGE = __env_var.get('DISPLAY_MAX_EDGE')
+    UPLOAD_MAX_SIZE_MB = __env_var.get('UPLOAD_MAX_SIZE_MB')
+    UPLOAD_URL_EXPIRATION_SECONDS = __env_var.get('UPLOAD_URL_EXPIRATION_SECONDS')
     QUEUE_BASE_URL = __env_var.get('QUEUE_BASE_URL')
     ADD_PICTURE_QUEUE_NAME = __env_var.get('ADD_PICTURE_QUEUE_NAME')
     WEB_SCRAP_QUEUE_NAME = __env_var.get('WEB_SCRAP_QUEUE_NAME')
     CREATE_CELEBRITY_QUEUE_NAME = __env_var.get('CREATE_CELEBRITY_QUEUE_NAME')
+    METRICS_STORE_MAX_ENTRIES = __env_var.get('METRICS_STORE_MAX_ENTRIES')
+    METRICS_STORE_TTL_SECONDS = __env_var.get('METRICS_STORE_TTL_SECONDS')
+    LOG_LEVEL = __env_var.get('LOG_LEVEL')
+    LOG_FORMAT = __env_var.get('LOG_FORMAT')
+    LOG_BUFFER_MAX_BYTES = __env_var.get('LOG_BUFFER_MAX_BYTES')
+    LOG_PAYLOAD_MAX_BYTES = __env_var.get('LOG_PAYLOAD_MAX_BYTES')
+    PIPELINE_MAX_WORKERS = __env_var.get('PIPELINE_MAX_WORKERS')
+    PIPELINE_EXECUTOR_MAX_WORKERS = __env_var.get('PIPELINE_EXECUTOR_MAX_WORKERS')
+    RECORD_MAX_WORKERS = __env_var.get('RECORD_MAX_WORKERS')
+    ASYNC_EXECUTOR_MAX_WORKERS = __env_var.get('ASYNC_EXECUTOR_MAX_WORKERS')
+    METRICS_NAMESPACE = __env_var.get('METRICS_NAMESPACE')
+    LATENCY_EMIT_INTERVAL_SECONDS = __env_var.get('LATENCY_EMIT_INTERVAL_SECONDS')
+    AWS_MAX_POOL_CONNECTIONS = __env_var.get('AWS_MAX_POOL_CONNECTIONS')
+    AWS_TCP_KEEPALIVE = __env_var.get('AWS_TCP_KEEPALIVE')
+    S3_MULTIPART_THRESHOLD_MB = __env_var.get('S3_MULTIPART_THRESHOLD_MB')
+    S3_PART_SIZE_MB = __env_var.get('S3_PART_SIZE_MB')
+    S3_MAX_CONCURRENCY = __env_var.get('S3_MAX_CONCURRENCY')
+    S3_SPOOL_MAX_MB = __env_var.get('S3_SPOOL_MAX_MB')
+    DYNAMODB_BATCH_MAX_ATTEMPTS = __env_var.get('DYNAMODB_BATCH_MAX_ATTEMPTS')
+    SQS_BATCH_MAX_ATTEMPTS = __env_var.get('SQS_BATCH_MAX_ATTEMPTS')
+    SERVICE_BACKEND = __env_var.get('SERVICE_BACKEND')
+    EXIF_TAGS = __env_var.get('EXIF_TAGS')
+    EXIF_MAX_BYTES = __env_var.get('EXIF_MAX_BYTES')
+    EXIF_BINARY = __env_var.get('EXIF_BINARY')
 
     @classmethod
     def get(cls, env_var):
@@ -75,3 +75,50 @@ class Errors:
         response_code=0
     )
 
+    INEXISTENT_USER_ID = Error(
+        aws_log='FAILED user_id request field validation.',
+        msg_dev='Invalid JSON content.',
+        msg_user='Unable to work with given information.',
+        status_code=400,
+        response_code=0
+    )
+
+    UNABLE_TO_DELETE_FROM_DATABASE = Error(
+        aws_log='ERROR: Unable to delete from database. Error: {}',
+        msg_dev='Unable to delete from database',
+        msg_user='Unable to delete user data.',
+        status_code=400,
+        response_code=0
+    )
+
+    UNABLE_TO_DELETE_FROM_BLOB_STORAGE = Error(
+        aws_log='ERROR: Unable to delete from blob storage. Error: {}',
+        msg_dev='Unable to delete from blob storage',
+        msg_user='Unable to delete user data.',
+        status_code=400,
+        response_code=0
+    )
+
+    UNSUPPORTED_CONTENT_TYPE = Error(
+        aws_log="FAILED content_type request field validation: '{}'",
+        msg_dev='Unsupported content type.',
+        msg_user='Unable to work with given file type.',
+        status_code=400,
+        response_code=0
+    )
+
+    IMAGE_EXCEEDS_INGEST_LIMIT = Error(
+        aws_log='FAILED ingest policy, image dimensions exceed the hard limit: {}',
+        msg_dev='Image dimensions exceed the ingest hard limit.',
+        msg_user='Sent image is too large.',
+        status_code=413,
+        response_code=0
+    )
+
+    PHASE_FAILED = Error(
+        aws_log="ERROR: '{}' phase failed without an error response.",
+        msg_dev='Unexpected phase failure.',
+        msg_user='Unable to process request.',
+        status_code=500,
+        response_code=0
+    )
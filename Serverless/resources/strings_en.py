@@ -1,21 +1,27 @@
 class Strings:
 
     PHASE_START = "'{}' phase initializing..."
-    PHASE_SUCCESSFUL = "'{}' phase completed. Elapsed: {}s."
+    PHASE_SUCCESSFUL = "'{}' phase completed. Elapsed: {:.6f}s."
 
     VALIDATION_EXTRACTED_BODY_PAYLOAD = 'Extracted payload from request object.'
     VALIDATION_DECODED_BASE64 = 'Decoded BASE64 image string to bytes.'
 
     PRE_PROC_CREATED_PILLOW_OBJECT = 'Pillow Image object created.'
     PRE_PROC_NO_ROTATION_NEEDED = 'No image rotation needed. (EXIF Orientation: {})'
-    PRE_PROC_ORIENTATION_MISMATCH_DETECTED = 'Image orientation mismatch type {} detected. Rotating image by {} ' \
-                                             'degrees counter-clockwise to compensate.'
+    PRE_PROC_ORIENTATION_MISMATCH_DETECTED = 'Image orientation mismatch type {} detected. Applying {} ' \
+                                             'transposition to compensate.'
     PRE_PROC_UNABLE_TO_UPDATE_BYTES = 'Could not update image bytes with newly rotated image: {}'
     PRE_PROC_NO_EXIF_ORIENTATION = 'No EXIF orientation found on image.'
     PRE_PROC_SUCCESSFULLY_ROTATED = 'Successfully updated image bytes with newly rotated image.'
+    PRE_PROC_ROTATION_RECORDED = 'Image orientation mismatch type {} detected. Keeping original bytes and their ' \
+                                 'EXIF orientation ({} transposition) for clients to apply.'
+    PRE_PROC_OVERSIZED_IMAGE = 'Image of {}x{} pixels and {} bytes exceeds display budget, keeping it untouched.'
+    PRE_PROC_DISPLAY_ORIGINAL_BUILT = 'Built display original of {}x{} pixels and {} bytes.'
+    PRE_PROC_EXIF_TAGS_OMITTED = '{} EXIF tags left out of projection (unlisted, binary or over budget), {} kept.'
 
     PROC_SUCCESSFULLY_GENERATED_TUMBNAIL = 'Generated {}x{} thumbnail from {}x{} sized image.'
     PROC_UNABLE_TO_GENERATE_TUMBNAIL = 'Unable to generate thumbnail: {}'
+    THUMBNAIL_DERIVATIVE_SKIPPED = 'Skipping derivative file {}, thumbnails are generated from originals.'
 
     RECOGNITION_API_CONTACTED = 'Contacted "recognize_celebrities" API.'
     RECOGNITION_STATUS_SUCCESS = '"recognize_celebrities" API response denotes success.'
@@ -27,6 +33,7 @@ class Strings:
     IMAGE_LOAD_API_CONTACTED = 'Loaded image from "S3" file storage API. Response: {}'
     IMAGE_LOAD_API_FAIL = 'Unable to load image from "S3" file storage API. Response: {}'
     IMAGE_SAVE_PUBLIC_URL = 'Image will be available at: {}'
+    UPLOAD_CREATED = 'Issued direct upload: {}'
 
     LOG_SAVE_DATABASE_DESCRIPTION = 'Database conditions/requirements: {}'
     LOG_SAVE_SUCCESSFUL = "Saved log to database: {}"
@@ -36,6 +43,14 @@ class Strings:
     UNIQUE_CELEBRITY = "'{}' is unique in this user's database. (Count: {} | Hash: '{}' | Range: '{}')"
     DUPLICATED_CELEBRITY = "'{}' already exists in this user's database. (Count: {} | Hash: '{}' | Range: '{}')"
 
+    DEDUP_NEW_CONTENT = "Picture content '{}' is new to this user."
+    DEDUP_DUPLICATE_FOUND = "Picture content '{}' duplicates picture '{}', reusing it."
+    DEDUP_INDEX_UNAVAILABLE = 'Content hash index unavailable, handling picture as new: {}'
+    DEDUP_REGISTERED = "Registered picture content '{}' as picture '{}'."
+    DEDUP_UNABLE_TO_REGISTER = 'Unable to register picture content hash: {}'
+    DEDUP_RECOGNITION_REUSED = "Reusing recognition of original picture '{}' ({} celebrities)."
+    DEDUP_RECOGNITION_NOT_FOUND = "Original picture '{}' hasn't been recognized yet, recognizing it."
+
     INAPPROPRIATE_EVENT_NAME = 'Ignoring inappropriate event type: {}'
     APPROPRIATE_EVENT_NAME = 'Proper event type detected, proceeding with execution: {}'
     UNEXPECTED_RESPONSE_STRUCTURE = 'ERROR: Unexpected response structure.'
@@ -50,14 +65,24 @@ class Strings:
     PROXY_SELECTED = "Proxies acquired: {}. Attempts: {}. Elapsed: {}"
     PROXY_UNABLE_TO_QUALIFY = "Unable to qualify proxy. Elapsed: {}"
     NOTHING_MORE_TO_EVALUATE = "Acquired data has been evaluated without result. Elapsed: {}"
+    PROXY_ACQUIRED = "Acquired '{}'."
+    PROXY_TIMED_OUT = "'{}' timed out."
+    PROXY_NOT_CONTACTABLE = "'{}' not contactable."
+    PROXY_EXCEPTION = "'{}' exception: {}"
 
     UNABLE_TO_DELETE_FROM_DATABASE = 'ERROR: Unable to delete from database: {}'
     DELETED_FROM_DATABASE = 'Data deleted from database. Id: {}'
-
+    PURGE_FILES_FOUND = "Found {} picture(s), {} file(s) and {} thumbnail(s) under user '{}'."
+    PURGE_DELETED_FILES = 'Deleted {} file(s) from blob storage. Response: {}'
+    PURGE_DELETED_ITEMS = "Deleted {} item(s) of user '{}' from '{}'."
+
+    METRICS_STORE_STATUS = 'Metrics store status: {}'
+    AWS_CLIENTS_STATUS = 'AWS clients registry status: {}'
+    GENERATING_INVOCATION_ID = 'Generating new invocation ID: {}'
+    CURRENT_INVOCATION_ID = 'Current invocation ID is: {}'
     SUCCESSFUL_CLOUD_FUNCTION_EXECUTION = 'FUNCTION EXECUTION COMPLETED UNDER INVOCATION ID: {}'
 
-
-
-
-
-
+    BATCH_RECORDS_PROCESSED = 'Processed {} of {} event record(s). Failed records: {}'
+    BATCH_RECORDS_FAILED = '{} of {} event record(s) failed: {}'
+    BATCH_RECORD_RAISED = 'Unexpected error processing record {}: {}'
+    BATCH_RECORD_DISCARDED = "Record failed permanently on '{}' phase, consuming it instead of requesting redelivery."
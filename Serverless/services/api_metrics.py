@@ -1,32 +1,37 @@
-import copy
-import time
+import sys
+
+try:
+    import resource
+except ImportError:
+    resource = None     # Unavailable off Unix, peak memory isn't reported then.
+
+from services.latency_metrics import LatencyMetrics
+from services.tracer import Tracer
 
 
 class ApiMetrics:
     """
-    Metrics API. Stores, calculates and exposes execution time metrics for efficiency evaluation.
+    Metrics API. Stores, calculates and exposes execution time metrics for efficiency evaluation. Measurements are
+    recorded as Tracer spans; the flat dictionaries returned by get/get_snapshot are derived from the phase spans of
+    each invocation, whichever handler or record span encloses them.
     """
 
-    __counters = {}                     # :dict: Main measurements storage.
+    tracer = Tracer                     # :Tracer: Underlying span storage.
+    latency = LatencyMetrics            # :LatencyMetrics: Container wide phase latency histograms.
+    CPU_TIME_KEY = 'CPU time'           # :str: Metrics dictionary entry holding CPU time of each procedure.
+    PEAK_RSS_KEY = 'Peak RSS MB'        # :str: Metrics dictionary entry holding peak memory at each procedure's end.
 
     @classmethod
-    def start(cls, invocation_id, procedure):
+    def start(cls, invocation_id, procedure, **attributes):
         """
-        Starts time measurement on a new procedure of a particular cloud function invocation.
+        Starts time measurement on a new phase of a particular cloud function invocation.
         :param invocation_id: string. Cloud function invocation Id.
         :param procedure: string. Particular procedure name to be measured.
-        :return: void.
+        :param attributes: Initial span attributes.
+        :return: Span. Span measuring the procedure.
         """
 
-        # If no metrics have been measured for this particular invocation, start a new register for it.
-        if invocation_id not in cls.__counters:
-            cls.__counters[invocation_id] = {}
-
-        # If this particular procedure measurement hasn't yet been initiated, start it.
-        if procedure not in cls.__counters[invocation_id]:
-            cls.__counters[invocation_id][procedure] = {}
-            cls.__counters[invocation_id][procedure]['time'] = time.time()
-            cls.__counters[invocation_id][procedure]['counting'] = True
+        return cls.tracer.start_span(invocation_id, procedure, phase=True, **attributes)
 
     @classmethod
     def stop(cls, invocation_id, procedure) -> float:
@@ -38,13 +43,26 @@ class ApiMetrics:
         """
 
         # If measurement has been initiated on this invocation and procedure, stop and calculate it.
-        proc = cls.__counters.get(invocation_id, {}).get(procedure)
-        if proc:
-            proc['time'] = cls.__get_time_diff(proc['time'])
-            proc['counting'] = False
+        span = cls.tracer.find_span(invocation_id, procedure, ongoing_only=True)
+        if span is None:
+            span = cls.tracer.find_span(invocation_id, procedure)
+            if span is None: return None
+        cls.__end(span)
 
         # Return final time measurement.
-        return proc['time']
+        return cls.__to_seconds(span.duration_ns)
+
+    @classmethod
+    def stop_span(cls, span) -> float:
+        """
+        Stops time measurement of a procedure given its span. Unlike stop, doesn't rely on procedure names, which may
+        be shared by concurrently running procedures.
+        :param span: Span. Span measuring the procedure.
+        :return: float. Procedure final time measurement.
+        """
+
+        cls.__end(span)
+        return cls.__to_seconds(span.duration_ns)
 
     @classmethod
     def get(cls,  invocation_id):
@@ -54,15 +72,9 @@ class ApiMetrics:
         :return: dictionary. Summary of all invocation measurements.
         """
 
-        # Iterates on measurement dictionary stopping time counters and flagging measurements as done.
-        metrics = {}
-        if invocation_id not in cls.__counters: return metrics
-        for k, v in cls.__counters[invocation_id].items():
-            if v['counting']:
-                metrics[k] = cls.__get_time_diff(v['time'])
-            else:
-                metrics[k] = v['time']
-        del cls.__counters[invocation_id]
+        # Ongoing measurements are taken up to this instant, then the invocation trace is released.
+        metrics = cls.__summarize(cls.tracer.get_spans(invocation_id), ongoing=True)
+        cls.tracer.discard(invocation_id)
         return metrics
 
     @classmethod
@@ -74,16 +86,91 @@ class ApiMetrics:
         :return: dictionary. Summary of all invocation measurements.
         """
 
-        # Iterates on measurement dictionary selecting finalized entries.
-        source = copy.copy(cls.__counters[invocation_id])
-        return {k: v.get('time') for k, v in source.items() if not v.get('counting')}
+        return cls.__summarize(cls.tracer.get_spans(invocation_id), ongoing=False)
+
+    @classmethod
+    def get_trace(cls, invocation_id) -> list:
+        """
+        Returns the full span tree of a particular cloud function invocation, including nested spans and attributes.
+        :param invocation_id: string. Cloud function invocation Id.
+        :return: list. Root spans in dictionary form.
+        """
+
+        return cls.tracer.get_trace(invocation_id)
+
+    @classmethod
+    def get_store_stats(cls) -> dict:
+        """
+        Exposes metrics storage occupation and eviction counters of the current container.
+        :return: dictionary.
+        """
+
+        return cls.tracer.get_store_stats()
+
+    @classmethod
+    def __end(cls, span):
+        """
+        Closes a span, counting phase level spans on the container wide latency histograms.
+        :param span: Span. Span to be closed.
+        :return: void.
+        """
+
+        if span.ended: return
+        cls.tracer.end_span(span)
+        if span.phase_level:
+            cls.latency.record(span.name, span.duration_ns)
+            span.set_attribute('peak_rss_kb', cls.get_peak_rss_kb())
+
+    @classmethod
+    def __summarize(cls, spans: list, ongoing: bool) -> dict:
+        """
+        Flattens phase level spans into a procedure name to duration dictionary. Repeated procedures are summed. The
+        CPU time each procedure's thread spent is reported likewise under CPU_TIME_KEY, along with the one of nested
+        spans flagged as reported (e.g. alternative implementations of a costly sub-procedure).
+        :param spans: list. Spans of a particular invocation.
+        :param ongoing: boolean. Whether ongoing spans are to be included.
+        :return: dictionary.
+        """
+
+        totals, cpu_totals, peak_rss = {}, {}, {}
+        for span in spans:
+            if not ongoing and not span.ended: continue
+            if span.reported and not span.phase_level:
+                if span.cpu_ns is not None:
+                    cpu_totals[span.name] = cpu_totals.get(span.name, 0) + span.cpu_ns
+                continue
+            if not span.phase_level: continue
+            totals[span.name] = totals.get(span.name, 0) + span.duration_ns
+            if span.cpu_ns is not None:
+                cpu_totals[span.name] = cpu_totals.get(span.name, 0) + span.cpu_ns
+            if span.attributes.get('peak_rss_kb') is not None:
+                peak_rss[span.name] = max(peak_rss.get(span.name, 0), span.attributes['peak_rss_kb'])
+
+        metrics = {k: cls.__to_seconds(v) for k, v in totals.items()}
+        if cpu_totals:
+            metrics[cls.CPU_TIME_KEY] = {k: cls.__to_seconds(v) for k, v in cpu_totals.items()}
+        if peak_rss:
+            metrics[cls.PEAK_RSS_KEY] = {k: round(v / 1024, 1) for k, v in peak_rss.items()}
+        return metrics
+
+    @staticmethod
+    def get_peak_rss_kb():
+        """
+        Exposes the container process' peak resident set size so far. Being process wide and monotonic, the value
+        recorded at each phase's end shows which phase raised the peak, concurrently running phases aside.
+        :return: integer in KB, None if unavailable on this platform.
+        """
+
+        if resource is None: return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == 'darwin' else peak
 
     @staticmethod
-    def __get_time_diff(ref):
+    def __to_seconds(ns: int) -> float:
         """
-        Calculates time difference between current and reference time.
-        :param ref: integer. Reference time.
-        :return: integer. 3 digits rounded time difference in seconds.
+        Converts a nanosecond measurement to seconds.
+        :param ns: integer. Time in nanoseconds.
+        :return: float. 6 digits rounded time in seconds.
         """
 
-        return round(time.time() - ref, 3)
+        return round(ns / 1e9, 6)
@@ -0,0 +1,65 @@
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from resources.environment_variables import EnvironmentVariables as env
+
+
+class AsyncAdapter:
+    """
+    Asynchronous adapter for the blocking AWS service classes (AWSS3, AWSDynamoDB, AWSSQS, AWSRekognition). Exposes
+    every method of the wrapped service as a coroutine function running the original call on a shared thread pool, so
+    that many calls can be awaited concurrently from a single event loop, e.g.:
+
+        repository = AsyncAdapter(AWSDynamoDB(table_name))
+        responses = await asyncio.gather(*[repository.load(x) for x in keys])
+    """
+
+    MAX_WORKERS = int(env.ASYNC_EXECUTOR_MAX_WORKERS or 32)  # :int: Size of the shared blocking call thread pool.
+
+    __executor = None                                       # :ThreadPoolExecutor: Lazily created shared thread pool.
+    __lock = threading.Lock()                               # :Lock: Guards thread pool creation.
+
+    def __init__(self, service):
+        """
+        Constructor of the adapter object.
+        :param service: Blocking service object to be wrapped.
+        """
+
+        self.service = service                              # :*: Wrapped blocking service object.
+
+    def __getattr__(self, name):
+        """
+        Resolves attributes on the wrapped service, turning its methods into coroutine functions.
+        :param name: string. Attribute name.
+        :return: coroutine function, or the plain attribute value if not callable.
+        """
+
+        attribute = getattr(self.service, name)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def method(*args, **kwargs):
+
+            # Context is copied so that the blocking call sees the caller's active tracing span.
+            call = functools.partial(contextvars.copy_context().run, attribute, *args, **kwargs)
+            return await asyncio.get_running_loop().run_in_executor(type(self).get_executor(), call)
+
+        return method
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        """
+        Provides the thread pool shared by all adapters, created on first use and kept for the container's lifetime.
+        :return: ThreadPoolExecutor.
+        """
+
+        if cls.__executor is None:
+            with cls.__lock:
+                if cls.__executor is None:
+                    cls.__executor = ThreadPoolExecutor(max_workers=cls.MAX_WORKERS,
+                                                        thread_name_prefix='async-adapter')
+        return cls.__executor
@@ -0,0 +1,114 @@
+import threading
+
+from resources.environment_variables import EnvironmentVariables as env
+from services.lazy_import import LazyModule
+
+boto3 = LazyModule('boto3')
+botocore_config = LazyModule('botocore.config')
+
+
+class AWSClients:
+    """
+    Container scoped registry of boto3 clients and resources. Each service client is created once per container, from
+    a single session and a tuned connection pool configuration, so credentials, endpoints and open (kept alive) TLS
+    connections are reused across phases and warm invocations. Clients are thread safe and shared; resources aren't,
+    so each thread gets its own resource instance, built on top of the shared client. Hits and misses are counted so
+    that the reuse can be measured.
+    """
+
+    MAX_POOL_CONNECTIONS = int(env.AWS_MAX_POOL_CONNECTIONS or 50)  # :int: HTTP connection pool size per client.
+    TCP_KEEPALIVE = (env.AWS_TCP_KEEPALIVE or 'true').lower() == 'true'  # :bool: Enables TCP keep-alive probes.
+
+    __session = None                                        # :Session: Shared boto3 session.
+    __clients = {}                                          # :dict: Service name to shared client.
+    __resources = {}                                        # :dict: Service name to prototype resource.
+    __local = threading.local()                             # :local: Per thread resource instances.
+    __stats = {'client_hits': 0, 'client_misses': 0, 'resource_hits': 0, 'resource_misses': 0}  # :dict: Counters.
+    __lock = threading.RLock()                              # :RLock: Guards session, client and resource creation.
+
+    @classmethod
+    def client(cls, service: str):
+        """
+        Provides the container's client of a particular AWS service, creating it on first request.
+        :param service: string. AWS service name (e.g. 's3', 'dynamodb').
+        :return: boto3 client.
+        """
+
+        client = cls.__clients.get(service)
+        if client is not None:
+            cls.__count('client_hits')
+            return client
+
+        with cls.__lock:
+            client = cls.__clients.get(service)
+            if client is None:
+                client = cls.__clients[service] = cls.__get_session().client(service, config=cls.__get_config())
+                cls.__count('client_misses')
+            else:
+                cls.__count('client_hits')
+        return client
+
+    @classmethod
+    def resource(cls, service: str):
+        """
+        Provides the current thread's resource of a particular AWS service, sharing the container's client.
+        :param service: string. AWS service name (e.g. 's3', 'dynamodb').
+        :return: boto3 service resource.
+        """
+
+        resources = getattr(cls.__local, 'resources', None)
+        if resources is None:
+            resources = cls.__local.resources = {}
+
+        resource = resources.get(service)
+        if resource is not None:
+            cls.__count('resource_hits')
+            return resource
+
+        client = cls.client(service)
+        with cls.__lock:
+            prototype = cls.__resources.get(service)
+            if prototype is None:
+                prototype = cls.__resources[service] = cls.__get_session().resource(service, config=cls.__get_config())
+
+        # Resource instances of other threads are cheap copies wrapping the shared client (and its connection pool).
+        resource = resources[service] = type(prototype)(client=client)
+        cls.__count('resource_misses')
+        return resource
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        """
+        Exposes cache counters and the amount of clients held.
+        :return: dictionary.
+        """
+
+        with cls.__lock:
+            return dict(cls.__stats, clients=len(cls.__clients))
+
+    @classmethod
+    def __count(cls, counter: str):
+        with cls.__lock:
+            cls.__stats[counter] += 1
+
+    @classmethod
+    def __get_session(cls):
+        if cls.__session is None:
+            with cls.__lock:
+                if cls.__session is None:
+                    cls.__session = boto3.session.Session()
+        return cls.__session
+
+    @classmethod
+    def __get_config(cls):
+        """
+        Builds the client configuration. TCP keep-alive is only supported by recent botocore versions, older ones
+        get the connection pool size alone.
+        :return: botocore Config.
+        """
+
+        try:
+            return botocore_config.Config(max_pool_connections=cls.MAX_POOL_CONNECTIONS,
+                                          tcp_keepalive=cls.TCP_KEEPALIVE)
+        except TypeError:
+            return botocore_config.Config(max_pool_connections=cls.MAX_POOL_CONNECTIONS)
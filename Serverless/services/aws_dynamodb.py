@@ -1,9 +1,22 @@
-import boto3
-from boto3.dynamodb.conditions import Key
+import math
+import random
+import time
+from decimal import Decimal
+
+from resources.environment_variables import EnvironmentVariables as env
+from services.aws_clients import AWSClients
+from services.lazy_import import LazyModule
+from services.log_sink import LogSink
+
+conditions = LazyModule('boto3.dynamodb.conditions')
 
 
 class AWSDynamoDB:
 
+    BATCH_WRITE_MAX_ITEMS = 25                                                  # :int: BatchWriteItem request cap.
+    BATCH_WRITE_MAX_ATTEMPTS = int(env.DYNAMODB_BATCH_MAX_ATTEMPTS or 5)         # :int: Attempts per batch.
+    BATCH_WRITE_BASE_DELAY = 0.05                                               # :float: Backoff base, in seconds.
+
     def __init__(self, table_name: str):
         self.table_name = table_name
         self.key_hash = None
@@ -13,7 +26,7 @@ class AWSDynamoDB:
     def evaluate_conditions_and_requirements(self):
 
         try:
-            description = boto3.client('dynamodb').describe_table(TableName=self.table_name)
+            description = AWSClients.client('dynamodb').describe_table(TableName=self.table_name)
         except Exception as e:
             raise Exception(str(e))
 
@@ -40,10 +53,10 @@ class AWSDynamoDB:
 
     def save(self,  data):
 
-        type(self).__convert_structure_to_dynamo_compatible(data)
+        type(self).convert_structure_to_dynamo_compatible(data)
 
         try:
-            table = boto3.resource('dynamodb').Table(self.table_name)
+            table = AWSClients.resource('dynamodb').Table(self.table_name)
             response = table.put_item(Item=data)
         except Exception as e:
             raise Exception(str(e))
@@ -55,12 +68,12 @@ class AWSDynamoDB:
     def load(self, hash_key, range_key_equals = None, range_key_begins = None):
 
         if range_key_equals:
-            key_condition_exp = Key(self.key_hash).eq(hash_key) & Key(self.key_range).eq(range_key_equals)
+            key_condition_exp = conditions.Key(self.key_hash).eq(hash_key) & conditions.Key(self.key_range).eq(range_key_equals)
         elif range_key_begins:
-            key_condition_exp = Key(self.key_hash).eq(hash_key) & Key(self.key_range).begins_with(range_key_begins)
+            key_condition_exp = conditions.Key(self.key_hash).eq(hash_key) & conditions.Key(self.key_range).begins_with(range_key_begins)
 
         try:
-            table = boto3.resource('dynamodb').Table(self.table_name)
+            table = AWSClients.resource('dynamodb').Table(self.table_name)
             response = table.query(KeyConditionExpression=key_condition_exp)
         except Exception as e:
             raise Exception(str(e))
@@ -71,52 +84,112 @@ class AWSDynamoDB:
 
         return response
 
-    def delete_by_hash(self, user_id):
-        table = boto3.resource('dynamodb').Table(self.table_name)
-        items = table.query(KeyConditionExpression=Key('userId').eq(user_id))
-        keys = [{'hash': x.get('userId'), 'range': x.get('time')} for x in items.get('Items')]
-        print(f"DAO - Deleting from dynamo querried {len(keys)} item(s) under hash key '{user_id}': {str(keys)}")
-        print(f"DAO - Deleting querried items...")
+    def query_all(self, hash_key, attributes: list = None):
+        """
+        Iterates over every item under a hash key, following the query's pagination (1 MB pages).
+        :param hash_key: Hash key value.
+        :param attributes: list. Attributes to be projected besides the table keys, every attribute if None.
+        :return: generator of dictionaries.
+        """
+
+        if not self.key_hash: self.evaluate_conditions_and_requirements()
+
+        params = {'KeyConditionExpression': conditions.Key(self.key_hash).eq(hash_key)}
+        if attributes is not None:
+            names = [x for x in [self.key_hash, self.key_range] + list(attributes) if x]
+            params['ProjectionExpression'] = ', '.join(f'#a{i}' for i in range(len(names)))
+            params['ExpressionAttributeNames'] = {f'#a{i}': x for i, x in enumerate(names)}
 
-        for entry in keys:
+        table = AWSClients.resource('dynamodb').Table(self.table_name)
+        while True:
             try:
-                response = table.delete_item(
-                    Key={
-                        'userId': entry.get('hash'),
-                        'time': entry.get('range'),
-                    }
-                )
-                print(f"DAO - Successfully deleted HASH '{entry.get('hash')}' | RANGE '{entry.get('range')}'. "
-                      f"Response: {response.get('ResponseMetadata')}")
+                response = table.query(**params)
             except Exception as e:
-                print('DAO - Error: unable to delete item from DynamoDB: ' + str(e))
-                return False
-        return True
+                raise Exception(str(e))
+
+            yield from response.get('Items', [])
+
+            if not response.get('LastEvaluatedKey'): break
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    def delete_items(self, items: list) -> int:
+        """
+        Deletes given items by their table keys, through batch writes of BATCH_WRITE_MAX_ITEMS requests. Unprocessed
+        requests (throttling) are retried with exponential backoff.
+        :param items: list. Items containing, at least, the table keys.
+        :return: integer. Amount of deleted items.
+        """
+
+        if not self.key_hash: self.evaluate_conditions_and_requirements()
+
+        # Duplicated keys within a batch are rejected by DynamoDB.
+        keys = {}
+        for item in items:
+            key = {x: item[x] for x in [self.key_hash, self.key_range] if x}
+            keys[tuple(str(x) for x in key.values())] = key
+        keys = list(keys.values())
+
+        for i in range(0, len(keys), self.BATCH_WRITE_MAX_ITEMS):
+            self.__batch_write([{'DeleteRequest': {'Key': x}} for x in keys[i:i + self.BATCH_WRITE_MAX_ITEMS]])
+        return len(keys)
+
+    def delete_by_hash(self, hash_key) -> int:
+        """
+        Deletes every item under a hash key, page by page.
+        :param hash_key: Hash key value.
+        :return: integer. Amount of deleted items.
+        """
+
+        deleted = 0
+        page = []
+        for item in self.query_all(hash_key, attributes=[]):
+            page.append(item)
+            if len(page) == self.BATCH_WRITE_MAX_ITEMS:
+                deleted += self.delete_items(page)
+                page = []
+        deleted += self.delete_items(page)
+
+        LogSink.emit(f"Deleted {deleted} item(s) under hash key '{hash_key}' from '{self.table_name}'.", prefix='DAO')
+        return deleted
+
+    def __batch_write(self, requests: list):
+        """
+        Executes a batch write, retrying unprocessed requests.
+        :param requests: list. Up to BATCH_WRITE_MAX_ITEMS put or delete requests.
+        :return: void.
+        """
+
+        resource = AWSClients.resource('dynamodb')
+        for attempt in range(self.BATCH_WRITE_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(random.uniform(0, self.BATCH_WRITE_BASE_DELAY * 2 ** attempt))
+            try:
+                response = resource.batch_write_item(RequestItems={self.table_name: requests})
+            except Exception as e:
+                raise Exception(str(e))
+
+            requests = response.get('UnprocessedItems', {}).get(self.table_name)
+            if not requests: return
+
+        raise Exception(f'{len(requests)} request(s) left unprocessed after {self.BATCH_WRITE_MAX_ATTEMPTS} attempts.')
 
     @classmethod
-    def __convert_structure_to_dynamo_compatible(cls, data):
+    def convert_structure_to_dynamo_compatible(cls, data):
         if isinstance(data, dict):
             for k, v in data.items():
-                data[k] = cls.__convert_structure_to_dynamo_compatible(v)
+                data[k] = cls.convert_structure_to_dynamo_compatible(v)
 
         elif isinstance(data, list):
             for x in range(len(data)):
-                data[x] = cls.__convert_structure_to_dynamo_compatible(data[x])
+                data[x] = cls.convert_structure_to_dynamo_compatible(data[x])
 
         elif isinstance(data, tuple):
             data = list(data)
-            data = cls.__convert_structure_to_dynamo_compatible(data)
+            data = cls.convert_structure_to_dynamo_compatible(data)
 
+        # Floats are stored as numbers, through their shortest exact decimal form. DynamoDB has no NaN/Infinity.
         if isinstance(data, float):
-            return str(data)
+            return Decimal(str(data)) if math.isfinite(data) else str(data)
 
         else:
             return data
-
-
-
-
-
-
-
-
@@ -1,4 +1,4 @@
-import boto3
+from services.aws_clients import AWSClients
 
 
 class AWSRekognition:
@@ -22,7 +22,7 @@ class AWSRekognition:
 
         # Attempts to contact AWS celebrity recognition service.
         try:
-            self.response = boto3.client('rekognition').recognize_celebrities(
+            self.response = AWSClients.client('rekognition').recognize_celebrities(
                 Image={
                     'S3Object': {
                         'Bucket': bucket,
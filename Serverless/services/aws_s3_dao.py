@@ -1,12 +1,46 @@
+import io
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-import boto3
+
+from resources.environment_variables import EnvironmentVariables as env
+from services.aws_clients import AWSClients
+from services.buffer_reader import BufferReader
+from services.lazy_import import LazyModule
+
+transfer = LazyModule('boto3.s3.transfer')
+
+
+class _CountingReader:
+    """
+    Read-only file-like wrapper counting the bytes read from a non seekable stream, so that the stored size is known
+    without asking the storage service.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream                # :*: Wrapped readable stream.
+        self.bytes_read = 0                 # :int: Amount of bytes read so far.
+
+    def read(self, size=-1):
+        chunk = self.stream.read(size)
+        self.bytes_read += len(chunk)
+        return chunk
 
 
 class AWSS3:
     """
-    AWS S3 object, responsible for exposing the cloud's blob storage service in a unified interface.
+    AWS S3 object, responsible for exposing the cloud's blob storage service in a unified interface. Uploads are
+    streamed from file-like objects, switching to parallel multipart uploads above the multipart threshold, and
+    downloads can be streamed, ranged or spooled, so that large originals are never held in memory more than once.
     """
 
+    MB = 1024 * 1024
+    MULTIPART_THRESHOLD = int(float(env.S3_MULTIPART_THRESHOLD_MB or 8) * MB)  # :int: Multipart upload threshold.
+    PART_SIZE = int(float(env.S3_PART_SIZE_MB or 8) * MB)                      # :int: Multipart part size (>= 5 MB).
+    MAX_CONCURRENCY = int(env.S3_MAX_CONCURRENCY or 8)                         # :int: Parts transferred at once.
+    SPOOL_MAX_SIZE = int(float(env.S3_SPOOL_MAX_MB or 16) * MB)                # :int: In memory spooling limit.
+    DELETE_MAX_KEYS = 1000                                                     # :int: DeleteObjects request cap.
+
     def __init__(self, bucket: str):
         """
         Constructor function, stores instantiation provided bucket name.
@@ -17,33 +51,152 @@ class AWSS3:
 
     def save_file(self, file_bytes, file_name: str, path: str = '') -> (bool, str, str):
         """
-        Saves file provided in bytes form with given name at given file path.
-        :param file_bytes: provided file in bytes or BytesIO form.
+        Saves file provided in bytes or file-like form with given name at given file path. File-like objects are
+        streamed from their current position; files larger than the multipart threshold are uploaded in parts, in
+        parallel.
+        :param file_bytes: provided file in bytes, bytearray, memoryview or readable file-like form.
         :param file_name: name to be used once file is stored.
         :param path: '/' (slash) separated strings denoting the folder structure/path on which the file will be saved.
         :return: tuple with 3 values. First is a boolean expressing operation status, second value expresses
         operation details, third returns stored image size.
         """
 
-        # Correct path spelling
-        if path.split() and not path.endswith('/'): path += '/'
-
-        # Correct image name spelling
-        if file_name.startswith('/'): file_name = file_name[1:]
+        key_name = self.get_key_name(file_name, path)
 
-        key_name = f'{path}{file_name}'
+        # Stored size is computed locally, from the buffer or the stream.
+        file_obj, size = self.__get_file_obj_and_size(file_bytes)
 
-        # Attempts to contact AWS S3 blob storage and save file
+        # Attempts to contact AWS S3 blob storage and stream file.
         try:
-            bucket = boto3.resource('s3').Bucket(self.bucket)
-            storage_response = bucket.put_object(Key=key_name, Body=file_bytes)
+            AWSClients.client('s3').upload_fileobj(file_obj, self.bucket, key_name, Config=self.get_transfer_config())
 
         # If unable, returns false and exposes error.
         except Exception as e:
             return False, str(e), 'N.A.'
 
         # Successfully finishes procedure.
-        return True, str(storage_response), self.__sizeof_fmt(bucket.Object(key_name).content_length, 'B')
+        if size is None: size = file_obj.bytes_read
+        parts = max(1, -(-size // self.PART_SIZE)) if size >= self.MULTIPART_THRESHOLD else 1
+        return True, f"Stored '{key_name}' on '{self.bucket}' ({parts} part(s))", self.sizeof_fmt(size, 'B')
+
+    def open_stream(self, key: str, start: int = None, end: int = None) -> (bool, str, object):
+        """
+        Opens a file, or a byte range of it, as a readable stream. Content is only transferred as the stream is read.
+        :param key: string. Stored file name.
+        :param start: integer. First byte of the range, if only part of the file is required.
+        :param end: integer. Last byte of the range (inclusive), defaults to end of file.
+        :return: tuple with 3 values. Operation status, operation details and readable stream (StreamingBody).
+        """
+
+        params = {'Bucket': self.bucket, 'Key': key}
+        if start is not None or end is not None:
+            params['Range'] = f"bytes={start or 0}-{'' if end is None else end}"
+
+        # Attempts to contact AWS S3 blob storage and open file.
+        try:
+            obj = AWSClients.client('s3').get_object(**params)
+
+        # If unable, returns false and exposes error.
+        except Exception as e:
+            return False, str(e), None
+
+        http_status_code = obj.get('ResponseMetadata', {}).get('HTTPStatusCode')
+        if not http_status_code or http_status_code not in (200, 206):
+            return False, f'Bad status code: {http_status_code}', None
+
+        return True, f'HTTP status code -> {http_status_code}', obj['Body']
+
+    def load_range(self, key: str, start: int, end: int) -> (bool, str, bytes):
+        """
+        Loads a byte range of a file.
+        :param key: string. Stored file name.
+        :param start: integer. First byte of the range.
+        :param end: integer. Last byte of the range (inclusive).
+        :return: tuple with 3 values. Operation status, operation details and range bytes.
+        """
+
+        status, response, stream = self.open_stream(key, start, end)
+        if not status: return status, response, None
+        try:
+            return status, response, stream.read()
+        except Exception as e:
+            return False, str(e), None
+
+    def load_file_as_spooled(self, key: str, max_size: int = None) -> (bool, str, object):
+        """
+        Downloads a file (ranged, parallel GETs for large files) into a spooled temporary file, which is kept in memory
+        up to max_size and rolled over to local disk above it.
+        :param key: string. Stored file name.
+        :param max_size: integer. In memory size limit, defaults to SPOOL_MAX_SIZE.
+        :return: tuple with 3 values. Operation status, operation details and seekable file positioned at its start.
+        """
+
+        spooled = tempfile.SpooledTemporaryFile(max_size=max_size or self.SPOOL_MAX_SIZE)
+
+        # Attempts to contact AWS S3 blob storage and download file.
+        try:
+            AWSClients.client('s3').download_fileobj(self.bucket, key, spooled, Config=self.get_transfer_config())
+
+        # If unable, returns false and exposes error.
+        except Exception as e:
+            spooled.close()
+            return False, str(e), None
+
+        size = spooled.tell()
+        spooled.seek(0)
+        return True, f'Downloaded {size} bytes', spooled
+
+    def load_file_with_metadata(self, key: str) -> (bool, str, bytes, dict):
+        """
+        Loads a file together with its user defined metadata, in a single request.
+        :param key: string. Stored file name.
+        :return: tuple with 4 values. Operation status, operation details, file bytes and metadata (without the
+        'x-amz-meta-' prefix).
+        """
+
+        # Attempts to contact AWS S3 blob storage and load file.
+        try:
+            obj = AWSClients.client('s3').get_object(Bucket=self.bucket, Key=key)
+            file_byte_string = obj['Body'].read()
+
+        # If unable, returns false and exposes error.
+        except Exception as e:
+            return False, str(e), None, {}
+
+        return True, f'Loaded {len(file_byte_string)} bytes', file_byte_string, obj.get('Metadata', {})
+
+    def create_presigned_post(self, key: str, content_type: str, max_size: int, metadata: dict,
+                              expiration: int) -> (bool, str, dict):
+        """
+        Issues a presigned POST, allowing a client to upload a single file straight to the bucket. Content type, size
+        range and metadata are signed conditions, the storage service rejects uploads that don't meet them.
+        :param key: string. Name the file will be stored under.
+        :param content_type: string. Required file MIME type.
+        :param max_size: integer. Maximum file size in bytes.
+        :param metadata: dictionary. User defined metadata (ASCII) to be stored with the file.
+        :param expiration: integer. Seconds the POST remains valid for.
+        :return: tuple with 3 values. Operation status, operation details and POST url and form fields.
+        """
+
+        fields = {'Content-Type': content_type}
+        fields.update({f'x-amz-meta-{k}': v for k, v in metadata.items()})
+        conditions = [{k: v} for k, v in fields.items()] + [['content-length-range', 1, max_size]]
+
+        # Attempts to sign POST policy.
+        try:
+            post = AWSClients.client('s3').generate_presigned_post(
+                Bucket=self.bucket,
+                Key=key,
+                Fields=fields,
+                Conditions=conditions,
+                ExpiresIn=expiration
+            )
+
+        # If unable, returns false and exposes error.
+        except Exception as e:
+            return False, str(e), {}
+
+        return True, f"Signed POST of '{key}' on '{self.bucket}' for {expiration}s", post
 
     def load_file_as_bytes_io(self, key: str) -> (bool, str):
 
@@ -55,24 +208,115 @@ class AWSS3:
     def load_file_as_string(self, key: str) -> (bool, str):
 
         # Attempts to contact AWS S3 blob storage and load file.
+        status, response, stream = self.open_stream(key)
+        if not status: return status, response, None
         try:
-            s3 = boto3.client('s3')
-            obj = s3.get_object(Bucket=self.bucket, Key=key)
-            file_byte_string = obj['Body'].read()
+            file_byte_string = stream.read()
 
         # If unable, returns false and exposes error.
         except Exception as e:
             return False, str(e), None
 
-        http_status_code = obj.get('ResponseMetadata', {}).get('HTTPStatusCode')
-        if not http_status_code or http_status_code != 200:
-            return False, f'Bad status code: {http_status_code}', None
+        return True, response, file_byte_string
+
+    def delete_files(self, keys: list) -> (bool, str, int):
+        """
+        Deletes files in DELETE_MAX_KEYS sized batches, running batches concurrently. Missing files are not errors.
+        :param keys: list. Stored file names.
+        :return: tuple with 3 values. Operation status, operation details and amount of deleted files.
+        """
+
+        keys = list(dict.fromkeys(keys))
+        chunks = [keys[i:i + self.DELETE_MAX_KEYS] for i in range(0, len(keys), self.DELETE_MAX_KEYS)]
+        if not chunks: return True, 'Nothing to delete', 0
+
+        with ThreadPoolExecutor(max_workers=min(len(chunks), self.MAX_CONCURRENCY)) as pool:
+            results = list(pool.map(self.delete_chunk, chunks))
+
+        errors = [x for status, x in results if not status]
+        deleted = sum(x for status, x in results if status)
+        if errors:
+            return False, f'{len(errors)} of {len(chunks)} batch(es) failed: {errors[0]}', deleted
+        return True, f"Deleted {deleted} file(s) from '{self.bucket}' ({len(chunks)} batch(es))", deleted
+
+    def delete_chunk(self, keys: list) -> (bool, object):
+        """
+        Deletes a single batch of files.
+        :param keys: list. Up to DELETE_MAX_KEYS stored file names.
+        :return: tuple with 2 values. Operation status, and amount of deleted files or error details.
+        """
 
-        return True, f'HTTP status code -> {http_status_code}', file_byte_string
+        # Attempts to contact AWS S3 blob storage and delete files.
+        try:
+            response = AWSClients.client('s3').delete_objects(
+                Bucket=self.bucket,
+                Delete={'Objects': [{'Key': x} for x in keys], 'Quiet': True}
+            )
+
+        # If unable, returns false and exposes error.
+        except Exception as e:
+            return False, str(e)
+
+        # Quiet mode only reports failed deletions.
+        errors = response.get('Errors', [])
+        if errors:
+            return False, f"'{errors[0].get('Key')}': {errors[0].get('Message')} (+{len(errors) - 1} more)"
+        return True, len(keys)
+
+    @staticmethod
+    def get_key_name(file_name: str, path: str = '') -> str:
+        """
+        Builds a storage key from a file name and a folder path.
+        :param file_name: string. File name.
+        :param path: string. '/' (slash) separated folder structure.
+        :return: string.
+        """
+
+        # Correct path spelling
+        if path.split() and not path.endswith('/'): path += '/'
+
+        # Correct image name spelling
+        if file_name.startswith('/'): file_name = file_name[1:]
+
+        return f'{path}{file_name}'
+
+    @classmethod
+    def get_transfer_config(cls):
+        """
+        Builds multipart transfer configuration (threshold, part size and concurrency).
+        :return: TransferConfig.
+        """
+
+        return transfer.TransferConfig(
+            multipart_threshold=cls.MULTIPART_THRESHOLD,
+            multipart_chunksize=cls.PART_SIZE,
+            max_concurrency=cls.MAX_CONCURRENCY,
+            use_threads=cls.MAX_CONCURRENCY > 1
+        )
 
+    @staticmethod
+    def __get_file_obj_and_size(file) -> tuple:
+        """
+        Adapts a file to the readable form expected by the transfer manager, determining its size where possible.
+        :param file: bytes, bytearray, memoryview or readable file-like object.
+        :return: tuple. Readable object and size in bytes (None for non seekable streams, whose size is counted
+        while uploading by a _CountingReader).
+        """
+
+        if isinstance(file, (bytes, bytearray, memoryview)):
+            # Buffer memory is shared with the reader rather than copied.
+            return BufferReader(file), memoryview(file).nbytes
+
+        try:
+            position = file.tell()
+            size = file.seek(0, io.SEEK_END) - position
+            file.seek(position)
+            return file, size
+        except (AttributeError, OSError, ValueError):
+            return _CountingReader(file), None
 
     @staticmethod
-    def __sizeof_fmt(num, suffix='B') -> str:
+    def sizeof_fmt(num, suffix='B') -> str:
         """
         Formats amount of bytes by order of magnitude.
         :param num: Number to be processed.
@@ -1,12 +1,60 @@
-import json, boto3
+import json
+import random
+import threading
+import time
+from decimal import Decimal
+
+from resources.environment_variables import EnvironmentVariables as env
+from services.aws_clients import AWSClients
 
 
 class AWSSQS:
 
+    BATCH_MAX_ENTRIES = 10                                                      # :int: SendMessageBatch entries cap.
+    BATCH_MAX_BYTES = 262144                                                    # :int: SendMessageBatch payload cap.
+    BATCH_MAX_ATTEMPTS = int(env.SQS_BATCH_MAX_ATTEMPTS or 5)                   # :int: Attempts per batch.
+    BATCH_BASE_DELAY = 0.05                                                     # :float: Backoff base, in seconds.
+
+    __queue_urls = {}                                                           # :dict: Queue URLs of the container.
+    __lock = threading.Lock()                                                   # :Lock: Guards queue URL resolution.
+
     def __init__(self, queue_base_url: str, queue_name: str):
-        account_id = boto3.client('sts').get_caller_identity().get('Account')
-        self.queue_url = f'{queue_base_url}{account_id}/{queue_name}'
-        self.client = boto3.client('sqs')
+        self.queue_url = self.__get_queue_url(queue_base_url, queue_name)
+        self.client = AWSClients.client('sqs')
+
+    @classmethod
+    def __get_queue_url(cls, queue_base_url: str, queue_name: str) -> str:
+        """
+        Resolves a queue URL, the account Id being requested once per container rather than once per repository.
+        :param queue_base_url: string. Regional SQS base URL.
+        :param queue_name: string. Queue name.
+        :return: string.
+        """
+
+        key = (queue_base_url, queue_name)
+        queue_url = cls.__queue_urls.get(key)
+        if queue_url is None:
+            with cls.__lock:
+                queue_url = cls.__queue_urls.get(key)
+                if queue_url is None:
+                    account_id = AWSClients.client('sts').get_caller_identity().get('Account')
+                    queue_url = cls.__queue_urls[key] = f'{queue_base_url}{account_id}/{queue_name}'
+        return queue_url
+
+    @staticmethod
+    def encode(data) -> str:
+        """
+        Encodes message data as JSON. Numbers read back from the database (Decimal) are encoded as plain numbers.
+        :param data: Message data.
+        :return: string.
+        """
+
+        def default(value):
+            if isinstance(value, Decimal):
+                return int(value) if value == value.to_integral_value() else float(value)
+            raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+        return json.dumps(data, default=default)
 
     def evaluate_conditions_and_requirements(self):
         return 'N.A.'
@@ -16,7 +64,7 @@ class AWSSQS:
         try:
             response = self.client.send_message(
                 QueueUrl=self.queue_url,
-                MessageBody=json.dumps(data)
+                MessageBody=self.encode(data)
             )
         except Exception as e:
             raise Exception(str(e))
@@ -25,6 +73,66 @@ class AWSSQS:
         if not http_status_code or http_status_code != 200:
             raise Exception(f'Bad status code: {http_status_code}')
 
+    def save_batch(self, items: list) -> int:
+        """
+        Queues several messages through batch sends packing up to BATCH_MAX_ENTRIES messages or BATCH_MAX_BYTES each.
+        Entries failed on the service side are retried with jittered exponential backoff, the rest are not resent.
+        :param items: list. Data of each message.
+        :return: integer. Amount of messages queued.
+        """
+
+        batch, batch_bytes = [], 0
+        for i, data in enumerate(items):
+            body = self.encode(data)
+            size = len(body.encode('utf-8'))
+            if size > self.BATCH_MAX_BYTES:
+                raise Exception(f'Message {i} of {size} bytes exceeds the {self.BATCH_MAX_BYTES} bytes limit.')
+
+            # Sends the batch being packed once the new message doesn't fit.
+            if len(batch) == self.BATCH_MAX_ENTRIES or batch_bytes + size > self.BATCH_MAX_BYTES:
+                self.__send_batch(batch)
+                batch, batch_bytes = [], 0
+            batch.append({'Id': str(i), 'MessageBody': body})
+            batch_bytes += size
+
+        if batch:
+            self.__send_batch(batch)
+        return len(items)
+
+    def send_message_batch(self, entries: list) -> dict:
+        """
+        Executes a single batch send.
+        :param entries: list. Up to BATCH_MAX_ENTRIES entries (Id, MessageBody).
+        :return: dictionary. Response listing 'Successful' and 'Failed' entries.
+        """
+
+        return self.client.send_message_batch(QueueUrl=self.queue_url, Entries=entries)
+
+    def __send_batch(self, entries: list):
+        """
+        Executes a batch send, retrying failed entries.
+        :param entries: list. Up to BATCH_MAX_ENTRIES entries (Id, MessageBody).
+        :return: void.
+        """
+
+        for attempt in range(self.BATCH_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(random.uniform(0, self.BATCH_BASE_DELAY * 2 ** attempt))
+            try:
+                response = self.send_message_batch(entries)
+            except Exception as e:
+                raise Exception(str(e))
+
+            # Malformed entries (sender fault) would fail again, only service side failures are retried.
+            failed = {x['Id']: x for x in response.get('Failed', [])}
+            if not failed: return
+            sender_faults = [x for x in failed.values() if x.get('SenderFault')]
+            if sender_faults:
+                raise Exception(f"Entry {sender_faults[0]['Id']} rejected: {sender_faults[0].get('Message')}")
+            entries = [x for x in entries if x['Id'] in failed]
+
+        raise Exception(f'{len(entries)} message(s) left unsent after {self.BATCH_MAX_ATTEMPTS} attempts.')
+
     def delete(self, receipt_handle: str):
 
         try:
@@ -39,12 +147,3 @@ class AWSSQS:
         http_status_code = response.get('ResponseMetadata', {}).get('HTTPStatusCode')
         if not http_status_code or http_status_code != 200:
             raise Exception(f'Bad status code: {http_status_code}')
-
-
-
-
-
-
-
-
-
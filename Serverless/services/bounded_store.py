@@ -0,0 +1,114 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class BoundedStore:
+    """
+    Thread-safe, size and age bounded key/value storage. Entries expire after a time to live since their last access
+    and the least recently used entries are evicted once the maximum entry count is reached, so storage kept on warm
+    cloud function containers does not grow with entries that are never collected.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, clock=time.monotonic):
+        """
+        Constructor of the bounded store.
+        :param max_entries: integer. Maximum amount of entries kept at once.
+        :param ttl_seconds: float. Entry time to live since last access, in seconds.
+        :param clock: callable. Monotonic time source in seconds.
+        """
+
+        self.max_entries = max_entries              # :int: Maximum amount of entries kept at once.
+        self.ttl_seconds = ttl_seconds              # :float: Entry time to live since last access.
+        self.clock = clock                          # :callable: Time source.
+        self.evicted = 0                            # :int: Entries dropped to respect max_entries (LRU).
+        self.orphaned = 0                           # :int: Entries dropped for outliving their time to live.
+        self.__entries = OrderedDict()              # :OrderedDict: Key to (last access, value), oldest first.
+        self.__lock = threading.Lock()              # :Lock: Guards concurrent access.
+
+    def get(self, key, default=None):
+        """
+        Retrieves a live entry, refreshing its recency and time to live.
+        :param key: Entry key.
+        :param default: Value returned if entry doesn't exist or has expired.
+        :return: Stored value or default.
+        """
+
+        with self.__lock:
+            now = self.clock()
+            self.__expire(now)
+            if key not in self.__entries: return default
+            value = self.__entries[key][1]
+            self.__entries[key] = (now, value)
+            self.__entries.move_to_end(key)
+            return value
+
+    def setdefault(self, key, default):
+        """
+        Retrieves a live entry or stores and returns given default if absent.
+        :param key: Entry key.
+        :param default: Value to be stored if entry doesn't exist.
+        :return: Stored value.
+        """
+
+        with self.__lock:
+            now = self.clock()
+            self.__expire(now)
+            value = self.__entries[key][1] if key in self.__entries else default
+            self.__entries[key] = (now, value)
+            self.__entries.move_to_end(key)
+            self.__evict()
+            return value
+
+    def pop(self, key, default=None):
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def __contains__(self, key) -> bool:
+        with self.__lock:
+            self.__expire(self.clock())
+            return key in self.__entries
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
+
+    def stats(self) -> dict:
+        """
+        Exposes storage occupation and eviction counters.
+        :return: dictionary.
+        """
+
+        with self.__lock:
+            return {
+                'entries': len(self.__entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'evicted': self.evicted,
+                'orphaned': self.orphaned
+            }
+
+    def __expire(self, now: float):
+        """
+        Drops entries whose last access is older than the time to live. Entries are kept in access order, so only the
+        head of the storage has to be inspected.
+        :param now: float. Current clock value.
+        :return: void.
+        """
+
+        while self.__entries:
+            key, (last_access, _) = next(iter(self.__entries.items()))
+            if now - last_access < self.ttl_seconds: break
+            del self.__entries[key]
+            self.orphaned += 1
+
+    def __evict(self):
+        """
+        Drops least recently used entries until storage respects max_entries.
+        :return: void.
+        """
+
+        while len(self.__entries) > self.max_entries:
+            self.__entries.popitem(last=False)
+            self.evicted += 1
@@ -0,0 +1,61 @@
+import io
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Read-only, seekable file-like view over an in-memory buffer (bytes, bytearray or memoryview). Unlike BytesIO, which
+    copies any buffer other than bytes, the underlying memory is shared: only the chunks actually read are copied.
+    """
+
+    def __init__(self, buffer):
+        """
+        Constructor function, wraps given buffer without copying it.
+        :param buffer: bytes-like object.
+        """
+
+        super().__init__()
+        self.view = memoryview(buffer).cast('B')    # :memoryview: Flat byte view of the buffer.
+        self.position = 0                           # :int: Current read position.
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        """
+        Copies the next bytes of the buffer into a pre-allocated one.
+        :param b: writable bytes-like object.
+        :return: integer. Amount of bytes copied, 0 at end of buffer.
+        """
+
+        target = memoryview(b).cast('B')
+        size = min(len(target), len(self.view) - self.position)
+        target[:size] = self.view[self.position:self.position + size]
+        self.position += size
+        return size
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = len(self.view) - self.position
+        chunk = self.view[self.position:self.position + max(size, 0)].tobytes()
+        self.position += len(chunk)
+        return chunk
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        elif whence == io.SEEK_END:
+            position = len(self.view) + offset
+        else:
+            raise ValueError(f'Invalid whence: {whence}')
+        if position < 0:
+            raise ValueError(f'Negative seek position: {position}')
+        self.position = position
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
@@ -0,0 +1,143 @@
+import sys
+import threading
+import time
+
+from services.log_sink import LogSink
+
+
+class _TimedLoader:
+    """
+    Loader wrapper timing a module's execution, handing the module back to its original loader once executed.
+    """
+
+    def __init__(self, name: str, loader, on_loaded):
+        self.name = name                                # :str: Name the module has been imported as.
+        self.loader = loader                            # :Loader: Original module loader.
+        self.on_loaded = on_loaded                      # :callable: Receives module name, start and end timestamps.
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        start_ns = time.perf_counter_ns()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.on_loaded(self.name, start_ns, time.perf_counter_ns())
+            module.__loader__ = self.loader
+            if getattr(module, '__spec__', None) is not None:
+                module.__spec__.loader = self.loader
+
+    def __getattr__(self, attribute):
+        return getattr(self.loader, attribute)
+
+
+class _ImportTimer:
+    """
+    Meta path finder recording how long each module takes to import (inclusive of the modules it imports itself). It
+    doesn't locate modules on its own, it wraps the loader found by the remaining finders.
+    """
+
+    def __init__(self, on_loaded):
+        self.on_loaded = on_loaded                      # :callable: Receives module name, start and end timestamps.
+        self.local = threading.local()                  # :local: Flags lookups issued by this finder.
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self.local, 'busy', False): return None
+
+        self.local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'): continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None: break
+            else:
+                return None
+        finally:
+            self.local.busy = False
+
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(fullname, spec.loader, self.on_loaded)
+        return spec
+
+
+class ColdStart:
+    """
+    Cold start budget report. Records the import time of every module loaded from the moment this module is imported
+    (which handlers do first) and the initialization duration of the handler, then emits them once, at the end of the
+    container's first invocation, together with the modules whose import was deferred into that invocation. Import
+    timing stops after the report, so warm invocations carry no overhead.
+    """
+
+    TOP_MODULES = 25                                    # :int: Amount of slowest imports listed on the report.
+
+    origin_ns = time.perf_counter_ns()                  # :int: Instant timing started (container initialization).
+    ready_ns = None                                     # :int: Instant the handler finished initializing.
+    handler_name = None                                 # :str: Initialized handler name.
+    reported = False                                    # :bool: Whether the report has been emitted.
+
+    __imports = []                                      # :list: (module name, start ns, end ns) of timed imports.
+    __timer = None                                      # :_ImportTimer: Installed meta path finder.
+    __lock = threading.Lock()                           # :Lock: Guards report emission.
+
+    @classmethod
+    def install(cls):
+        """
+        Starts timing imports.
+        :return: void.
+        """
+
+        if cls.__timer is None and not cls.reported:
+            cls.__timer = _ImportTimer(lambda *x: cls.__imports.append(x))
+            sys.meta_path.insert(0, cls.__timer)
+
+    @classmethod
+    def uninstall(cls):
+        if cls.__timer in sys.meta_path:
+            sys.meta_path.remove(cls.__timer)
+        cls.__timer = None
+
+    @classmethod
+    def mark_ready(cls, handler_name: str):
+        """
+        Flags handler initialization as finished (handler function defined).
+        :param handler_name: string. Handler name.
+        :return: void.
+        """
+
+        if cls.ready_ns is None:
+            cls.ready_ns = time.perf_counter_ns()
+            cls.handler_name = handler_name
+
+    @classmethod
+    def report(cls) -> dict:
+        """
+        Emits the cold start report if not yet emitted on this container.
+        :return: dictionary. Report, None if already emitted.
+        """
+
+        with cls.__lock:
+            if cls.reported: return None
+            cls.reported = True
+        cls.uninstall()
+
+        ready_ns = cls.ready_ns or time.perf_counter_ns()
+        init_imports, deferred_imports = {}, {}
+        for name, start_ns, end_ns in sorted(cls.__imports, key=lambda x: x[1] - x[2]):
+            target = init_imports if end_ns <= ready_ns else deferred_imports
+            if len(target) < cls.TOP_MODULES:
+                target[name] = round((end_ns - start_ns) / 1e6, 3)
+
+        report = {
+            'handler': cls.handler_name,
+            'init_ms': round((ready_ns - cls.origin_ns) / 1e6, 3),
+            'modules_imported': len(cls.__imports),
+            'imports_ms': init_imports,
+            'deferred_imports_ms': deferred_imports
+        }
+        cls.__imports = []
+        LogSink.emit('Cold start report', event='cold_start', **report)
+        return report
+
+
+ColdStart.install()
@@ -0,0 +1,101 @@
+import random
+import time
+
+
+class InjectedFault(Exception):
+    """
+    Error raised on purpose by a FaultInjector, standing for a failed cloud service call.
+    """
+
+
+class FaultInjector:
+    """
+    Simulates cloud service call conditions on local backends: a latency drawn from a configurable distribution, a
+    bandwidth cap applied to the payload size and a probability of the call failing. Latency distributions are given
+    as '<kind>:<params>' strings, in milliseconds:
+
+        'const:20'          always 20 ms
+        'uniform:10:50'     uniformly between 10 and 50 ms
+        'normal:30:5'       normal, mean 30 ms and standard deviation 5 ms (floored at 0)
+        'lognormal:3:0.5'   log-normal of underlying mean 3 and sigma 0.5 (long tailed)
+        'exp:25'            exponential, mean 25 ms
+    """
+
+    def __init__(self, latency: str = None, bandwidth_mbps: float = None, error_rate: float = 0.0,
+                 seed: int = None):
+        """
+        Constructor of the fault injector.
+        :param latency: string. Latency distribution specification, no latency if None.
+        :param bandwidth_mbps: float. Payload transfer cap in megabits per second, unlimited if None.
+        :param error_rate: float. Probability (0 to 1) of a call failing.
+        :param seed: integer. Random seed, for reproducible runs.
+        """
+
+        self.latency = latency                                  # :str: Latency distribution specification.
+        self.bandwidth_mbps = bandwidth_mbps                    # :float: Transfer cap in megabits per second.
+        self.error_rate = error_rate                            # :float: Call failure probability.
+        self.random = random.Random(seed)                       # :Random: Random number source.
+        self.sampler = self.__parse_latency(latency)            # :callable: Latency sampler, in milliseconds.
+        self.calls = 0                                          # :int: Amount of simulated calls.
+        self.faults = 0                                         # :int: Amount of injected faults.
+
+    @classmethod
+    def from_env(cls, env, service: str):
+        """
+        Builds a fault injector from LOCAL_<SERVICE>_LATENCY, LOCAL_<SERVICE>_BANDWIDTH_MBPS and
+        LOCAL_<SERVICE>_ERROR_RATE environment variables (LOCAL_SEED seeds every injector).
+        :param env: EnvironmentVariables. Environment variables accessor.
+        :param service: string. Service name (e.g. 'S3').
+        :return: FaultInjector.
+        """
+
+        bandwidth = env.get(f'LOCAL_{service}_BANDWIDTH_MBPS')
+        seed = env.get('LOCAL_SEED')
+        return cls(
+            latency=env.get(f'LOCAL_{service}_LATENCY'),
+            bandwidth_mbps=float(bandwidth) if bandwidth else None,
+            error_rate=float(env.get(f'LOCAL_{service}_ERROR_RATE') or 0),
+            seed=int(seed) if seed else None
+        )
+
+    def call(self, operation: str, payload_bytes: int = 0):
+        """
+        Simulates a service call: waits for its latency plus payload transfer time, then fails it at the configured
+        rate.
+        :param operation: string. Simulated operation name, used on the failure message.
+        :param payload_bytes: integer. Amount of bytes transferred by the call.
+        :return: void.
+        """
+
+        self.calls += 1
+        delay = self.sampler() / 1000 if self.sampler else 0
+        if self.bandwidth_mbps:
+            delay += payload_bytes * 8 / (self.bandwidth_mbps * 1e6)
+        if delay > 0:
+            time.sleep(delay)
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            self.faults += 1
+            raise InjectedFault(f"Injected fault on '{operation}'.")
+
+    def __parse_latency(self, latency: str):
+        """
+        Translates a latency specification into a sampling function.
+        :param latency: string. Latency distribution specification.
+        :return: callable returning milliseconds, or None if no latency is to be simulated.
+        """
+
+        if not latency: return None
+
+        kind, *params = latency.split(':')
+        params = [float(x) for x in params]
+        samplers = {
+            'const': lambda: params[0],
+            'uniform': lambda: self.random.uniform(params[0], params[1]),
+            'normal': lambda: max(0.0, self.random.gauss(params[0], params[1])),
+            'lognormal': lambda: self.random.lognormvariate(params[0], params[1]),
+            'exp': lambda: self.random.expovariate(1 / params[0])
+        }
+        if kind not in samplers:
+            raise ValueError(f"Unknown latency distribution '{kind}'. Available: {list(samplers)}.")
+        return samplers[kind]
@@ -0,0 +1,105 @@
+import os
+import threading
+import time
+
+
+class IdGenerator:
+    """
+    Compact, collision free and lexicographically time sortable identifiers (ULID layout): 48 bits of Unix time in
+    milliseconds followed by 80 random bits, Crockford base32 encoded into 26 characters and prefixed. Ids generated
+    within the same millisecond by a container increment the random part, so they remain strictly ordered; across
+    containers the 80 random bits make collisions negligible at any realistic upload rate. Being time prefixed, ids
+    serve as range/sort keys: every id generated on a time interval lies between lower_bound and upper_bound of that
+    interval.
+
+    Ids are prefixed with PREFIX, a letter outside of the base32 alphabet sorting after every digit, so that they sort
+    after the legacy date formatted ids ('2020-05-01-12-00-00-123456') sharing the picture_id sort key. On partitions
+    mixing both, legacy ids, all generated before the switch, come first in creation order, followed by new ids in
+    creation order: 'ScanIndexForward' and 'Limit' keep returning newest/oldest pictures as they did.
+    """
+
+    PREFIX = 'U'                                    # :str: Id prefix, sorting after legacy ids.
+    LEGACY_MAX_ID = '9999-12-31-23-59-59-999999'    # :str: Greatest legacy date formatted id.
+    ALPHABET = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'      # :str: Crockford base32 alphabet, ASCII ordered.
+    LENGTH = 26                                     # :int: Encoded id length (128 bits), prefix excluded.
+    TIME_BITS = 48                                  # :int: Timestamp bits.
+    RANDOM_BITS = 80                                # :int: Random suffix bits.
+
+    __last_ms = -1                                  # :int: Timestamp of the latest generated id.
+    __last_random = 0                               # :int: Random part of the latest generated id.
+    __lock = threading.Lock()                       # :Lock: Guards monotonic state across threads.
+
+    @classmethod
+    def generate(cls, timestamp_ms: int = None) -> str:
+        """
+        Generates a new id.
+        :param timestamp_ms: integer. Unix time in milliseconds, defaults to now.
+        :return: string. Prefixed, 27 characters id.
+        """
+
+        timestamp_ms = int(time.time() * 1000) if timestamp_ms is None else timestamp_ms
+        with cls.__lock:
+
+            # Same (or earlier, if the clock stepped back) millisecond: keep ordering by incrementing the last id.
+            if timestamp_ms <= cls.__last_ms:
+                timestamp_ms = cls.__last_ms
+                random_part = cls.__last_random + 1
+                if random_part >> cls.RANDOM_BITS:
+                    timestamp_ms, random_part = timestamp_ms + 1, 0
+            else:
+                random_part = int.from_bytes(os.urandom(cls.RANDOM_BITS // 8), 'big')
+
+            cls.__last_ms, cls.__last_random = timestamp_ms, random_part
+
+        return cls.encode((timestamp_ms << cls.RANDOM_BITS) | random_part)
+
+    @classmethod
+    def lower_bound(cls, timestamp_ms: int) -> str:
+        """
+        Smallest id that may be generated on a particular millisecond, for range queries (e.g. 'between').
+        :param timestamp_ms: integer. Unix time in milliseconds.
+        :return: string.
+        """
+
+        return cls.encode(timestamp_ms << cls.RANDOM_BITS)
+
+    @classmethod
+    def upper_bound(cls, timestamp_ms: int) -> str:
+        """
+        Largest id that may be generated on a particular millisecond, for range queries (e.g. 'between').
+        :param timestamp_ms: integer. Unix time in milliseconds.
+        :return: string.
+        """
+
+        return cls.encode((timestamp_ms << cls.RANDOM_BITS) | ((1 << cls.RANDOM_BITS) - 1))
+
+    @classmethod
+    def get_timestamp_ms(cls, id_: str) -> int:
+        """
+        Extracts the creation time of an id.
+        :param id_: string. Generated id.
+        :return: integer. Unix time in milliseconds.
+        """
+
+        return cls.decode(id_) >> cls.RANDOM_BITS
+
+    @classmethod
+    def encode(cls, value: int) -> str:
+        chars = []
+        for _ in range(cls.LENGTH):
+            chars.append(cls.ALPHABET[value & 31])
+            value >>= 5
+        return cls.PREFIX + ''.join(reversed(chars))
+
+    @classmethod
+    def decode(cls, id_: str) -> int:
+        value = 0
+        for char in id_.upper()[len(cls.PREFIX):]:
+            value = (value << 5) | cls.ALPHABET.index(char)
+        return value
+
+
+# Every new id must sort after every legacy id sharing the picture_id sort key, or new pictures would be listed as
+# older than legacy ones.
+if not IdGenerator.lower_bound(0) > IdGenerator.LEGACY_MAX_ID:
+    raise ImportError(f"Id prefix '{IdGenerator.PREFIX}' doesn't sort after legacy ids.")
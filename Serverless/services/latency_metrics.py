@@ -0,0 +1,120 @@
+import atexit
+import contextvars
+import json
+import threading
+import time
+
+from resources.environment_variables import EnvironmentVariables as env
+from services.log_sink import LogSink
+from services.models.latency_histogram import LatencyHistogram
+
+
+class LatencyMetrics:
+    """
+    Container wide phase latency registry. Keeps one LatencyHistogram per (handler, phase) across warm invocations and
+    periodically writes them to stdout as CloudWatch Embedded Metric Format (EMF) lines carrying p50/p90/p99/max, plus
+    the serialized histogram so that lines from many containers can be merged offline. Each emitted line covers the
+    window since the previous emission, histograms are reset once emitted.
+    """
+
+    NAMESPACE = env.METRICS_NAMESPACE or env.BASE_NAME or 'Serverless'      # :str: CloudWatch metrics namespace.
+    EMIT_INTERVAL_SECONDS = float(env.LATENCY_EMIT_INTERVAL_SECONDS or 60)  # :float: Minimum time between emissions.
+    PERCENTILES = (50, 90, 99)                                              # :tuple: Percentiles to be published.
+
+    __handler = contextvars.ContextVar('latency_handler', default=None)    # :ContextVar: Handler being executed.
+    __histograms = {}                                                       # :dict: (handler, phase) to histogram.
+    __window_start = time.time()                                            # :float: Current window start timestamp.
+    __last_emission = time.monotonic()                                      # :float: Latest emission instant.
+    __lock = threading.Lock()                                               # :Lock: Guards histogram updates.
+
+    @classmethod
+    def set_handler(cls, handler: str):
+        """
+        Sets the handler name measurements of the current context are attributed to.
+        :param handler: string. Handler name.
+        :return: Token. Allows restoring the previous handler name.
+        """
+
+        return cls.__handler.set(handler)
+
+    @classmethod
+    def reset_handler(cls, token):
+        cls.__handler.reset(token)
+
+    @classmethod
+    def record(cls, phase: str, duration_ns: int):
+        """
+        Counts a phase duration on the histogram of the current handler.
+        :param phase: string. Phase name.
+        :param duration_ns: integer. Phase duration in nanoseconds.
+        :return: void.
+        """
+
+        key = (cls.__handler.get() or env.get('AWS_LAMBDA_FUNCTION_NAME') or 'unknown', phase)
+        with cls.__lock:
+            histogram = cls.__histograms.get(key)
+            if histogram is None:
+                histogram = cls.__histograms[key] = LatencyHistogram()
+            histogram.record(duration_ns // 1000)
+
+    @classmethod
+    def emit_if_due(cls) -> int:
+        """
+        Emits histograms if the emission interval has elapsed since the latest emission.
+        :return: integer. Amount of emitted lines.
+        """
+
+        if time.monotonic() - cls.__last_emission < cls.EMIT_INTERVAL_SECONDS: return 0
+        return cls.emit()
+
+    @classmethod
+    def emit(cls) -> int:
+        """
+        Writes one EMF line per (handler, phase) histogram of the current window, then starts a new window.
+        :return: integer. Amount of emitted lines.
+        """
+
+        with cls.__lock:
+            histograms, window_start = cls.__histograms, cls.__window_start
+            cls.__histograms = {}
+            cls.__window_start = time.time()
+            cls.__last_emission = time.monotonic()
+
+        for (handler, phase), histogram in sorted(histograms.items()):
+            LogSink.write(json.dumps(cls.to_emf(handler, phase, histogram, window_start)))
+        return len(histograms)
+
+    @classmethod
+    def to_emf(cls, handler: str, phase: str, histogram: LatencyHistogram, window_start: float = None) -> dict:
+        """
+        Builds the Embedded Metric Format document of a histogram.
+        :param handler: string. Handler name (dimension).
+        :param phase: string. Phase name (dimension).
+        :param histogram: LatencyHistogram. Phase latency histogram.
+        :param window_start: float. Unix timestamp of the measurement window start.
+        :return: dictionary.
+        """
+
+        names = [f'p{x}' for x in cls.PERCENTILES] + ['max']
+        values = [histogram.percentile(x) for x in cls.PERCENTILES] + [histogram.max]
+        document = {
+            '_aws': {
+                'Timestamp': int(time.time() * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': cls.NAMESPACE,
+                    'Dimensions': [['Handler', 'Phase']],
+                    'Metrics': [{'Name': x, 'Unit': 'Milliseconds'} for x in names]
+                }]
+            },
+            'Handler': handler,
+            'Phase': phase,
+            'count': histogram.count,
+            'window_start': window_start,
+            'histogram': histogram.to_dict()
+        }
+        document.update({k: round(v / 1000, 3) for k, v in zip(names, values) if v is not None})
+        return document
+
+
+# Emits the pending window if the interpreter exits (runs before LogSink's own exit flush).
+atexit.register(LatencyMetrics.emit)
@@ -0,0 +1,39 @@
+import importlib
+
+
+class LazyModule:
+    """
+    Module proxy deferring a (heavy) module import until one of its attributes is first accessed, so that cloud
+    function initialization and paths that never use the module (e.g. early validation failures) don't pay for it.
+    Usage mirrors a regular import, e.g.:
+
+        boto3 = LazyModule('boto3')             # instead of 'import boto3'
+        Image = LazyModule('PIL.Image')         # instead of 'from PIL import Image'
+    """
+
+    def __init__(self, name: str):
+        self.__name = name                      # :str: Fully qualified module name.
+        self.__module = None                    # :module: Imported module, None until first accessed.
+
+    def __getattr__(self, attribute):
+        return getattr(self.load(), attribute)
+
+    def __setattr__(self, attribute, value):
+        # Own (name mangled) attributes are kept on the proxy, any other one is set on the proxied module.
+        if attribute.startswith('_LazyModule__'):
+            object.__setattr__(self, attribute, value)
+        else:
+            setattr(self.load(), attribute, value)
+
+    def __repr__(self):
+        return f"<lazy module '{self.__name}' ({'loaded' if self.__module is not None else 'not loaded'})>"
+
+    def load(self):
+        """
+        Imports the proxied module if not yet imported.
+        :return: module.
+        """
+
+        if self.__module is None:
+            self.__module = importlib.import_module(self.__name)
+        return self.__module
@@ -0,0 +1,345 @@
+import copy
+import json
+import os
+import tempfile
+import threading
+import uuid
+from collections import deque
+from io import BytesIO
+
+from resources.environment_variables import EnvironmentVariables as env
+from services.aws_dynamodb import AWSDynamoDB
+from services.aws_rekognition import AWSRekognition
+from services.aws_s3_dao import AWSS3
+from services.aws_sqs import AWSSQS
+from services.fault_injector import FaultInjector
+
+
+class LocalS3(AWSS3):
+    """
+    In-process stand-in for AWSS3. Objects are kept in memory, or as files under LOCAL_S3_ROOT if set, and every call
+    goes through the S3 fault injector (latency, bandwidth cap, error rate).
+    """
+
+    faults = FaultInjector.from_env(env, 'S3')                  # :FaultInjector: Simulated call conditions.
+    root = env.get('LOCAL_S3_ROOT')                             # :str: Storage folder, in memory if None.
+
+    __objects = {}                                              # :dict: (bucket, key) to object bytes.
+    __metadata = {}                                             # :dict: (bucket, key) to object metadata.
+    __lock = threading.Lock()                                   # :Lock: Guards in memory storage.
+
+    def save_file(self, file_bytes, file_name: str, path: str = '') -> (bool, str, str):
+        key_name = self.get_key_name(file_name, path)
+        if isinstance(file_bytes, (bytes, bytearray, memoryview)):
+            data = bytes(file_bytes)
+        else:
+            data = file_bytes.read()
+
+        try:
+            self.faults.call('put_object', len(data))
+            self.put_object(self.bucket, key_name, data)
+        except Exception as e:
+            return False, str(e), 'N.A.'
+
+        return True, f"Stored '{key_name}' on local '{self.bucket}'", self.sizeof_fmt(len(data), 'B')
+
+    def open_stream(self, key: str, start: int = None, end: int = None) -> (bool, str, object):
+        try:
+            data = self.get_object(self.bucket, key)
+            if start is not None or end is not None:
+                data = data[start or 0:None if end is None else end + 1]
+            self.faults.call('get_object', len(data))
+        except Exception as e:
+            return False, str(e), None
+
+        return True, f'HTTP status code -> {206 if start is not None or end is not None else 200}', BytesIO(data)
+
+    def load_file_with_metadata(self, key: str) -> (bool, str, bytes, dict):
+        status, response, stream = self.open_stream(key)
+        if not status: return status, response, None, {}
+        with self.__lock:
+            metadata = dict(self.__metadata.get((self.bucket, key), {}))
+        return status, response, stream.read(), metadata
+
+    def create_presigned_post(self, key: str, content_type: str, max_size: int, metadata: dict,
+                              expiration: int) -> (bool, str, dict):
+        try:
+            self.faults.call('generate_presigned_post')
+        except Exception as e:
+            return False, str(e), {}
+
+        fields = {'key': key, 'Content-Type': content_type}
+        fields.update({f'x-amz-meta-{k}': v for k, v in metadata.items()})
+        return True, f"Signed local POST of '{key}'", {'url': f'local://{self.bucket}/', 'fields': fields}
+
+    @classmethod
+    def post_object(cls, bucket: str, fields: dict, data: bytes):
+        """
+        Stores an object as a client using a presigned POST would.
+        :param bucket: string. Bucket name.
+        :param fields: dictionary. Presigned POST form fields.
+        :param data: bytes. Object content.
+        :return: void.
+        """
+
+        cls.put_object(bucket, fields['key'], data)
+        with cls.__lock:
+            cls.__metadata[(bucket, fields['key'])] = {
+                k[len('x-amz-meta-'):]: v for k, v in fields.items() if k.startswith('x-amz-meta-')}
+
+    def load_file_as_spooled(self, key: str, max_size: int = None) -> (bool, str, object):
+        status, response, stream = self.open_stream(key)
+        if not status: return status, response, None
+
+        spooled = tempfile.SpooledTemporaryFile(max_size=max_size or self.SPOOL_MAX_SIZE)
+        size = spooled.write(stream.read())
+        spooled.seek(0)
+        return True, f'Downloaded {size} bytes', spooled
+
+    def delete_chunk(self, keys: list) -> (bool, object):
+        try:
+            self.faults.call('delete_objects')
+        except Exception as e:
+            return False, str(e)
+
+        for key in keys:
+            self.delete_object(self.bucket, key)
+        return True, len(keys)
+
+    @classmethod
+    def put_object(cls, bucket: str, key: str, data: bytes):
+        if cls.root:
+            file_path = os.path.join(cls.root, bucket, key)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, 'wb') as f:
+                f.write(data)
+        else:
+            with cls.__lock:
+                cls.__objects[(bucket, key)] = data
+
+    @classmethod
+    def get_object(cls, bucket: str, key: str) -> bytes:
+        """
+        Reads a stored object.
+        :param bucket: string. Bucket name.
+        :param key: string. Object key.
+        :return: bytes. Raises LookupError, as S3's NoSuchKey, if the object doesn't exist.
+        """
+
+        if cls.root:
+            try:
+                with open(os.path.join(cls.root, bucket, key), 'rb') as f:
+                    return f.read()
+            except FileNotFoundError:
+                raise LookupError(f"NoSuchKey: '{key}' not found on local '{bucket}'.")
+
+        with cls.__lock:
+            data = cls.__objects.get((bucket, key))
+        if data is None:
+            raise LookupError(f"NoSuchKey: '{key}' not found on local '{bucket}'.")
+        return data
+
+    @classmethod
+    def delete_object(cls, bucket: str, key: str):
+        if cls.root:
+            try:
+                os.remove(os.path.join(cls.root, bucket, key))
+            except FileNotFoundError:
+                pass
+        else:
+            with cls.__lock:
+                cls.__objects.pop((bucket, key), None)
+        with cls.__lock:
+            cls.__metadata.pop((bucket, key), None)
+
+
+class LocalDynamoDB(AWSDynamoDB):
+    """
+    In-process stand-in for AWSDynamoDB. Tables are kept in memory, keyed as declared on serverless_resources.yml, and
+    every call goes through the DynamoDB fault injector.
+    """
+
+    faults = FaultInjector.from_env(env, 'DYNAMODB')            # :FaultInjector: Simulated call conditions.
+    KEY_SCHEMAS = {                                             # :dict: Table name to (hash key, range key).
+        env.PICTURES_TABLE_NAME: ('user_id', 'picture_id'),
+        env.CELEBRITIES_TABLE_NAME: ('user_id', 'celebrity_id'),
+        env.PICTURE_HASHES_TABLE_NAME: ('user_id', 'content_hash')
+    }
+    DEFAULT_KEY_SCHEMA = ('user_id', 'id')                      # :tuple: Key schema of undeclared tables.
+
+    __tables = {}                                               # :dict: Table name to {(hash, range): item}.
+    __lock = threading.Lock()                                   # :Lock: Guards tables.
+
+    def evaluate_conditions_and_requirements(self):
+        self.faults.call('describe_table')
+        self.key_hash, self.key_range = self.KEY_SCHEMAS.get(self.table_name, self.DEFAULT_KEY_SCHEMA)
+        self.table_status = 'ACTIVE'
+        return str({
+            'http_status_code': 200,
+            'table_status': self.table_status,
+            'key_hash': self.key_hash,
+            'key_range': self.key_range
+        })
+
+    def save(self, data):
+        type(self).convert_structure_to_dynamo_compatible(data)
+        key_hash, key_range = self.KEY_SCHEMAS.get(self.table_name, self.DEFAULT_KEY_SCHEMA)
+
+        try:
+            self.faults.call('put_item', len(json.dumps(data, default=str)))
+            key = (data[key_hash], data.get(key_range))
+        except Exception as e:
+            raise Exception(str(e))
+
+        with self.__lock:
+            self.__tables.setdefault(self.table_name, {})[key] = copy.deepcopy(data)
+
+    def load(self, hash_key, range_key_equals=None, range_key_begins=None):
+        key_hash, key_range = self.KEY_SCHEMAS.get(self.table_name, self.DEFAULT_KEY_SCHEMA)
+        with self.__lock:
+            items = [copy.deepcopy(x) for (h, r), x in self.__tables.get(self.table_name, {}).items()
+                     if h == hash_key
+                     and (range_key_equals is None or r == range_key_equals)
+                     and (range_key_begins is None or str(r).startswith(range_key_begins))]
+        items.sort(key=lambda x: str(x.get(key_range)))
+
+        try:
+            self.faults.call('query', len(json.dumps(items, default=str)))
+        except Exception as e:
+            raise Exception(str(e))
+
+        return {'Items': items, 'Count': len(items), 'ScannedCount': len(items),
+                'ResponseMetadata': {'HTTPStatusCode': 200}}
+
+    def query_all(self, hash_key, attributes: list = None):
+        key_hash, key_range = self.KEY_SCHEMAS.get(self.table_name, self.DEFAULT_KEY_SCHEMA)
+        for item in self.load(hash_key)['Items']:
+            if attributes is not None:
+                item = {k: v for k, v in item.items() if k in [key_hash, key_range] + list(attributes)}
+            yield item
+
+    def delete_items(self, items: list) -> int:
+        key_hash, key_range = self.KEY_SCHEMAS.get(self.table_name, self.DEFAULT_KEY_SCHEMA)
+        keys = list(dict.fromkeys((x[key_hash], x.get(key_range)) for x in items))
+
+        for i in range(0, len(keys), self.BATCH_WRITE_MAX_ITEMS):
+            chunk = keys[i:i + self.BATCH_WRITE_MAX_ITEMS]
+            try:
+                self.faults.call('batch_write_item', len(json.dumps(chunk, default=str)))
+            except Exception as e:
+                raise Exception(str(e))
+
+            with self.__lock:
+                table = self.__tables.get(self.table_name, {})
+                for key in chunk:
+                    table.pop(key, None)
+        return len(keys)
+
+
+class LocalSQS(AWSSQS):
+    """
+    In-process stand-in for AWSSQS. Messages are kept on in memory queues, from which SQS events can be built to feed
+    queue triggered handlers, and every call goes through the SQS fault injector.
+    """
+
+    faults = FaultInjector.from_env(env, 'SQS')                 # :FaultInjector: Simulated call conditions.
+
+    __queues = {}                                               # :dict: Queue name to deque of messages.
+    __in_flight = {}                                            # :dict: Receipt handle to queue name.
+    __lock = threading.Lock()                                   # :Lock: Guards queues.
+
+    def __init__(self, queue_base_url: str, queue_name: str):
+        self.queue_name = queue_name
+        self.queue_url = f'{queue_base_url or "local://"}local/{queue_name}'
+        self.client = None
+
+    def save(self, data):
+        body = self.encode(data)
+        try:
+            self.faults.call('send_message', len(body))
+        except Exception as e:
+            raise Exception(str(e))
+
+        with self.__lock:
+            self.__queues.setdefault(self.queue_name, deque()).append({'messageId': str(uuid.uuid4()), 'body': body})
+
+    def send_message_batch(self, entries: list) -> dict:
+        try:
+            self.faults.call('send_message_batch', sum(len(x['MessageBody']) for x in entries))
+        except Exception as e:
+            raise Exception(str(e))
+
+        with self.__lock:
+            queue = self.__queues.setdefault(self.queue_name, deque())
+            for entry in entries:
+                queue.append({'messageId': str(uuid.uuid4()), 'body': entry['MessageBody']})
+        return {'Successful': [{'Id': x['Id']} for x in entries], 'Failed': []}
+
+    def delete(self, receipt_handle: str):
+        try:
+            self.faults.call('delete_message')
+        except Exception as e:
+            raise Exception(str(e))
+
+        with self.__lock:
+            if self.__in_flight.pop(receipt_handle, None) is None:
+                raise Exception(f"ReceiptHandleIsInvalid: '{receipt_handle}'.")
+
+    def receive(self, max_messages: int = 1) -> list:
+        """
+        Takes messages off the queue, in SQS event record form.
+        :param max_messages: integer. Maximum amount of messages to be taken.
+        :return: list. Records, each with messageId, receiptHandle and body.
+        """
+
+        records = []
+        with self.__lock:
+            queue = self.__queues.get(self.queue_name, deque())
+            while queue and len(records) < max_messages:
+                record = dict(queue.popleft(), receiptHandle=str(uuid.uuid4()), eventSource='aws:sqs')
+                self.__in_flight[record['receiptHandle']] = self.queue_name
+                records.append(record)
+        return records
+
+    def receive_event(self, max_messages: int = 1) -> dict:
+        """
+        Takes messages off the queue, as the event a queue triggered cloud function would receive.
+        :param max_messages: integer. Maximum amount of messages to be taken.
+        :return: dictionary. SQS event, None if queue is empty.
+        """
+
+        records = self.receive(max_messages)
+        return {'Records': records} if records else None
+
+
+class LocalRekognition(AWSRekognition):
+    """
+    In-process stand-in for AWSRekognition. Recognizes the celebrities listed on LOCAL_REKOGNITION_CELEBRITIES (comma
+    separated) on any image stored on LocalS3, going through the Rekognition fault injector.
+    """
+
+    faults = FaultInjector.from_env(env, 'REKOGNITION')         # :FaultInjector: Simulated call conditions.
+    CELEBRITIES = [x.strip() for x in (env.get('LOCAL_REKOGNITION_CELEBRITIES') or 'Local Celebrity').split(',')
+                   if x.strip()]                                # :list: Names recognized on every image.
+
+    def recognize_celebrity(self, bucket: str, name: str) -> bool:
+        try:
+            image = LocalS3.get_object(bucket, name)
+            self.faults.call('recognize_celebrities', len(image))
+        except Exception as e:
+            self.error = e
+            return False
+
+        self.response = {
+            'CelebrityFaces': [{
+                'Name': celebrity,
+                'Id': uuid.uuid5(uuid.NAMESPACE_OID, celebrity).hex[:8],
+                'Face': {'BoundingBox': {'Width': 0.25, 'Height': 0.25, 'Left': 0.1 * i, 'Top': 0.1}},
+                'Urls': [],
+                'MatchConfidence': 99.0
+            } for i, celebrity in enumerate(self.CELEBRITIES)],
+            'UnrecognizedFaces': [],
+            'OrientationCorrection': 'ROTATE_0',
+            'ResponseMetadata': {'HTTPStatusCode': 200}
+        }
+        return True
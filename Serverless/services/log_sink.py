@@ -0,0 +1,192 @@
+import atexit
+import json
+import sys
+import threading
+import time
+
+from resources.environment_variables import EnvironmentVariables as env
+
+
+class _BudgetExceeded(Exception):
+    """
+    Raised internally when a value being stringified exceeds its size budget.
+    """
+
+
+class JsonLogRenderer:
+    """
+    Renders log records as single line JSON documents, to be indexed as structured fields by the cloud logging system.
+    """
+
+    @staticmethod
+    def render(record: dict) -> str:
+        return json.dumps(record, default=str)
+
+
+class TextLogRenderer:
+    """
+    Renders log records in the original prefix based text format ('PREFIX - message').
+    """
+
+    BANNER = '.\n+------------------------------------------+\n|{:^42}|\n+------------------------------------------+'
+
+    @classmethod
+    def render(cls, record: dict) -> str:
+        if record.get('event') == 'handler_start':
+            return cls.BANNER.format(record.get('msg', ''))
+        if record.get('prefix'):
+            return f"{record['prefix']} - {record.get('msg')}"
+        return str(record.get('msg'))
+
+
+class LogSink:
+    """
+    Buffered structured logging sink. Log records are kept in memory and written to stdout at once when the buffer
+    size cap is reached or when the cloud function invocation finishes, instead of issuing one write per line.
+    """
+
+    DEBUG = 'DEBUG'
+    INFO = 'INFO'
+    WARNING = 'WARNING'
+    ERROR = 'ERROR'
+    LEVELS = {DEBUG: 10, INFO: 20, WARNING: 30, ERROR: 40}          # :dict: Level names and severities.
+    RENDERERS = {'json': JsonLogRenderer, 'text': TextLogRenderer}  # :dict: Available output formats.
+
+    level = LEVELS.get((env.LOG_LEVEL or INFO).upper(), 20)         # :int: Minimum severity to be emitted.
+    renderer = RENDERERS.get((env.LOG_FORMAT or 'json').lower(), JsonLogRenderer)  # :*: Record renderer.
+    max_buffer_bytes = int(env.LOG_BUFFER_MAX_BYTES or 65536)       # :int: Buffer size that triggers a flush.
+    max_payload_bytes = int(env.LOG_PAYLOAD_MAX_BYTES or 1024)      # :int: Size budget of each formatted argument.
+    stream = None                                                   # :TextIO: Output stream, stdout if None.
+
+    __buffer = []                                                   # :list: Rendered, not yet written lines.
+    __buffered_bytes = 0                                            # :int: Size of buffered lines.
+    __lock = threading.RLock()                                      # :RLock: Guards buffer across threads.
+
+    @classmethod
+    def is_enabled_for(cls, level: str) -> bool:
+        return cls.LEVELS.get(level, 20) >= cls.level
+
+    @classmethod
+    def emit(cls, msg, level: str = INFO, invocation_id: str = None, phase: str = None, prefix: str = None,
+             elapsed_ms: float = None, args: tuple = (), **fields) -> int:
+        """
+        Renders a log record and appends it to the buffer, flushing it if the size cap has been reached. Message
+        arguments are only stringified, truncated to max_payload_bytes and formatted into the message if the record
+        passes the level filter.
+        :param msg: Message to be logged, or message template if args are provided.
+        :param level: string. Record severity.
+        :param invocation_id: string. Cloud function invocation Id.
+        :param phase: string. Phase that produced the record.
+        :param prefix: string. Phase logging prefix.
+        :param elapsed_ms: float. Time elapsed since the invocation started, in milliseconds.
+        :param args: tuple. Arguments to be formatted into the message template.
+        :param fields: Additional structured fields.
+        :return: integer. Amount of bytes buffered, 0 if record was filtered out by level.
+        """
+
+        if not cls.is_enabled_for(level): return 0
+        if args:
+            msg = msg.format(*[x if isinstance(x, (int, float)) else cls.truncate(x, cls.max_payload_bytes)
+                               for x in args])
+
+        record = {'ts': round(time.time(), 3), 'level': level, 'msg': msg}
+        if invocation_id is not None: record['invocation_id'] = invocation_id
+        if phase is not None: record['phase'] = phase
+        if prefix is not None: record['prefix'] = prefix
+        if elapsed_ms is not None: record['elapsed_ms'] = elapsed_ms
+        record.update(fields)
+
+        return cls.write(cls.renderer.render(record))
+
+    @classmethod
+    def write(cls, line: str) -> int:
+        """
+        Appends an already rendered line to the buffer as is, regardless of the configured renderer (e.g. documents
+        whose format is mandated by the cloud logging system), flushing it if the size cap has been reached.
+        :param line: string. Line to be written.
+        :return: integer. Amount of bytes buffered.
+        """
+
+        size = len(line) + 1
+        with cls.__lock:
+            cls.__buffer.append(line)
+            cls.__buffered_bytes += size
+            if cls.__buffered_bytes >= cls.max_buffer_bytes:
+                cls.flush()
+        return size
+
+    @classmethod
+    def truncate(cls, value, budget: int) -> str:
+        """
+        Stringifies a value up to a size budget. Containers are walked incrementally so that only the part of a large
+        payload fitting the budget is ever converted to string.
+        :param value: Value to be stringified.
+        :param budget: integer. Maximum amount of characters produced.
+        :return: string. Value string form, suffixed with an ellipsis marker if truncated.
+        """
+
+        chunks = []
+        try:
+            cls.__write(value, chunks, [budget])
+        except _BudgetExceeded:
+            return ''.join(chunks) + f'...<truncated @{budget}B>'
+        return ''.join(chunks)
+
+    @classmethod
+    def __write(cls, value, chunks: list, remaining: list, nested: bool = False):
+        """
+        Appends the string form of a value to given chunks, raising _BudgetExceeded as soon as the budget is spent.
+        :param value: Value to be stringified.
+        :param chunks: list. Produced string pieces.
+        :param remaining: list. Single item list holding the remaining budget.
+        :param nested: boolean. Whether value is a container item, in which case strings are quoted as in str().
+        :return: void.
+        """
+
+        if isinstance(value, dict):
+            cls.__put('{', chunks, remaining)
+            for i, (k, v) in enumerate(value.items()):
+                if i: cls.__put(', ', chunks, remaining)
+                cls.__put(repr(k) + ': ', chunks, remaining)
+                cls.__write(v, chunks, remaining, True)
+            cls.__put('}', chunks, remaining)
+        elif isinstance(value, (list, tuple)):
+            cls.__put('[' if isinstance(value, list) else '(', chunks, remaining)
+            for i, v in enumerate(value):
+                if i: cls.__put(', ', chunks, remaining)
+                cls.__write(v, chunks, remaining, True)
+            cls.__put(']' if isinstance(value, list) else ')', chunks, remaining)
+        elif isinstance(value, (bytes, bytearray)):
+            cls.__put(repr(value[:remaining[0]]), chunks, remaining)
+        elif isinstance(value, str):
+            cls.__put(repr(value) if nested else value, chunks, remaining)
+        else:
+            cls.__put(str(value), chunks, remaining)
+
+    @staticmethod
+    def __put(text: str, chunks: list, remaining: list):
+        if len(text) > remaining[0]:
+            chunks.append(text[:remaining[0]])
+            raise _BudgetExceeded()
+        chunks.append(text)
+        remaining[0] -= len(text)
+
+    @classmethod
+    def flush(cls):
+        """
+        Writes all buffered lines to the output stream in a single call.
+        :return: void.
+        """
+
+        with cls.__lock:
+            if not cls.__buffer: return
+            payload = '\n'.join(cls.__buffer) + '\n'
+            cls.__buffer = []
+            cls.__buffered_bytes = 0
+            stream = cls.stream or sys.stdout
+            stream.write(payload)
+            stream.flush()
+
+
+# Ensures buffered records are not lost if the interpreter exits mid invocation.
+atexit.register(LogSink.flush)
@@ -0,0 +1,116 @@
+class LatencyHistogram:
+    """
+    Mergeable log-linear latency histogram. Values (microseconds) are counted exactly up to 2^PRECISION_BITS and, above
+    that, on 2^PRECISION_BITS linear buckets per power of two, bounding the relative error of any reported percentile
+    to about 1 / 2^PRECISION_BITS. Histograms sharing the same precision merge by adding up bucket counts.
+    """
+
+    PRECISION_BITS = 4                                      # :int: Linear sub-buckets per power of two, in bits.
+
+    def __init__(self):
+        self.buckets = {}                                   # :dict: Bucket index to value count.
+        self.count = 0                                      # :int: Amount of recorded values.
+        self.sum = 0                                        # :int: Sum of recorded values.
+        self.min = None                                     # :int: Smallest recorded value.
+        self.max = None                                     # :int: Largest recorded value.
+
+    def record(self, value: int):
+        """
+        Counts a new value.
+        :param value: integer. Latency in microseconds.
+        :return: void.
+        """
+
+        value = max(int(value), 0)
+        index = self.bucket_index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        """
+        Adds another histogram's counts to this one.
+        :param other: LatencyHistogram. Histogram to be merged.
+        :return: LatencyHistogram. Self.
+        """
+
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.sum += other.sum
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def percentile(self, p: float):
+        """
+        Estimates a percentile as the midpoint of the bucket holding it, bounded by the recorded extremes.
+        :param p: float. Percentile, from 0 to 100.
+        :return: float or None if histogram is empty. Latency in microseconds.
+        """
+
+        if not self.count: return None
+
+        rank = max(1, -(-self.count * p // 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                lower, upper = self.bucket_bounds(index)
+                return min(max((lower + upper - 1) / 2, self.min), self.max)
+        return self.max
+
+    @classmethod
+    def bucket_index(cls, value: int) -> int:
+        sub_buckets = 1 << cls.PRECISION_BITS
+        if value < sub_buckets:
+            return value
+        shift = value.bit_length() - cls.PRECISION_BITS - 1
+        return (shift + 1) * sub_buckets + (value >> shift) - sub_buckets
+
+    @classmethod
+    def bucket_bounds(cls, index: int) -> tuple:
+        """
+        Value range covered by a bucket.
+        :param index: integer. Bucket index.
+        :return: tuple. Inclusive lower bound and exclusive upper bound, in microseconds.
+        """
+
+        sub_buckets = 1 << cls.PRECISION_BITS
+        if index < sub_buckets:
+            return index, index + 1
+        shift = index // sub_buckets - 1
+        lower = (sub_buckets + index % sub_buckets) << shift
+        return lower, lower + (1 << shift)
+
+    def to_dict(self) -> dict:
+        return {
+            'precision_bits': self.PRECISION_BITS,
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min,
+            'max': self.max,
+            'buckets': {str(k): v for k, v in sorted(self.buckets.items())}
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Rebuilds a histogram from its dictionary form.
+        :param data: dictionary. As produced by to_dict.
+        :return: LatencyHistogram.
+        """
+
+        if data.get('precision_bits', cls.PRECISION_BITS) != cls.PRECISION_BITS:
+            raise ValueError(f"Unsupported histogram precision: {data.get('precision_bits')} bits.")
+
+        histogram = cls()
+        histogram.buckets = {int(k): int(v) for k, v in data.get('buckets', {}).items()}
+        histogram.count = int(data.get('count', 0))
+        histogram.sum = int(data.get('sum', 0))
+        histogram.min = data.get('min')
+        histogram.max = data.get('max')
+        return histogram
@@ -0,0 +1,104 @@
+import threading
+import time
+
+
+class Span:
+    """
+    Single timed unit of work of a cloud function invocation. Carries a link to its parent span (if any), its children
+    and free form attributes such as bytes in/out or item counts.
+    """
+
+    def __init__(self, span_id: int, name: str, invocation_id: str, parent=None, attributes: dict = None,
+                 phase: bool = False, reported: bool = False):
+        self.span_id = span_id                              # :int: Unique span identifier.
+        self.name = name                                    # :str: Measured procedure name.
+        self.invocation_id = invocation_id                  # :str: Cloud function invocation Id, None while unbound.
+        self.phase = phase                                  # :bool: Whether span measures a cloud function phase.
+        self.reported = reported                            # :bool: Whether nested span is reported on metrics.
+        self.parent = parent                                # :Span: Enclosing span, None for root spans.
+        self.children = []                                  # :list: Spans opened while this one was active.
+        self.attributes = dict(attributes or {})            # :dict: Free form span attributes.
+        self.start_ns = time.perf_counter_ns()              # :int: Monotonic start timestamp in nanoseconds.
+        self.end_ns = None                                  # :int: Monotonic end timestamp, None while ongoing.
+        self.thread_id = threading.get_ident()              # :int: Thread the span was opened on.
+        self.start_cpu_ns = time.thread_time_ns()           # :int: Opening thread's CPU time in nanoseconds.
+        self.end_cpu_ns = None                              # :int: Opening thread's CPU time at span end.
+
+        if parent is not None:
+            parent.children.append(self)
+
+    @property
+    def parent_id(self):
+        return self.parent.span_id if self.parent is not None else None
+
+    @property
+    def phase_level(self) -> bool:
+        """
+        Whether span measures a phase not nested in another phase, the level invocation metrics are derived from.
+        :return: boolean.
+        """
+
+        parent = self.parent
+        while parent is not None:
+            if parent.phase: return False
+            parent = parent.parent
+        return self.phase
+
+    @property
+    def ended(self) -> bool:
+        return self.end_ns is not None
+
+    @property
+    def duration_ns(self) -> int:
+        """
+        Span duration in nanoseconds. Ongoing spans are measured up to the current instant.
+        :return: integer.
+        """
+
+        end_ns = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return end_ns - self.start_ns
+
+    @property
+    def cpu_ns(self):
+        """
+        CPU time spent by the opening thread during the span, in nanoseconds. Ongoing spans are measured up to the
+        current instant if queried from the opening thread.
+        :return: integer, None if span was closed on another thread.
+        """
+
+        if self.end_cpu_ns is not None:
+            return self.end_cpu_ns - self.start_cpu_ns
+        if self.end_ns is None and threading.get_ident() == self.thread_id:
+            return time.thread_time_ns() - self.start_cpu_ns
+        return None
+
+    def end(self):
+        if self.end_ns is None:
+            self.end_ns = time.perf_counter_ns()
+            if threading.get_ident() == self.thread_id:
+                self.end_cpu_ns = time.thread_time_ns()
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def add_to_attribute(self, key: str, amount=1):
+        """
+        Accumulates a numeric attribute, useful for counters such as bytes transferred or items processed.
+        :param key: string. Attribute name.
+        :param amount: number. Value to be added.
+        :return: void.
+        """
+
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def to_dict(self) -> dict:
+        return {
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'duration_ns': self.duration_ns,
+            'cpu_ns': self.cpu_ns,
+            'ended': self.ended,
+            'attributes': self.attributes,
+            'children': [x.to_dict() for x in self.children]
+        }
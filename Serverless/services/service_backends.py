@@ -0,0 +1,45 @@
+from resources.environment_variables import EnvironmentVariables as env
+from services.aws_dynamodb import AWSDynamoDB
+from services.aws_rekognition import AWSRekognition
+from services.aws_s3_dao import AWSS3
+from services.aws_sqs import AWSSQS
+
+
+class ServiceBackends:
+    """
+    Service backend factory. Phases and handlers obtain their storage, database, queue and recognition services here,
+    so that the whole pipeline can be switched from the AWS services ('aws', default) to their in-process stand-ins
+    ('local') through the SERVICE_BACKEND environment variable, e.g. for load testing and profiling without the cloud.
+    """
+
+    AWS = 'aws'
+    LOCAL = 'local'
+    backend = (env.SERVICE_BACKEND or AWS).lower()              # :str: Selected backend.
+
+    @classmethod
+    def s3(cls, bucket: str) -> AWSS3:
+        return cls.__local().LocalS3(bucket) if cls.backend == cls.LOCAL else AWSS3(bucket)
+
+    @classmethod
+    def dynamodb(cls, table_name: str) -> AWSDynamoDB:
+        return cls.__local().LocalDynamoDB(table_name) if cls.backend == cls.LOCAL else AWSDynamoDB(table_name)
+
+    @classmethod
+    def sqs(cls, queue_base_url: str, queue_name: str) -> AWSSQS:
+        if cls.backend == cls.LOCAL:
+            return cls.__local().LocalSQS(queue_base_url, queue_name)
+        return AWSSQS(queue_base_url, queue_name)
+
+    @classmethod
+    def rekognition(cls) -> AWSRekognition:
+        return cls.__local().LocalRekognition() if cls.backend == cls.LOCAL else AWSRekognition()
+
+    @staticmethod
+    def __local():
+        """
+        Imports local backends on demand, so that cloud deployments never load them.
+        :return: module.
+        """
+
+        from services import local_backends
+        return local_backends
@@ -0,0 +1,187 @@
+import contextvars
+import itertools
+import threading
+from contextlib import contextmanager
+
+from resources.environment_variables import EnvironmentVariables as env
+from services.bounded_store import BoundedStore
+from services.models.span import Span
+
+
+class Tracer:
+    """
+    Tracing API. Records nested, nanosecond resolution spans for each cloud function invocation. Spans opened while
+    another span of the same invocation is active are linked to it as children, so nested work is attributed to the
+    procedure that originated it. Handler invocations and batch records are spanned before their invocation Id is
+    known (it is acquired by their validation phase): such spans are opened unbound, as roots, and are bound to the
+    invocation of the first span opened under them.
+    """
+
+    __traces = BoundedStore(                                        # :BoundedStore: Spans of each invocation Id.
+        max_entries=int(env.METRICS_STORE_MAX_ENTRIES or 256),
+        ttl_seconds=float(env.METRICS_STORE_TTL_SECONDS or 900)
+    )
+    __active = contextvars.ContextVar('active_span', default=None)  # :ContextVar: Innermost open span of context.
+    __span_ids = itertools.count(1)                                 # :count: Span Id sequence.
+    __lock = threading.Lock()                                       # :Lock: Guards concurrent trace updates.
+
+    @classmethod
+    def start_span(cls, invocation_id: str, name: str, parent: Span = None, phase: bool = False, reported: bool = False,
+                   **attributes) -> Span:
+        """
+        Opens a new span on a particular cloud function invocation and makes it the active one.
+        :param invocation_id: string. Cloud function invocation Id. None opens an unbound root span.
+        :param name: string. Name of the procedure to be measured.
+        :param parent: Span. Explicit parent span. Defaults to the active span of the same invocation, or to the active
+        unbound span, which is bound to this invocation then.
+        :param phase: boolean. Whether span measures a cloud function phase.
+        :param reported: boolean. Whether span is reported on invocation metrics despite being nested in a phase.
+        :param attributes: Initial span attributes.
+        :return: Span. Newly opened span.
+        """
+
+        # Unbound spans are only stored once bound.
+        if invocation_id is None:
+            span = Span(next(cls.__span_ids), name, None, None, attributes, phase, reported)
+            cls.__active.set(span)
+            return span
+
+        # Defaults parent to the active span, as long as it belongs to the same invocation or is yet unbound.
+        if parent is None:
+            parent = cls.current_span(invocation_id) or cls.__bind_current_span(invocation_id)
+
+        with cls.__lock:
+            span = Span(next(cls.__span_ids), name, invocation_id, parent, attributes, phase, reported)
+            cls.__traces.setdefault(invocation_id, []).append(span)
+
+        cls.__active.set(span)
+        return span
+
+    @classmethod
+    def __bind_current_span(cls, invocation_id: str):
+        """
+        Binds the active span, if unbound, to a particular invocation. Bound spans head the invocation trace, as they
+        were opened before any other span of it.
+        :param invocation_id: string. Cloud function invocation Id.
+        :return: Span or None. Active span, if bound to given invocation.
+        """
+
+        span = cls.current_span()
+        if span is None: return None
+        with cls.__lock:
+            if span.invocation_id is None:
+                span.invocation_id = invocation_id
+                cls.__traces.setdefault(invocation_id, []).insert(0, span)
+        return span if span.invocation_id == invocation_id else None
+
+    @classmethod
+    def end_span(cls, span: Span) -> Span:
+        """
+        Closes given span and hands the active role back to its closest ongoing ancestor.
+        :param span: Span. Span to be closed.
+        :return: Span. Closed span.
+        """
+
+        span.end()
+        if cls.__active.get() is span:
+            parent = span.parent
+            while parent is not None and parent.ended:
+                parent = parent.parent
+            cls.__active.set(parent)
+        return span
+
+    @classmethod
+    @contextmanager
+    def span(cls, invocation_id: str, name: str, **attributes):
+        """
+        Context manager version of start_span/end_span.
+        :param invocation_id: string. Cloud function invocation Id.
+        :param name: string. Name of the procedure to be measured.
+        :param attributes: Initial span attributes.
+        :return: iterator yielding the opened Span.
+        """
+
+        span = cls.start_span(invocation_id, name, **attributes)
+        try:
+            yield span
+        finally:
+            cls.end_span(span)
+
+    @classmethod
+    def current_span(cls, invocation_id: str = None):
+        """
+        Exposes the active, ongoing span of the current context.
+        :param invocation_id: string. If provided, only a span belonging to this invocation is returned.
+        :return: Span or None.
+        """
+
+        span = cls.__active.get()
+        if span is None or span.ended:
+            return None
+        if invocation_id is not None and span.invocation_id != invocation_id:
+            return None
+        return span
+
+    @classmethod
+    def find_span(cls, invocation_id: str, name: str, ongoing_only: bool = False):
+        """
+        Locates the most recently opened span with given name on a particular invocation.
+        :param invocation_id: string. Cloud function invocation Id.
+        :param name: string. Span name.
+        :param ongoing_only: boolean. Ignore spans that have already been closed.
+        :return: Span or None.
+        """
+
+        with cls.__lock:
+            spans = list(cls.__traces.get(invocation_id, []))
+        for span in reversed(spans):
+            if span.name == name and not (ongoing_only and span.ended):
+                return span
+        return None
+
+    @classmethod
+    def get_spans(cls, invocation_id: str) -> list:
+        with cls.__lock:
+            return list(cls.__traces.get(invocation_id, []))
+
+    @classmethod
+    def get_start_ns(cls, invocation_id: str):
+        """
+        Exposes the start timestamp of the first span recorded for a particular invocation.
+        :param invocation_id: string. Cloud function invocation Id.
+        :return: integer or None. Monotonic timestamp in nanoseconds.
+        """
+
+        with cls.__lock:
+            spans = cls.__traces.get(invocation_id)
+            return spans[0].start_ns if spans else None
+
+    @classmethod
+    def get_trace(cls, invocation_id: str) -> list:
+        """
+        Builds the span tree of a particular invocation.
+        :param invocation_id: string. Cloud function invocation Id.
+        :return: list. Root spans in dictionary form, each containing its children.
+        """
+
+        return [x.to_dict() for x in cls.get_spans(invocation_id) if x.parent is None]
+
+    @classmethod
+    def get_store_stats(cls) -> dict:
+        """
+        Exposes trace storage occupation and the amount of traces evicted (LRU) or orphaned (expired) so far.
+        :return: dictionary.
+        """
+
+        return cls.__traces.stats()
+
+    @classmethod
+    def discard(cls, invocation_id: str) -> list:
+        """
+        Removes all spans of a particular invocation from storage.
+        :param invocation_id: string. Cloud function invocation Id.
+        :return: list. Removed spans.
+        """
+
+        with cls.__lock:
+            return cls.__traces.pop(invocation_id, [])